@@ -0,0 +1,73 @@
+#!/usr/bin/env python
+#
+# array_setitem.py - Measure the cost of element assignments on an Array
+#                    property, of assigning a new array, and of
+#                    re-validating the array.
+#
+# Author: Paul McCarthy <pauldmccarthy@gmail.com>
+#
+"""Measures the time taken to assign a single element via an
+:class:`.ArrayProxy`, to assign an entire array, and to re-validate the
+array (which happens whenever a property attribute is changed), for
+:class:`.Array` properties of increasing size, with ``copy=True`` (the
+default) and ``copy=False``. Run as::
+
+    python benchmarks/array_setitem.py
+"""
+
+
+from __future__ import print_function
+
+import timeit
+
+import numpy as np
+
+import fsleyes_props as props
+
+
+def run(size, copy, n=20):
+    """Returns the time, in microseconds, taken to assign an element, to
+    assign an entire ``size**3`` array, and to re-validate the array.
+    """
+
+    class Thing(props.HasProperties):
+        data = props.Array(dtype=np.float32,
+                           shape=(size, size, size),
+                           copy=copy)
+
+    thing = Thing()
+    data  = np.zeros((size, size, size), dtype=np.float32)
+    state = [0]
+
+    thing.addListener('data', 'listener', lambda *a: None)
+
+    def setitem():
+        state[0] += 1
+        thing.data[0, 0, 0] = state[0]
+
+    def assign():
+        data[0, 0, 0] = -state[0]
+        state[0]     += 1
+        thing.data    = data
+
+    def revalidate():
+        thing.data.revalidate()
+
+    setitem    = 1e6 * min(timeit.repeat(setitem,    number=n, repeat=3)) / n
+    assign     = 1e6 * min(timeit.repeat(assign,     number=n, repeat=3)) / n
+    revalidate = 1e6 * min(timeit.repeat(revalidate, number=n, repeat=3)) / n
+
+    return setitem, assign, revalidate
+
+
+def main():
+    for size in (32, 64, 128, 256):
+        for copy in (True, False):
+            setitem, assign, revalidate = run(size, copy)
+            print('{:3d}^3 (copy={!s:5}): {:10.1f}us per element, '
+                  '{:10.1f}us per array, {:10.1f}us per revalidation'.format(
+                      size, copy, setitem, assign, revalidate))
+
+
+if __name__ == '__main__':
+    main()
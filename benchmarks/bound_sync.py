@@ -0,0 +1,67 @@
+#!/usr/bin/env python
+#
+# bound_sync.py - Measure the cost of changing bound property values.
+#
+# Author: Paul McCarthy <pauldmccarthy@gmail.com>
+#
+"""Measures the time taken to change a property value which is bound to
+many other property values, in a star network (one parent bound to many
+children, as created by :class:`.SyncableHasProperties`), and in a long
+chain. Run as::
+
+    python benchmarks/bound_sync.py
+"""
+
+
+from __future__ import print_function
+
+import timeit
+
+import fsleyes_props as props
+
+
+class Thing(props.HasProperties):
+    myint = props.Int()
+
+
+def star(nchildren):
+    parent   = Thing()
+    children = [Thing() for i in range(nchildren)]
+    for c in children:
+        c.bindProps('myint', parent)
+    return [parent] + children
+
+
+def chain(length):
+    things = [Thing() for i in range(length)]
+    for t1, t2 in zip(things[:-1], things[1:]):
+        t2.bindProps('myint', t1)
+    return things
+
+
+def run(things, n=200):
+    """Returns the time, in microseconds, taken to change the value of the
+    first of the given ``HasProperties`` instances.
+    """
+
+    state = [0]
+    first = things[0]
+
+    def change():
+        state[0] += 1
+        first.myint = state[0]
+
+    return 1e6 * min(timeit.repeat(change, number=n, repeat=3)) / n
+
+
+def main():
+    for n in (10, 100, 500):
+        print('star  ({:4d} children): {:10.1f}us per change'.format(
+            n, run(star(n))))
+    for n in (10, 100, 500, 2000):
+        print('chain ({:4d} PVs):      {:10.1f}us per change'.format(
+            n, run(chain(n))))
+
+
+if __name__ == '__main__':
+    main()
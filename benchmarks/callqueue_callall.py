@@ -0,0 +1,52 @@
+#!/usr/bin/env python
+#
+# callqueue_callall.py - Measure CallQueue.callAll throughput.
+#
+# Author: Paul McCarthy <pauldmccarthy@gmail.com>
+#
+"""Measures the time taken by :meth:`.CallQueue.callAll` to enqueue and
+execute 10000 calls, for thread-safe and single-threaded queues. Run as::
+
+    python benchmarks/callqueue_callall.py
+"""
+
+
+from __future__ import print_function
+
+import timeit
+
+import fsleyes_props.callqueue as callqueue
+
+
+N = 10000
+
+
+def func(*a):
+    pass
+
+
+def run(**kwargs):
+    """Returns the time, in milliseconds, taken to call ``N`` functions
+    through a ``CallQueue`` created with the given arguments.
+    """
+
+    calls = [(func, 'func {}'.format(i), (i,), {}) for i in range(N)]
+
+    def callAll():
+        q = callqueue.CallQueue(**kwargs)
+        q.callAll(calls)
+
+    return 1000 * min(timeit.repeat(callAll, number=1, repeat=5))
+
+
+def main():
+    for skip in (False, True):
+        for threadSafe in (True, False):
+            print('skipDuplicates={!s:5s} threadSafe={!s:5s} '
+                  '{:8.2f}ms'.format(skip, threadSafe,
+                                     run(skipDuplicates=skip,
+                                         threadSafe=threadSafe)))
+
+
+if __name__ == '__main__':
+    main()
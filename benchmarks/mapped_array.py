@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+#
+# mapped_array.py - Measure the memory used by Array and MappedArray
+#                   properties.
+#
+# Author: Paul McCarthy <pauldmccarthy@gmail.com>
+#
+"""Measures the memory allocated, and the time taken, when many images are
+loaded from ``.npy`` files into :class:`.Array` properties, and into
+:class:`.MappedArray` properties, and a single voxel is read from each.
+Run as::
+
+    python benchmarks/mapped_array.py
+"""
+
+
+from __future__ import print_function
+
+import os.path as op
+import gc
+import shutil
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+
+import fsleyes_props as props
+
+
+NIMAGES = 20
+SHAPE   = (128, 128, 128)
+
+
+class Image(props.HasProperties):
+    data = props.Array(dtype=np.float32, shape=SHAPE)
+
+
+class MappedImage(props.HasProperties):
+    data = props.MappedArray(dtype=np.float32)
+
+
+def load(cls, paths, value):
+    """Creates an instance of ``cls`` for each file, reads one voxel from
+    each, and returns the number of megabytes allocated, and the time taken
+    in milliseconds.
+    """
+
+    gc.collect()
+    tracemalloc.start()
+    start  = time.time()
+    images = []
+
+    for path in paths:
+        img      = cls()
+        img.data = value(path)
+        img.data[0, 0, 0]
+        images.append(img)
+
+    end  = time.time()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return peak / 1048576.0, 1000 * (end - start)
+
+
+def main():
+
+    tmpdir = tempfile.mkdtemp()
+
+    try:
+        paths = []
+        for i in range(NIMAGES):
+            path = op.join(tmpdir, '{}.npy'.format(i))
+            np.save(path, np.random.random(SHAPE).astype(np.float32))
+            paths.append(path)
+
+        mb, ms = load(Image, paths, np.load)
+        print('Array:       {:8.1f}MB {:8.1f}ms'.format(mb, ms))
+        mb, ms = load(MappedImage, paths, lambda p: p)
+        print('MappedArray: {:8.1f}MB {:8.1f}ms'.format(mb, ms))
+
+    finally:
+        shutil.rmtree(tmpdir)
+
+
+if __name__ == '__main__':
+    main()
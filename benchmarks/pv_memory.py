@@ -0,0 +1,97 @@
+#!/usr/bin/env python
+#
+# pv_memory.py - Measure the memory used by PropertyValue objects.
+#
+# Author: Paul McCarthy <pauldmccarthy@gmail.com>
+#
+"""Measures the number of bytes allocated per :class:`.PropertyValue`,
+per :class:`.PropertyValue` with a listener, per :class:`.HasProperties`
+instance, and per :class:`.List` item, using :mod:`tracemalloc`. Run as::
+
+    python benchmarks/pv_memory.py
+"""
+
+
+from __future__ import print_function
+
+import gc
+import tracemalloc
+
+import fsleyes_props                  as props
+import fsleyes_props.properties_value as propvals
+
+
+N = 10000
+
+
+class Context(object):
+    pass
+
+
+class Thing(props.HasProperties):
+    myint  = props.Int()
+    myreal = props.Real()
+    mybool = props.Boolean()
+    mystr  = props.String()
+    mypnt  = props.Point(ndims=3)
+
+
+class ListThing(props.HasProperties):
+    mylist = props.List(props.Int())
+
+
+def listener(*a):
+    pass
+
+
+def measure(create, n=N):
+    """Calls ``create`` ``n`` times, and returns the number of bytes
+    allocated, divided by ``N``.
+    """
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objs   = [create() for i in range(n)]
+    after  = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del objs
+    return (after - before) / float(N)
+
+
+def main():
+
+    ctx = Context()
+
+    def pv():
+        return propvals.PropertyValue(ctx, name='pv', value=1)
+
+    def pvl():
+        p = propvals.PropertyValue(ctx, name='pv', value=1)
+        p.addListener('l', listener, weak=False)
+        return p
+
+    print('PropertyValue:                 {:8.1f} bytes'.format(measure(pv)))
+    print('PropertyValue + listener:      {:8.1f} bytes'.format(measure(pvl)))
+    print('HasProperties (5 properties):  {:8.1f} bytes'.format(
+        measure(Thing)))
+
+    # Measure the size of a list with N
+    # items, without and with item PVs
+    def listItems():
+        lt = ListThing()
+        lt.mylist.extend(range(N))
+        return lt
+
+    def listItemPVs():
+        lt = listItems()
+        lt.getPropVal('mylist').getPropertyValueList()
+        return lt
+
+    print('List item:                     {:8.1f} bytes'.format(
+        measure(listItems, 1)))
+    print('List item + PropertyValue:     {:8.1f} bytes'.format(
+        measure(listItemPVs, 1)))
+
+
+if __name__ == '__main__':
+    main()
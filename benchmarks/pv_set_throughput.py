@@ -0,0 +1,105 @@
+#!/usr/bin/env python
+#
+# pv_set_throughput.py - Measure PropertyValue.set throughput with and
+#                        without debug tracing, and with and without
+#                        locking on the listener queue.
+#
+# Author: Paul McCarthy <pauldmccarthy@gmail.com>
+#
+"""Measures the number of property value changes per second, with logging
+at ``INFO`` level, with the :mod:`.tracing` switch turned on (which
+reproduces the old behaviour, where every debug message was formatted and
+then discarded by the ``logging`` module), and turned off. With tracing
+turned off, the throughput is also measured with the locks of the
+:attr:`.PropertyValue.queue` disabled (see
+:meth:`.CallQueue.setThreadSafe`). Run as::
+
+    python benchmarks/pv_set_throughput.py
+"""
+
+
+from __future__ import print_function
+
+import logging
+import timeit
+
+import fsleyes_props                  as props
+import fsleyes_props.tracing          as tracing
+import fsleyes_props.properties_value as propvals
+
+
+N = 20000
+
+
+class Thing(props.HasProperties):
+    myint  = props.Int()
+    mylist = props.List(props.Int())
+
+
+def listener(*a):
+    pass
+
+
+def run(bound):
+    """Returns the number of changes per second on a plain property, and on
+    a property bound to another instance.
+    """
+
+    t1 = Thing()
+    t2 = Thing()
+    t1.mylist = list(range(10))
+
+    t1.addListener('myint',  'listener', listener, weak=False)
+    t1.addListener('mylist', 'listener', listener, weak=False)
+
+    if bound:
+        t2.bindProps('myint',  t1)
+        t2.bindProps('mylist', t1)
+
+    state = [0]
+
+    def setint():
+        state[0] += 1
+        t1.myint = state[0]
+
+    def setitem():
+        state[0] += 1
+        t1.mylist[3] = state[0]
+
+    intt  = min(timeit.repeat(setint,  number=N, repeat=3))
+    itemt = min(timeit.repeat(setitem, number=N, repeat=3))
+
+    return N / intt, N / itemt
+
+
+def main():
+
+    logging.basicConfig(level=logging.INFO)
+
+    queue = propvals.PropertyValue.queue
+
+    for bound in (False, True):
+        tracing.enable()
+        on  = run(bound)
+        tracing.disable()
+        off = run(bound)
+        queue.setThreadSafe(False)
+        unsafe = run(bound)
+        queue.setThreadSafe(True)
+
+        label = 'bound' if bound else 'unbound'
+
+        print('{:8s} Int      tracing on: {:10.0f}/s  off: {:10.0f}/s  '
+              '({:.2f}x)'.format(label, on[0], off[0], off[0] / on[0]))
+        print('{:8s} List[i]  tracing on: {:10.0f}/s  off: {:10.0f}/s  '
+              '({:.2f}x)'.format(label, on[1], off[1], off[1] / on[1]))
+        print('{:8s} Int      locked:     {:10.0f}/s  unlocked: {:10.0f}/s  '
+              '({:.2f}x)'.format(label, off[0], unsafe[0],
+                                 unsafe[0] / off[0]))
+        print('{:8s} List[i]  locked:     {:10.0f}/s  unlocked: {:10.0f}/s  '
+              '({:.2f}x)'.format(label, off[1], unsafe[1],
+                                 unsafe[1] / off[1]))
+
+
+if __name__ == '__main__':
+    main()
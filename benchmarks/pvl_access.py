@@ -0,0 +1,72 @@
+#!/usr/bin/env python
+#
+# pvl_access.py - Measure the cost of reading from a PropertyValueList.
+#
+# Author: Paul McCarthy <pauldmccarthy@gmail.com>
+#
+"""Measures the time taken to access the length of, individual items in,
+and all items (by iteration and by indexing) of :class:`.PropertyValueList`
+instances of various sizes. Run as::
+
+    python benchmarks/pvl_access.py
+"""
+
+
+from __future__ import print_function
+
+import timeit
+
+import fsleyes_props as props
+
+
+class Thing(props.HasProperties):
+    mylist = props.List(props.Int())
+
+
+def run(nitems):
+    """Returns the time, in microseconds, taken to call ``len``, access an
+    item, iterate over the list, and to access every item by index, on a
+    list of the given length.
+    """
+
+    t = Thing()
+    t.mylist = list(range(nitems))
+    lst = t.mylist
+
+    def length():
+        len(lst)
+
+    def item():
+        lst[nitems // 2]
+
+    def iterate():
+        for v in lst:
+            pass
+
+    def index():
+        for i in range(len(lst)):
+            lst[i]
+
+    def time(func, n):
+        return 1e6 * min(timeit.repeat(func, number=n, repeat=3)) / n
+
+    # Indexing every item used to be
+    # quadratic - don't wait forever
+    # with the old implementation
+    nindex = 1 if nitems > 1000 else 10
+
+    return (time(length,  1000),
+            time(item,    1000),
+            time(iterate, 10),
+            time(index,   nindex))
+
+
+def main():
+    print('{:>8s} {:>12s} {:>12s} {:>12s} {:>14s}'.format(
+        'items', 'len (us)', 'l[i] (us)', 'iter (us)', 'all l[i] (us)'))
+    for n in (10, 1000, 100000):
+        print('{:8d} {:12.2f} {:12.2f} {:12.1f} {:14.1f}'.format(n, *run(n)))
+
+
+if __name__ == '__main__':
+    main()
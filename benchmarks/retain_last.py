@@ -0,0 +1,64 @@
+#!/usr/bin/env python
+#
+# retain_last.py - Measure the memory used by an Array property with
+#                  different last-value retention policies.
+#
+# Author: Paul McCarthy <pauldmccarthy@gmail.com>
+#
+"""Measures the memory that remains allocated after an :class:`.Array`
+property value is replaced, with the default and each of the
+``retainLast`` policies (see :meth:`.PropertyBase.__init__`). Run as::
+
+    python benchmarks/retain_last.py
+"""
+
+
+from __future__ import print_function
+
+import gc
+import tracemalloc
+
+import numpy as np
+
+import fsleyes_props as props
+
+
+SHAPE = (128, 128, 128)
+
+
+def run(retainLast):
+    """Returns the number of megabytes allocated after an array has been
+    assigned, and then replaced. If ``retainLast`` is ``None``, the
+    default policy is used.
+    """
+
+    kwargs = {}
+    if retainLast is not None:
+        kwargs['retainLast'] = retainLast
+
+    class Image(props.HasProperties):
+        data = props.Array(dtype=np.float32, shape=SHAPE, **kwargs)
+
+    img = Image()
+
+    gc.collect()
+    tracemalloc.start()
+
+    img.data = np.ones(SHAPE, dtype=np.float32)
+    img.data = np.zeros(SHAPE, dtype=np.float32)
+    gc.collect()
+
+    current = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    return current / 1048576.0
+
+
+def main():
+    for retainLast in (None, 'full', 'weak', 'none'):
+        print('retainLast={:7s}: {:8.1f}MB'.format(
+            retainLast or 'default', run(retainLast)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python
+#
+# shared_array.py - Measure the cost of passing an array computed in a
+#                   worker process back to an Array property.
+#
+# Author: Paul McCarthy <pauldmccarthy@gmail.com>
+#
+"""Measures the time taken for a worker process to compute an array, and
+for the result to be assigned to an :class:`.Array` property (with the
+result sent back to the owning process via a ``multiprocessing.Queue``),
+or written directly into a :class:`.SharedArray` property (with listeners
+notified via :meth:`.SharedArrayProxy.poll`). Run as::
+
+    python benchmarks/shared_array.py
+"""
+
+
+from __future__ import print_function
+
+import multiprocessing as mp
+import time
+
+import numpy as np
+
+import fsleyes_props as props
+
+
+def compute(out):
+    out[:] = 1
+
+
+def queueWorker(shape, queue):
+    result = np.zeros(shape, dtype=np.float32)
+    compute(result)
+    queue.put(result)
+
+
+def sharedWorker(handle):
+    result = handle.open()
+    compute(result)
+    handle.update()
+    del result
+    handle.close()
+
+
+def run(size):
+    """Returns the time, in milliseconds, taken to update an ``Array``, and
+    a ``SharedArray``, of shape ``size**3`` from a worker process.
+    """
+
+    shape = (size, size, size)
+
+    class Image(props.HasProperties):
+        data   = props.Array(      dtype=np.float32, shape=shape)
+        shared = props.SharedArray(dtype=np.float32, shape=shape)
+
+    img        = Image()
+    img.shared = np.zeros(shape, dtype=np.float32)
+    called     = []
+
+    def listener(*a):
+        called.append(a)
+
+    img.addListener('data',   'listener', listener)
+    img.addListener('shared', 'listener', listener)
+
+    queue  = mp.Queue()
+    start  = time.time()
+    worker = mp.Process(target=queueWorker, args=(shape, queue))
+    worker.start()
+    img.data = queue.get()
+    worker.join()
+    array    = time.time() - start
+
+    handle = img.shared.getHandle()
+    start  = time.time()
+    worker = mp.Process(target=sharedWorker, args=(handle,))
+    worker.start()
+    worker.join()
+    img.shared.poll(None)
+    shared = time.time() - start
+
+    assert len(called) == 2
+
+    return 1000 * array, 1000 * shared
+
+
+def main():
+    for size in (64, 128, 256):
+        array, shared = run(size)
+        print('{:3d}^3: Array {:8.1f}ms, SharedArray {:8.1f}ms'.format(
+            size, array, shared))
+
+
+if __name__ == '__main__':
+    main()
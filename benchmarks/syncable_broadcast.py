@@ -0,0 +1,63 @@
+#!/usr/bin/env python
+#
+# syncable_broadcast.py - Measure the cost of changing a property value on
+#                         a SyncableHasProperties parent.
+#
+# Author: Paul McCarthy <pauldmccarthy@gmail.com>
+#
+"""Measures the time taken to change the value of a property on a
+:class:`.SyncableHasProperties` parent, which has an increasing number of
+children, with and without a listener registered on each child. Run as::
+
+    python benchmarks/syncable_broadcast.py
+"""
+
+
+from __future__ import print_function
+
+import timeit
+
+import fsleyes_props as props
+
+
+class Thing(props.SyncableHasProperties):
+    value = props.Real()
+
+
+def run(nchildren, listeners, n=50):
+    """Returns the time, in microseconds, taken to change the value of a
+    parent which has ``nchildren`` children.
+    """
+
+    parent   = Thing()
+    children = [Thing(parent=parent) for i in range(nchildren)]
+    state    = [0]
+
+    if listeners:
+        for i, child in enumerate(children):
+            child.addListener('value',
+                              'listener{}'.format(i),
+                              lambda *a: None,
+                              weak=False)
+
+    def change():
+        state[0]    += 1
+        parent.value = state[0]
+
+    change()
+    assert all([c.value == state[0] for c in children])
+
+    return 1e6 * min(timeit.repeat(change, number=n, repeat=3)) / n
+
+
+def main():
+    for nchildren in (10, 100, 1000):
+        for listeners in (False, True):
+            print('{:4d} children (listeners={!s:5}): {:10.1f}us '
+                  'per change'.format(nchildren,
+                                      listeners,
+                                      run(nchildren, listeners)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,97 @@
+#!/usr/bin/env python
+#
+# syncable_bulk.py - Measure the cost of syncing and unsyncing all
+#                    properties of many SyncableHasProperties children.
+#
+# Author: Paul McCarthy <pauldmccarthy@gmail.com>
+#
+"""Measures the time taken, and the number of listener calls made, when all
+of the properties of many child :class:`.SyncableHasProperties` instances
+are unsynced from, and then re-synced to, their parent, either one child at
+a time via :meth:`.SyncableHasProperties.syncAllToParent`, or all at once
+via :meth:`.SyncableHasProperties.syncChildren`, with both binding
+directions (see :meth:`.SyncableHasProperties.setBindingDirection`). Run
+as::
+
+    python benchmarks/syncable_bulk.py
+"""
+
+
+from __future__ import print_function
+
+import time
+
+import fsleyes_props as props
+
+
+NCHILDREN = 200
+NPROPS    = 60
+
+
+def makeClass(nprops):
+    """Creates a ``SyncableHasProperties`` class with ``nprops``
+    ``Real`` properties, which notifies sync change listeners of all
+    sync state changes.
+    """
+    atts = {'prop{:03d}'.format(i) : props.Real(minval=0, maxval=100)
+            for i in range(nprops)}
+    atts['_notifySyncChanges'] = True
+    return type('Thing', (props.SyncableHasProperties,), atts)
+
+
+def run(nchildren, nprops, bulk, direction):
+    """Returns the time, in milliseconds, taken to sync and unsync
+    ``nchildren`` children, and the number of listener calls made when
+    they are synced.
+    """
+
+    cls       = makeClass(nprops)
+    propNames = cls.getAllProperties()[0]
+    parent    = cls()
+    children  = [cls(parent=parent, direction=direction)
+                 for i in range(nchildren)]
+    called    = [0]
+
+    def listener(*a):
+        called[0] += 1
+
+    for i, child in enumerate(children):
+        lName = 'listener{}'.format(i)
+        for propName in propNames:
+            child.addListener(propName, lName, listener, weak=False)
+            child.addSyncChangeListener(propName, lName, listener, weak=False)
+
+    start = time.time()
+
+    if bulk: parent.unsyncChildren()
+    else:    [c.unsyncAllFromParent() for c in children]
+
+    for i, child in enumerate(children):
+        for propName in propNames:
+            setattr(child, propName, i % 100)
+            child.setAttribute(propName, 'maxval', 200)
+
+    for propName in propNames:
+        setattr(parent, propName, 50)
+
+    called[0] = 0
+    if bulk: parent.syncChildren()
+    else:    [c.syncAllToParent() for c in children]
+
+    end = time.time()
+
+    return 1000 * (end - start), called[0]
+
+
+def main():
+    for direction in (True, False):
+        for bulk in (False, True):
+            ms, ncalls = run(NCHILDREN, NPROPS, bulk, direction)
+            print('{} children x {} properties (direction={!s:5}, '
+                  'bulk={!s:5}): {:8.1f}ms, {} listener calls on '
+                  'sync'.format(NCHILDREN, NPROPS, direction, bulk, ms,
+                                ncalls))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,65 @@
+#!/usr/bin/env python
+#
+# syncable_children.py - Measure the cost of creating child
+#                        SyncableHasProperties instances.
+#
+# Author: Paul McCarthy <pauldmccarthy@gmail.com>
+#
+"""Measures the time taken, and the memory allocated, when many child
+:class:`.SyncableHasProperties` instances, each with many properties, are
+created and synced to a single parent. Run as::
+
+    python benchmarks/syncable_children.py
+"""
+
+
+from __future__ import print_function
+
+import gc
+import time
+import tracemalloc
+
+import fsleyes_props as props
+
+
+NCHILDREN = 500
+NPROPS    = 60
+
+
+def makeClass(nprops):
+    """Creates a ``SyncableHasProperties`` class with ``nprops``
+    ``Int`` properties.
+    """
+    atts = {'prop{:03d}'.format(i) : props.Int() for i in range(nprops)}
+    return type('Thing', (props.SyncableHasProperties,), atts)
+
+
+def run(nchildren, nprops):
+    """Returns the time, in milliseconds, taken to create ``nchildren``
+    children, and the number of megabytes allocated.
+    """
+
+    cls    = makeClass(nprops)
+    parent = cls()
+
+    gc.collect()
+    tracemalloc.start()
+    start    = time.time()
+    children = [cls(parent=parent) for i in range(nchildren)]
+    end      = time.time()
+    size     = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    assert len(parent.getChildren()) == len(children)
+
+    return 1000 * (end - start), size / 1048576.0
+
+
+def main():
+    ms, mb = run(NCHILDREN, NPROPS)
+    print('{} children x {} properties: {:8.1f}ms {:8.1f}MB'.format(
+        NCHILDREN, NPROPS, ms, mb))
+
+
+if __name__ == '__main__':
+    main()
@@ -288,6 +288,9 @@ Miscellaneous
 
 The :func:`.suppress` module provides some context managers allowing
 notification of properties to be suppressed in a ``with`` statement.
+
+The :mod:`.tracing` module contains a switch which controls whether debug
+log messages are generated when property values change.
 """
 
 
@@ -307,11 +310,14 @@ from .properties import (
     DisabledError)
 
 from .properties_value import (
-    safeCall
+    safeCall,
+    ListChange
 )
 
 from .bindable import (
     bindPropVals,
+    broadcastProps,
+    broadcastPropVals,
     propValsAreBound,
     Bidict)
 
@@ -329,7 +335,9 @@ from .properties_types import (
     ColourMap,
     Bounds,
     Point,
-    Array)
+    Array,
+    MappedArray,
+    SharedArray)
 
 from .syncable import (
     SyncableHasProperties,)
@@ -21,6 +21,7 @@ the :class:`.HasProperties` class.
     bindProps
     unbindProps
     isBound
+    broadcastProps
 
 
 These functions use the following functions, which work directly with
@@ -31,6 +32,7 @@ These functions use the following functions, which work directly with
     :nosignatures:
 
     bindPropVals
+    broadcastPropVals
     propValsAreBound
 
 
@@ -113,18 +115,105 @@ will be updated. In other words, there are no restrictions on the ways in
 which ``PropertyValue`` instances may be bound.  A tree, chain, or even a
 network of ``PV`` instances can be bound together - the above process will
 still work.
+
+
+------------------
+Broadcast bindings
+------------------
+
+
+When one ``PropertyValue`` is bound to many others, as is the case for a
+:class:`.SyncableHasProperties` parent and its children, every change to
+the value requires every bound ``PropertyValue`` to be updated in step 3
+above. A *broadcast* binding may be used instead (see
+:func:`broadcastProps` and :func:`broadcastPropVals`). The subscribed
+``PropertyValue`` instances do not store their own value - they return the
+value of the publishing ``PropertyValue``, and pass any new values to it.
+When the value of the publisher changes, the listeners of all subscribers
+are notified, without their values needing to be updated. When a
+broadcast binding is removed, the subscriber takes a copy of the value of
+the publisher.
 """
 
 
 import logging
 import weakref
 
-import fsl.utils.weakfuncref as weakfuncref
+from . import tracing
 
 
 log = logging.getLogger(__name__)
 
 
+_componentAtts = {'boundPropVals'    : '_bpvComponent',
+                  'boundAttPropVals' : '_bapvComponent'}
+"""Maps each type of binding (``boundPropVals`` or ``boundAttPropVals``) to
+the :class:`.PropertyValue` attribute which stores the
+:class:`BindingComponent` for that type of binding.
+"""
+
+
+class BindingComponent(object):
+    """A ``BindingComponent`` represents a set of :class:`.PropertyValue`
+    instances which are bound to each other, either directly or indirectly.
+    A single ``BindingComponent`` is shared by all of the PVs in the set, and
+    is used by the :func:`_sync` and :func:`buildBPVList` functions, so that
+    they do not need to search through the bound PVs every time a value
+    changes.
+
+    ``BindingComponent`` instances are created and merged by the
+    :func:`bindPropVals` function. When a binding is removed, or a PV in the
+    component is garbage-collected, the component is marked as ``dirty``,
+    and is split up the next time that it is accessed (see
+    :func:`_getComponent`).
+
+    A ``BindingComponent`` has the following attributes:
+
+      - ``key``:     Either ``boundPropVals`` or ``boundAttPropVals``.
+      - ``refs``:    A list of weak references to the PVs in the component.
+      - ``version``: Incremented whenever the component changes.
+      - ``dirty``:   ``True`` if a binding has been removed, or a PV has
+                     been garbage-collected, since the component was
+                     created.
+      - ``order``:   The result of the most recent call to
+                     :func:`buildBPVList` for a PV in the component, or
+                     ``None``.
+    """
+
+    __slots__ = ('key', 'refs', 'version', 'dirty', 'order', 'callback')
+
+    def __init__(self, key):
+        self.key      = key
+        self.refs     = []
+        self.version  = 0
+        self.dirty    = False
+        self.order    = None
+        self.callback = self.__pvDied
+
+    def __len__(self):
+        return len(self.refs)
+
+    def add(self, pv):
+        """Adds the given PV to this component. """
+        self.refs.append(weakref.ref(pv, self.callback))
+        setattr(pv, _componentAtts[self.key], self)
+        self.changed()
+
+    def changed(self, dirty=False):
+        """Called when the component changes. Increments the component
+        version, and clears the cached :func:`buildBPVList` result.
+        """
+        self.version += 1
+        self.order    = None
+        self.dirty    = self.dirty or dirty
+
+    def __pvDied(self, ref):
+        """Called when a PV in the component is garbage-collected. Marks
+        the component as dirty.
+        """
+        self.changed(True)
+
+
 class Bidict(object):
     """A bare-bones bi-directional dictionary, used for binding
     :class:`.PropertyValueList` instances - see the :func:`_bindListProps` and
@@ -248,6 +337,62 @@ def isBound(self, propName, other, otherPropName=None):
     return propValsAreBound(myPropVal, otherPropVal)
 
 
+def broadcastProps(self, propName, other, inherit=True, unbind=False):
+    """Creates a broadcast binding from the specified property of this
+    ``HasProperties`` instance to the same property of ``other`` - see
+    :func:`broadcastPropVals`. Property attributes are bound in the normal
+    manner.
+
+    If the property type does not support broadcast bindings (e.g.
+    :class:`.List` and :class:`.Array` properties), the properties are
+    bound via :func:`bindProps` instead.
+
+    :arg propName: The name of a property on this ``HasProperties``
+                   instance.
+
+    :arg other:    Another ``HasProperties`` instance, which will be
+                   subscribed to this one.
+
+    :arg inherit:  If ``True`` (the default), ``other`` will inherit the
+                   value and attributes of this instance. Otherwise, this
+                   instance will inherit the value and attributes of
+                   ``other``.
+
+    :arg unbind:   If ``True``, the properties are unbound. If they were
+                   bound via a broadcast binding, ``other`` retains the
+                   current value of this instance.
+    """
+
+    myPropVal    = self .getPropVal(propName)
+    otherPropVal = other.getPropVal(propName)
+
+    if not (myPropVal._broadcast and otherPropVal._broadcast):
+        if inherit: other.bindProps(propName, self,  unbind=unbind)
+        else:       self .bindProps(propName, other, unbind=unbind)
+        return
+
+    if not unbind:
+
+        if inherit: slave, master = otherPropVal, myPropVal
+        else:       slave, master = myPropVal,    otherPropVal
+
+        allow = slave.allowInvalid()
+        slave.allowInvalid(True)
+        slave.setAttributes(master.getAttributes())
+
+        if not inherit:
+            myPropVal.set(otherPropVal.get())
+
+        slave.allowInvalid(allow)
+
+    bindPropVals(otherPropVal,
+                 myPropVal,
+                 bindval=False,
+                 bindatt=True,
+                 unbind=unbind)
+    broadcastPropVals(myPropVal, otherPropVal, unbind=unbind)
+
+
 def syncAndNotifyAtts(self, name, value):
     """This method is called by the
     :meth:`.PropertyValue.notifyAttributeListeners` method.
@@ -268,6 +413,19 @@ def syncAndNotify(self):
     registered listeners of the value change. This method is called by the
     :meth:`.PropertyValue.propNotify` method.
     """
+    _callAllListeners(syncOnly(self), False)
+
+
+def syncOnly(self):
+    """Synchronises the value contained in all bound :class:`.PropertyValue`
+    instances with the value contained in this instance, but does not notify
+    any listeners. Returns a list containing this ``PropertyValue``, and all
+    of the ``PropertyValue`` instances which would need to be notified of the
+    change.
+
+    This function is used by :meth:`.HasProperties.batch`, when an error
+    occurs within a batch update.
+    """
 
     from . import properties_value
 
@@ -279,7 +437,66 @@ def syncAndNotify(self):
             allBpvs.extend(listItems)
         allBpvs.append(bpv)
 
-    _callAllListeners([self] + allBpvs, False)
+    allBpvs = [self] + allBpvs
+
+    return allBpvs + _broadcast(allBpvs)
+
+
+def _broadcast(propVals):
+    """Called by :func:`syncAndNotify`. Returns a list containing all of
+    the :class:`.PropertyValue` instances which are subscribed, directly or
+    indirectly, to the given ``PropertyValue`` instances (see
+    :func:`broadcastPropVals`), and which therefore need to be notified.
+
+    Subscribers do not need to be synchronised, as they return the value
+    of their publisher - they just keep a reference to it, in case their
+    publisher is deleted. But if a subscriber is also bound to other
+    ``PropertyValue`` instances, they are synchronised, and also returned.
+    """
+
+    pending = [pv for pv in propVals if pv._subscribers]
+
+    if len(pending) == 0:
+        return []
+
+    visited = set([id(pv) for pv in propVals])
+    notify  = []
+
+    while len(pending) > 0:
+
+        publisher   = pending.pop(0)
+        subscribers = list(publisher._subscribers.values())
+
+        for sub in subscribers:
+
+            if id(sub) in visited:
+                continue
+
+            visited.add(id(sub))
+            notify.append(sub)
+            sub._copyPublisherValue(publisher)
+
+            if sub._subscribers:
+                pending.append(sub)
+
+            if not sub.boundPropVals:
+                continue
+
+            for bpv, _ in _sync(sub):
+                if id(bpv) in visited:
+                    continue
+
+                visited.add(id(bpv))
+                notify.append(bpv)
+
+                if bpv._subscribers:
+                    pending.append(bpv)
+
+    if tracing.enabled:
+        log.debug('Broadcasting value change to {} '
+                  'subscribers'.format(len(notify)))
+
+    return notify
 
 
 def _bindProps(self,
@@ -374,13 +591,14 @@ def _bindListProps(self,
     # to the slave list, and save the mapping
     for myItem, otherItem in zip(myPropValList, otherPropValList):
 
-        log.debug('Binding list item {}.{} ({}) <- {}.{} ({})'.format(
-            self.__class__.__name__,
-            myProp.getLabel(self),
-            myItem.get(),
-            other.__class__.__name__,
-            otherProp.getLabel(other),
-            otherItem.get()))
+        if tracing.enabled:
+            log.debug('Binding list item {}.{} ({}) <- {}.{} ({})'.format(
+                self.__class__.__name__,
+                myProp.getLabel(self),
+                myItem.get(),
+                other.__class__.__name__,
+                otherProp.getLabel(other),
+                otherItem.get()))
 
         # Disable item notification - we'll
         # manually force a notify after the
@@ -420,8 +638,8 @@ def _bindListProps(self,
 
     # This mapping is stored on the PVL objects,
     # and used by the _syncListPropVals function
-    myPropValMaps    = getattr(myPropVal,    '_listPropValMaps', {})
-    otherPropValMaps = getattr(otherPropVal, '_listPropValMaps', {})
+    myPropValMaps    = myPropVal   ._listPropValMaps or {}
+    otherPropValMaps = otherPropVal._listPropValMaps or {}
 
     # We can't use the PropValList objects as
     # keys, because they are not hashable.
@@ -459,11 +677,15 @@ def _bindListProps(self,
 
 def propValsAreBound(pv1, pv2):
     """Returns ``True`` if the given :class:`.PropertyValue` instances are
-    bound to each other, ``False`` otherwise.
+    bound to each other (including via a broadcast binding - see
+    :func:`broadcastPropVals`), ``False`` otherwise.
     """
 
-    pv1BoundPropVals = pv1.__dict__.get('boundPropVals', {})
-    pv2BoundPropVals = pv2.__dict__.get('boundPropVals', {})
+    if pv1._getPublisher() is pv2 or pv2._getPublisher() is pv1:
+        return True
+
+    pv1BoundPropVals = pv1.boundPropVals or {}
+    pv2BoundPropVals = pv2.boundPropVals or {}
 
     return (id(pv2) in pv1BoundPropVals and
             id(pv1) in pv2BoundPropVals)
@@ -492,25 +714,26 @@ def bindPropVals(myPropVal,
     # which are no longer in use from being GC'd.
     wvd = weakref.WeakValueDictionary
 
-    myBoundPropVals       = mine .__dict__.get('boundPropVals',    wvd())
-    myBoundAttPropVals    = mine .__dict__.get('boundAttPropVals', wvd())
-    otherBoundPropVals    = other.__dict__.get('boundPropVals',    wvd())
-    otherBoundAttPropVals = other.__dict__.get('boundAttPropVals', wvd())
+    myBoundPropVals       = mine .boundPropVals    or wvd()
+    myBoundAttPropVals    = mine .boundAttPropVals or wvd()
+    otherBoundPropVals    = other.boundPropVals    or wvd()
+    otherBoundAttPropVals = other.boundAttPropVals or wvd()
 
     if unbind: action = 'Unbinding'
     else:      action = 'Binding'
 
-    log.debug('{} property values '
-              '(val={}, att={}) {}.{} ({}) <-> {}.{} ({})'.format(
-                  action,
-                  bindval,
-                  bindatt,
-                  myPropVal._context.__class__.__name__,
-                  myPropVal._name,
-                  id(myPropVal),
-                  otherPropVal._context.__class__.__name__,
-                  otherPropVal._name,
-                  id(otherPropVal)))
+    if tracing.enabled:
+        log.debug('{} property values '
+                  '(val={}, att={}) {}.{} ({}) <-> {}.{} ({})'.format(
+                      action,
+                      bindval,
+                      bindatt,
+                      myPropVal._context.__class__.__name__,
+                      myPropVal._name,
+                      id(myPropVal),
+                      otherPropVal._context.__class__.__name__,
+                      otherPropVal._name,
+                      id(otherPropVal)))
 
     if bindval:
         if unbind:
@@ -528,164 +751,436 @@ def bindPropVals(myPropVal,
             myBoundAttPropVals[   id(other)] = other
             otherBoundAttPropVals[id(mine)]  = mine
 
-    mine .boundPropVals    = myBoundPropVals
-    mine .boundAttPropVals = myBoundAttPropVals
-    other.boundPropVals    = otherBoundPropVals
-    other.boundAttPropVals = otherBoundAttPropVals
+    if bindval:
+        mine .boundPropVals    = myBoundPropVals
+        other.boundPropVals    = otherBoundPropVals
+    if bindatt:
+        mine .boundAttPropVals = myBoundAttPropVals
+        other.boundAttPropVals = otherBoundAttPropVals
+
+    # Update the components which
+    # are shared by all bound PVs
+    keys = []
+    if bindval: keys.append('boundPropVals')
+    if bindatt: keys.append('boundAttPropVals')
+
+    for key in keys:
+        if unbind: _splitComponents(mine, other, key)
+        else:      _joinComponents( mine, other, key)
+
+
+class _ComponentMembers(object):
+    """An iterable over the live PVs in a :class:`BindingComponent`,
+    excluding one PV. Used by :func:`_sync`, so that the bound PVs can be
+    visited without building a list of them.
+    """
+
+    __slots__ = ('component', 'exclude')
+
+    def __init__(self, component, exclude):
+        self.component = component
+        self.exclude   = exclude
+
+    def __iter__(self):
+        exclude = self.exclude
+        for r in self.component.refs:
+            pv = r()
+            if pv is not None and pv is not exclude:
+                yield pv
+
+
+def _getComponent(pv, key):
+    """Returns the :class:`BindingComponent` for the given PV and binding
+    type, or ``None`` if the PV is not bound to anything. If the component
+    is dirty, it is split up into new components before being returned.
+    """
+
+    component = getattr(pv, _componentAtts[key])
+
+    if component is None or not component.dirty:
+        return component
+
+    # A binding has been removed, or a PV has
+    # been GC'd. Re-build a component for each
+    # set of PVs which are still bound together.
+    att     = _componentAtts[key]
+    members = [r() for r in component.refs]
+    members = [m for m in members if m is not None]
+
+    for m in members:
+        setattr(m, att, None)
+
+    for m in members:
+
+        if getattr(m, att) is not None:
+            continue
+
+        group     = [m]
+        groupSet  = set([id(m)])
+        stack     = [m]
+
+        while len(stack) > 0:
+            node = stack.pop()
+            for b in (getattr(node, key) or {}).values():
+                if id(b) not in groupSet:
+                    groupSet.add(id(b))
+                    group   .append(b)
+                    stack   .append(b)
+
+        if len(group) < 2:
+            continue
+
+        newComponent = BindingComponent(key)
+        for b in group:
+            newComponent.add(b)
+
+    return getattr(pv, att)
+
+
+def _joinComponents(pv1, pv2, key):
+    """Called by :func:`bindPropVals` when two PVs are bound. Merges the
+    :class:`BindingComponent` instances of the two PVs.
+    """
+
+    c1 = _getComponent(pv1, key)
+    c2 = _getComponent(pv2, key)
+
+    if c1 is not None and c1 is c2:
+        c1.changed()
+        return
+
+    if c1 is None and c2 is None:
+        c1 = BindingComponent(key)
+        c1.add(pv1)
+        c1.add(pv2)
+        return
+
+    if c1 is None:
+        c2.add(pv1)
+        return
+
+    if c2 is None:
+        c1.add(pv2)
+        return
 
-    # When a master PV is synchronised to a slave PV,
-    # it stores a flag on the slave PV which is checked
-    # before starting a sync. If the flag is True,
-    # the sync is inhibited. See the _sync function below.
-    mine ._syncing = getattr(mine,  '_syncing', False)
-    other._syncing = getattr(other, '_syncing', False)
+    # Merge the smaller component
+    # into the larger one
+    if len(c1) < len(c2):
+        c1, c2 = c2, c1
 
+    for r in c2.refs:
+        pv = r()
+        if pv is not None:
+            c1.add(pv)
 
-def _syncPropValLists(masterList, slaveList):
+    c2.refs = []
+    c2.changed()
+
+
+def _splitComponents(pv1, pv2, key):
+    """Called by :func:`bindPropVals` when two PVs are unbound. Marks the
+    :class:`BindingComponent` shared by the two PVs as dirty, so it will be
+    split up the next time it is accessed.
+    """
+
+    component = getattr(pv1, _componentAtts[key])
+
+    if component is not None:
+        component.changed(True)
+
+
+def broadcastPropVals(pubPropVal, subPropVal, unbind=False):
+    """Subscribes ``subPropVal`` to ``pubPropVal``, so that the value of
+    ``subPropVal`` is always the same as the value of ``pubPropVal``.
+
+    A ``PropertyValue`` may have many subscribers, but may only be
+    subscribed to one other ``PropertyValue``. While it is subscribed, it
+    does not store its own value - it returns the value of ``pubPropVal``,
+    and passes any new values to ``pubPropVal``. When the value of
+    ``pubPropVal`` changes, the listeners of every subscriber are notified
+    (see :func:`syncAndNotify`), but their values do not need to be
+    updated. When ``subPropVal`` is unsubscribed, it takes a copy of the
+    current value of ``pubPropVal``.
+
+    If the value of ``subPropVal`` changes when it is subscribed, its
+    listeners are notified.
+
+    A :exc:`ValueError` is raised if either ``PropertyValue`` does not
+    support broadcast bindings (see :attr:`.PropertyValue._broadcast`), if
+    ``subPropVal`` is already subscribed to a different ``PropertyValue``,
+    or if the binding would create a cycle.
+    """
+
+    pub = pubPropVal
+    sub = subPropVal
+
+    if not (pub._broadcast and sub._broadcast):
+        raise ValueError('{} property values cannot be '
+                         'broadcast'.format(type(sub).__name__))
+
+    if tracing.enabled:
+        log.debug('{} property value {}.{} ({}) -> {}.{} ({})'.format(
+            'Unsubscribing' if unbind else 'Subscribing',
+            pub._context.__class__.__name__,
+            pub._name,
+            id(pub),
+            sub._context.__class__.__name__,
+            sub._name,
+            id(sub)))
+
+    publisher = sub._getPublisher()
+
+    if unbind:
+        if publisher is not pub:
+            return
+
+        pub._subscribers.pop(id(sub), None)
+        sub._setPublisher(None)
+        return
+
+    if publisher is pub:
+        return
+
+    if publisher is not None:
+        raise ValueError('Property value is already subscribed '
+                         'to another property value')
+
+    pv = pub
+    while pv is not None:
+        if pv is sub:
+            raise ValueError('Broadcast bindings cannot be cyclic')
+        pv = pv._getPublisher()
+
+    if pub._subscribers is None:
+        pub._subscribers = weakref.WeakValueDictionary()
+
+    pub._subscribers[id(sub)] = sub
+
+    if sub._setPublisher(pub):
+        sub.propNotify()
+
+
+def _syncPropValLists(masterList, slaveList, changes=None):
     """Called by the :func:`_sync` function when one of a pair of bound
     :class:`.PropertyValueList` instances changes.
 
     Propagates the change on the ``masterList`` (either an addition, a
-    removal, or a re-ordering) to the ``slaveList``.
+    removal, a re-ordering, or a change to the value of one or more items)
+    to the ``slaveList``.
+
+    :arg masterList: The ``PropertyValueList`` which has changed.
+
+    :arg slaveList:  The ``PropertyValueList`` to synchronise.
+
+    :arg changes:    A tuple describing the change (see the
+                     :class:`.PropertyValueList` ``_listChanges`` attribute).
+                     If provided, the change is applied directly to the
+                     ``slaveList``. Otherwise, the two lists are compared
+                     to figure out what has changed.
+
+    :returns:        A list containing the items in the ``slaveList`` whose
+                     values have been changed.
     """
 
     propValMap = masterList._listPropValMaps[id(slaveList)]
 
-    # If the change was due to the values of one or more PV
-    # items changing (as opposed to a list modification -
-    # addition/removal/reorder), the PV objects which
-    # changed are stored in this list and returned
-    changed = []
+    if changes is not None:
+        changed = _patchPropValList(masterList, slaveList, propValMap, changes)
+        if changed is not None:
+            return changed
+
+    # Otherwise we have to compare the two lists.
+    # The master list may have been changed in
+    # any number of ways (e.g. within a
+    # HasProperties.batch), so we remove, re-order,
+    # and insert items in the slave list, in that
+    # order, and then copy item values across.
+    mpvs    = masterList.getPropertyValueList()
+    mpvidxs = {id(m) : i for i, m in enumerate(mpvs)}
+    spvs    = slaveList .getPropertyValueList()
+    removed = []
+
+    # Remove any items from the slave list
+    # for which the corresponding master
+    # item is no longer in the master list
+    for i, spv in enumerate(spvs):
+
+        mpv = propValMap.get(spv, None)
+
+        if mpv is None or id(mpv) not in mpvidxs:
+            if mpv is not None:
+                del propValMap[mpv]
+            removed.append(i)
 
-    # one or more items have been
-    # added to the master list
-    if len(masterList) > len(slaveList):
+    if len(removed) > 0:
+        removedSet = set(removed)
+        spvs       = [spv for i, spv in enumerate(spvs)
+                      if i not in removedSet]
 
-        # Loop through the PV objects in the master
-        # list, and search for any which do not have
-        # a paired PV object in the slave list
-        for i, mpv in enumerate(masterList.getPropertyValueList()):
+        slaveList._setPropertyValueList(spvs, ('delete', tuple(removed)))
 
-            spv = propValMap.get(mpv, None)
+    # Re-order the remaining slave
+    # items to match the master list
+    order    = [mpvidxs[id(propValMap[spv])] for spv in spvs]
+    newOrder = sorted(range(len(spvs)), key=lambda i: order[i])
 
-            # we've found a value in the master
-            # list which is not in the slave list
-            if spv is None:
+    if newOrder != list(range(len(spvs))):
+        slaveList.reorder(newOrder)
 
-                # add a new value to the slave list
-                slaveList.insert(i, mpv.get())
+    # Insert any master items which are not in
+    # the slave list. The slave items are now in
+    # the same order as the master items, so
+    # we can insert each new item at the
+    # same index as its master item.
+    for i, mpv in enumerate(mpvs):
 
-                # retrieve the corresponding PV
-                # object that was created by
-                # the slave list
-                spvs = slaveList.getPropertyValueList()
-                spv  = spvs[i]
+        if propValMap.get(mpv, None) is not None:
+            continue
 
-                # register a mapping between the
-                # new master and slave PV objects
-                propValMap[mpv] = spv
+        slaveList.insert(i, mpv.get())
 
-                # Bind the attributes of
-                # the two new PV objects
-                bindPropVals(mpv, spv, bindval=False)
+        # register a mapping between, and
+        # bind the attributes of, the new
+        # master and slave PV objects
+        spv             = slaveList.getPropertyValue(i)
+        propValMap[mpv] = spv
+        bindPropVals(mpv, spv, bindval=False)
 
-    # one or more items have been
-    # removed from the master list
-    elif len(masterList) < len(slaveList):
+    # Find the items which have changed
+    # value, and copy the new value across
+    # to the slave list
+    changed = []
+    spvs    = slaveList.getPropertyValueList()
 
-        mpvs = masterList.getPropertyValueList()
+    for i, (masterVal, slaveVal) in enumerate(zip(mpvs, spvs)):
+        if _syncPropValListItem(masterList, slaveList, i,
+                                masterVal, slaveVal):
+            changed.append(slaveVal)
 
-        # Loop through the PV objects in the slave
-        # list, and check to see if their mapped
-        # master PV object has been removed from
-        # the master list. Loop backwards so we can
-        # delete items from the slave list as we go,
-        # without having to offset the list index.
-        for i, spv in reversed(
-                list(enumerate(slaveList.getPropertyValueList()))):
+    return changed
 
-            # If this raises an error, there's a bug
-            # in somebody's code ... probably mine.
-            mpv = propValMap[spv]
 
-            # we've found a value in the slave list
-            # which is no longer in the master list
-            if mpv not in mpvs:
+def _patchPropValList(masterList, slaveList, propValMap, changes):
+    """Called by :func:`_syncPropValLists`. Applies the change described by
+    ``changes`` on the ``masterList`` to the ``slaveList``. The work
+    performed is proportional to the size of the change, rather than to the
+    length of the lists.
 
-                # Delete the item from the slave
-                # list, and delete the PV mapping
-                del slaveList[ i]
-                del propValMap[mpv]
+    :returns: A list containing the items in the ``slaveList`` whose values
+              have been changed, or ``None`` if the change could not be
+              applied (e.g. because the two lists were not in sync before
+              the change), in which case the lists need to be compared.
+    """
 
-    # list re-order, or individual
-    # value change
-    else:
+    op      = changes[0]
+    changed = []
 
-        mpvs     = masterList.getPropertyValueList()
-        mpvids   = [id(m) for m in mpvs]
-        newOrder = []
+    # Make sure that the slave list is the
+    # same length that the master list was
+    # before the change - if it isn't, the
+    # two lists are out of sync, and we
+    # can't apply the change.
+    if   op == 'insert': expLen = len(masterList) - changes[2]
+    elif op == 'delete': expLen = len(masterList) + len(changes[1])
+    else:                expLen = len(masterList)
 
-        # loop through the PV objects in the slave list,
-        # and build a list of indices of the corresponding
-        # PV objects in the master list
-        for i, spv in enumerate(slaveList.getPropertyValueList()):
+    if len(slaveList) != expLen:
+        return None
 
-            mpv = propValMap[spv]
-            newOrder.append(mpvids.index(id(mpv)))
+    if op == 'insert':
 
-        # If the master list order has been
-        # changed, re-order the slave list
-        if newOrder != list(range(len(slaveList))):
-            slaveList.reorder(newOrder)
+        index, count = changes[1:]
+        newmpvs      = [masterList.getPropertyValue(i)
+                        for i in range(index, index + count)]
 
-        # The list order hasn't changed, so
-        # this call must have been triggered
-        # by a value change. Find the items
-        # which have changed, and copy the
-        # new value across to the slave list
-        else:
+        slaveList.insertAll(index, [mpv.get() for mpv in newmpvs])
 
-            for i, (masterVal, slaveVal) in \
-                enumerate(
-                    zip(masterList.getPropertyValueList(),
-                        slaveList .getPropertyValueList())):
+        # Register a mapping between, and bind
+        # the attributes of, the new master
+        # and slave PV objects
+        for i, mpv in enumerate(newmpvs):
+            spv             = slaveList.getPropertyValue(index + i)
+            propValMap[mpv] = spv
+            bindPropVals(mpv, spv, bindval=False)
 
-                if masterVal == slaveVal: continue
+    elif op == 'delete':
 
-                notifState = slaveVal.getNotificationState()
-                validState = slaveVal.allowInvalid()
-                slaveVal.disableNotification()
-                slaveVal.allowInvalid(True)
+        spvs    = slaveList.getPropertyValueList()
+        removed = set(changes[1])
 
-                log.debug('Syncing bound PV list item '
-                          '[{}] {}.{}[{}]({}) -> {}.{}[{}]({})'.format(
-                              i,
-                              masterList._context().__class__.__name__,
-                              masterList._name,
-                              id(masterList._context()),
-                              masterVal.get(),
-                              slaveList._context().__class__.__name__,
-                              slaveList._name,
-                              id(slaveList._context()),
-                              slaveList.get()))
+        for i in changes[1]:
+            if propValMap.get(spvs[i], None) is not None:
+                del propValMap[spvs[i]]
 
-                slaveList._ignoreListItems = True
+        spvs = [spv for i, spv in enumerate(spvs) if i not in removed]
 
-                try:
-                    slaveVal.set(masterVal.get())
-                    changed.append(slaveVal)
-                finally:
-                    slaveList._ignoreListItems = False
+        slaveList._setPropertyValueList(spvs, changes)
+
+    elif op == 'move':
+        slaveList.move(*changes[1:])
+
+    elif op == 'reorder':
+        slaveList.reorder(changes[1])
 
-                slaveVal.allowInvalid(validState)
-                slaveVal.setNotificationState(notifState)
+    elif op == 'set':
+        for i in changes[1]:
+            mpv = masterList.getPropertyValue(i)
+            spv = slaveList .getPropertyValue(i)
+            if _syncPropValListItem(masterList, slaveList, i, mpv, spv):
+                changed.append(spv)
+
+    else:
+        return None
 
     return changed
 
 
+def _syncPropValListItem(masterList, slaveList, i, masterVal, slaveVal):
+    """Called by :func:`_syncPropValLists` and :func:`_patchPropValList`.
+    Copies the value of ``masterVal``, at index ``i`` in the ``masterList``,
+    to ``slaveVal``, in the ``slaveList``, without notifying any listeners.
+
+    :returns: ``True`` if the value was copied, ``False`` if the two items
+              already had the same value.
+    """
+
+    if masterVal == slaveVal:
+        return False
+
+    notifState = slaveVal.getNotificationState()
+    validState = slaveVal.allowInvalid()
+    slaveVal.disableNotification()
+    slaveVal.allowInvalid(True)
+
+    if tracing.enabled:
+        log.debug('Syncing bound PV list item '
+                  '[{}] {}.{}[{}]({}) -> {}.{}[{}]({})'.format(
+                      i,
+                      masterList._context().__class__.__name__,
+                      masterList._name,
+                      id(masterList._context()),
+                      masterVal.get(),
+                      slaveList._context().__class__.__name__,
+                      slaveList._name,
+                      id(slaveList._context()),
+                      slaveList.get()))
+
+    slaveList._ignoreListItems = True
+
+    try:
+        slaveVal.set(masterVal.get())
+    finally:
+        slaveList._ignoreListItems = False
+
+    slaveVal.allowInvalid(validState)
+    slaveVal.setNotificationState(notifState)
+
+    return True
+
+
 def buildBPVList(self, key, node=None, bpvSet=None):
-    """Recursively builds a list of all PVs that are bound to this one, either
-    directly or indirectly.
+    """Builds a list of all PVs that are bound to this one, either directly
+    or indirectly.
 
     For each PV, we also store a reference to the 'parent' PV, i.e. the PV to
     which it is directly bound, as the direct bindings are needed to
@@ -694,47 +1189,80 @@ def buildBPVList(self, key, node=None, bpvSet=None):
     Returns two lists - the first containing bound PVs, and the second
     containing the parent for each bound PV.
 
+    The result for the most recent root PV is cached (as weak references) on
+    the :class:`BindingComponent` which is shared by all of the bound PVs,
+    and re-used until a binding within the component is created or removed,
+    or a PV in the component is garbage-collected.
+
     :arg self:   The root PV.
 
     :arg key:    A string, either ``boundPropVals`` or ``boundAttPropVals``.
 
-    :arg node:   The current PV to begin this step of the recursive search
-                 from (do not pass in on the non-recursive call).
+    :arg node:   Unused - previously used by the recursive implementation.
 
-    :arg bpvSet: A set used to prevent cycles in the depth-first search (do
-                 not pass in on the non-recursive call).
+    :arg bpvSet: Unused - previously used by the recursive implementation.
+    """
+
+    component = _getComponent(self, key)
+
+    # Not bound to anything
+    if component is None:
+        return [], []
+
+    order = component.order
+
+    if order is not None and order[0]() is self:
+        return ([r() for r in order[1]],
+                [r() for r in order[2]])
+
+    boundPropVals, bpvParents = _buildBPVList(self, key)
+
+    component.order = (weakref.ref(self),
+                       tuple([weakref.ref(b) for b in boundPropVals]),
+                       tuple([weakref.ref(p) for p in bpvParents]))
+
+    return boundPropVals, bpvParents
+
+
+def _buildBPVList(self, key):
+    """Called by :func:`buildBPVList`. Performs a depth-first search from
+    the given PV, through the network of directly and indirectly bound PVs.
+    An explicit stack is used, so long chains of bound PVs do not hit the
+    recursion limit.
+
+    PVs are returned in the same order as the original recursive
+    implementation - all of the unvisited PVs which are bound to a PV are
+    added to the list, and then each of them is visited in turn.
     """
 
     boundPropVals = []
     bpvParents    = []
 
-    if node is None:
-        node = self
-
-    # A recursive depth-first search from this
-    # PV through the network of all directly
-    # or indirectly bound PVs.
-    #
     # We use a set of PV ids to make sure
     # that we don't add duplicates to the
     # list of PVs that need to be synced
-    if bpvSet is None:
-        bpvSet = set()
+    bpvSet = set([id(self)])
+
+    def visit(node):
+        bpvs = getattr(node, key) or {}
+        bpvs = [b for b in bpvs.values() if id(b) not in bpvSet]
 
-    bpvs = node.__dict__.get(key, {}).values()
-    bpvs = [b for b in bpvs if b is not self and id(b) not in bpvSet]
+        for b in bpvs:
+            bpvSet.add(id(b))
 
-    for b in bpvs:
-        bpvSet.add(id(b))
+        boundPropVals.extend(bpvs)
+        bpvParents   .extend([node] * len(bpvs))
 
-    boundPropVals.extend(bpvs)
-    bpvParents   .extend([node] * len(bpvs))
+        return iter(bpvs)
 
-    for bpv in bpvs:
-        childBpvs, childBpvps = buildBPVList(self, key, bpv, bpvSet)
+    stack = [visit(self)]
 
-        boundPropVals.extend(childBpvs)
-        bpvParents   .extend(childBpvps)
+    while len(stack) > 0:
+
+        bpv = next(stack[-1], None)
+
+        if bpv is None: stack.pop()
+        else:           stack.append(visit(bpv))
 
     return boundPropVals, bpvParents
 
@@ -757,14 +1285,35 @@ def _sync(self, atts=False, attName=None, attValue=None):
     from . import properties_value
 
     # This PV is already being synced
-    # to some other PV - don't sync back
-    if getattr(self, '_syncing', False):
+    # to some other PV - don't sync back.
+    # When a master PV is synchronised to
+    # a slave PV, it sets this flag on the
+    # slave PV to inhibit the sync.
+    if self._syncing:
         return []
 
     if atts: key = 'boundAttPropVals'
     else:    key = 'boundPropVals'
 
-    boundPropVals, bpvParents = buildBPVList(self, key)
+    component = _getComponent(self, key)
+
+    # Not bound to anything
+    if component is None:
+        return []
+
+    # List PVs are synchronised through
+    # the direct bindings between them, so
+    # we need the parent of each bound PV.
+    # Otherwise we can just use the PVs in
+    # the component, without searching.
+    isList = not atts and isinstance(self,
+                                     properties_value.PropertyValueList)
+
+    if isList:
+        boundPropVals, bpvParents = buildBPVList(self, key)
+    else:
+        boundPropVals = _ComponentMembers(component, self)
+        bpvParents    = None
 
     # Sync all the values that need syncing. Store
     # a ref to each PV which was synced, but not
@@ -795,20 +1344,20 @@ def _sync(self, atts=False, attName=None, attValue=None):
             notifState = bpv.getNotificationState()
             bpv.disableNotification()
 
-            log.debug('Syncing bound property values ({}) '
-                      '{}.{} ({}) - {}.{} ({})'.format(
-                          'attributes: {} = {}'.format(attName, attValue)
-                          if atts else 'values',
-                          self._context.__class__.__name__,
-                          self._name,
-                          id(self._context()),
-                          bpv._context.__class__.__name__,
-                          bpv._name,
-                          id(bpv._context())))
+            if tracing.enabled:
+                log.debug('Syncing bound property values ({}) '
+                          '{}.{} ({}) - {}.{} ({})'.format(
+                              'attributes: {} = {}'.format(attName, attValue)
+                              if atts else 'values',
+                              self._context.__class__.__name__,
+                              self._name,
+                              id(self._context()),
+                              bpv._context.__class__.__name__,
+                              bpv._name,
+                              id(bpv._context())))
 
             # Normal PropertyValue object (i.e. not a PropertyValueList)
-            if atts or \
-               not isinstance(self, properties_value.PropertyValueList):
+            if not isList:
 
                 # Store a reference to this PV
                 changedPropVals.append((bpv, None))
@@ -830,7 +1379,12 @@ def _sync(self, atts=False, attName=None, attValue=None):
             # store a reference ot the PV list,
             # and to all list items that changed
             else:
-                listItems = _syncPropValLists(bpvParents[i], bpv)
+                # All of the lists are in sync, so the
+                # change on this list describes the
+                # change to be applied to every list.
+                listItems = _syncPropValLists(bpvParents[i],
+                                              bpv,
+                                              self._listChanges)
                 changedPropVals.append((bpv, listItems))
 
             # Restore the notification state
@@ -863,56 +1417,58 @@ def _callAllListeners(propVals, att, name=None, value=None):
     queued = []
     q      = properties_value.PropertyValue.queue
 
+    # Every PV in a bound network is in
+    # sync, so the change which is being
+    # notified on the first PV applies to
+    # all of them - see _getChanges below
+    rootChanges = []
+
     # Hold the queue to inhibit any callbacks which
     # are triggered by immediate listener calls
     q.hold()
 
-    # Get the function from a
-    # properties_value.Listener
-    # instance.
-    def getFunc(listener):
-        func = listener.function
+    # Note that if a bound PV is an item in a
+    # PV list, we don't need to call the list
+    # listeners here - the item PV will have
+    # notified its list (see PropertyValueList.
+    # _listPVChanged) when its value was synced.
+    # Or, if the item belongs to a bound list,
+    # the list will be in propVals. This ensures
+    # that there is exactly one list-level
+    # notification for each change.
+    try:
+        for pv in propVals:
 
-        if isinstance(func, weakfuncref.WeakFunctionRef):
-            func = func.function()
+            listeners, args = pv.prepareListeners(att, name, value)
 
-        return func
+            for l in listeners:
 
-    try:
-        for i, pv in enumerate(propVals):
+                # The listener may have been removed/disabled
+                # due to another immediate listener
+                if not l.enabled:
+                    continue
 
-            cListeners, cArgs = pv.prepareListeners(att, name, value)
+                # Give the listener a record of
+                # the change, if it wants one
+                if l.changes is not None:
+                    l.changes.extend(_getChanges(propVals, rootChanges))
 
-            # If a bound PV is an item in a PV list,
-            # then the listeners on the owning PV list
-            # need to be called as well. We skip
-            # the first PV in the propVals list, as it
-            # is the source of the change.
-            if (i > 0) and (not att) and (pv.getParent() is not None):
-                pListeners, pArgs = pv.getParent().prepareListeners(False)
-            else:
-                pListeners = []
-                pArgs      = None
-
-            for listeners, args in [(cListeners, cArgs), (pListeners, pArgs)]:
+                # Call the listener function directly
+                if l.immediate:
 
-                for l in listeners:
+                    func = _getListenerFunction(l)
 
-                    # The listener may have been removed/disabled
-                    # due to another immediate listener
-                    if not l.enabled:
+                    if func is None:
                         continue
 
-                    # Call the listener function directly
-                    if l.immediate:
-
+                    if tracing.enabled:
                         log.debug('Calling immediate mode '
                                   'listener {}'.format(l.name))
-                        getFunc(l)(*args)
+                    func(*args)
 
-                    # Or add it to the queue
-                    else:
-                        queued.append((l, args))
+                # Or add it to the queue
+                else:
+                    queued.append((l, args))
 
     # Make sure the queue is freed
     finally:
@@ -922,14 +1478,14 @@ def _callAllListeners(propVals, att, name=None, value=None):
     # as the result of the execution of another
     # listener, so we only want to re-queue the ones
     # that are still active.
-    queued = [(getFunc(l), l.makeQueueName(), a, {})
+    queued = [(_getListenerFunction(l), l.queueName, a, {}, l.priority, [l])
               for l, a in queued
               if l.enabled]
 
     # Some listeners referred to by weakrefs
     # may have been GC-d, in which case the
     # function reference will be None
-    queued = [(f, n, a, kw) for f, n, a, kw in queued if f is not None]
+    queued = [q for q in queued if q[0] is not None]
 
     # Append any held functions on to the
     # end of the call list, so they are
@@ -937,3 +1493,39 @@ def _callAllListeners(propVals, att, name=None, value=None):
     # for the original property value change
     held = q.clearHeld()
     q.callAll(queued + held)
+
+
+def _getListenerFunction(listener):
+    """Used by :func:`_callAllListeners`. Returns the function to be called
+    for the given :class:`.Listener`, or ``None`` if its function has been
+    garbage-collected.
+    """
+
+    func = listener.getFunction()
+
+    if func is not None and listener.changes is not None:
+        func = listener.callWithChanges
+
+    return func
+
+
+def _getChanges(propVals, rootChanges):
+    """Used by :func:`_callAllListeners`. Returns a list of records
+    describing the change that is being notified (see
+    :meth:`.PropertyValue._getChanges`).
+
+    :arg propVals:    The ``PropertyValue`` instances being notified. The
+                      first one is the source of the change.
+    :arg rootChanges: A list used to cache the change records.
+    """
+
+    from . import properties_value
+
+    if len(rootChanges) == 0:
+        root = propVals[0]
+        if root._changeRecords:
+            rootChanges.append(root._getChanges())
+        else:
+            rootChanges.append([properties_value.ListChange('reset', None)])
+
+    return rootChanges[0]
@@ -11,26 +11,50 @@ callback functions.
 
 
 import logging
+import collections
 
-import six.moves.queue as queue
+import six
 
 import fsl.utils.idle  as idle
 
+from . import tracing
+
 
 log = logging.getLogger(__name__)
 
 
+IDLE = float('-inf')
+"""Priority of the idle lane - see :class:`CallQueue`. """
+
+
 class Call(object):
     """A little class which is used to represent function calls that are
     on the queue.
     """
 
-    def __init__(self, func, name, args, kwargs):
-        self.func    = func
-        self.name    = name
-        self.args    = args
-        self.kwargs  = kwargs
-        self.execute = True
+    __slots__ = ('func',
+                 'name',
+                 'args',
+                 'kwargs',
+                 'priority',
+                 'owners',
+                 'execute')
+
+
+    def __init__(self, func, name, args, kwargs, priority=0, owners=None):
+        self.func     = func
+        self.name     = name
+        self.args     = args
+        self.kwargs   = kwargs
+        self.priority = priority
+        self.owners   = owners
+        self.execute  = True
+
+        # The owners attribute is either None,
+        # or a list of objects on whose behalf
+        # the call was enqueued - when calls
+        # are coalesced, their owners are
+        # combined. See CallQueue.dequeue.
 
         # The CallQueue.dequeue method sets the
         # above execute attribute to False for
@@ -44,13 +68,25 @@ class CallQueue(object):
     the :meth:`call` or :meth:`callAll` methods.
     """
 
-    def __init__(self, skipDuplicates=False):
+    def __init__(self, skipDuplicates=False, threadSafe=True, coalesce=False):
         """Create a ``CallQueue`` instance.
 
         If ``skipDuplicates`` is ``True``, a function which is already on
         the queue will be silently dropped if an attempt is made to add it
         again.
 
+        If ``coalesce`` is ``True``, and a function which is already on the
+        queue is added again, the arguments of the pending call are replaced
+        with the new arguments, and it keeps its position in the queue. This
+        means that a burst of calls to the same function will result in a
+        single call, with the most recent arguments. ``coalesce`` takes
+        precedence over ``skipDuplicates``.
+
+        If ``threadSafe`` is ``False``, the ``CallQueue`` does not use any
+        locks to protect its internal state, and must only be used from a
+        single thread. This can be changed later on via the
+        :meth:`setThreadSafe` method.
+
           .. note::
 
              The ``skipDuplicates`` test is based solely on the name of the
@@ -73,7 +109,9 @@ class CallQueue(object):
                  be expensive.
 
              So this is quite a pickle. Something to come back to if things
-             are breaking because of it.
+             are breaking because of it. In the meantime, the ``coalesce``
+             option sidesteps the problem by always using the most
+             recent arguments.
 
 
         **Holding the queue**
@@ -87,16 +125,41 @@ class CallQueue(object):
         also clears the internal queue of held functions). Once the queue
         has been released, these held functions can be re-queued as normal
         via the :meth:`call` or :meth:`callAll` methods.
+
+
+        **Priority lanes**
+
+
+        Every call has an integer priority (``0`` by default), and calls
+        with the same priority are placed in the same lane. Lanes are drained
+        in priority order, so a call with a higher priority is executed
+        before all pending calls with a lower priority, regardless of when it
+        was enqueued. Calls within a lane are executed in the order that they
+        were enqueued.
+
+        Calls which are given the priority :data:`IDLE` are placed in the
+        lowest, idle, lane. These calls are only executed when no other calls
+        are pending, and are always coalesced (as described for the
+        ``coalesce`` option above).
         """
 
-        # The queue is a queue of Call instances
+        # The lanes dict contains mappings of
+        # {priority : deque of Call instances},
+        # and the priorities list contains
+        # all of the lane priorities in
+        # descending order.
         #
         # The queued dict contains mappings of
-        # {name : [List of Call instances]}
+        # {name : deque of Call instances}, in
+        # the order that they were enqueued, so
+        # that duplicates can be detected, and
+        # calls looked up by name, in O(1) time.
         #
-        self.__queue          = queue.Queue()
+        self.__lanes          = {}
+        self.__priorities     = []
         self.__queued         = {}
         self.__skipDuplicates = skipDuplicates
+        self.__coalesce       = coalesce
         self.__calling        = False
 
 
@@ -107,37 +170,114 @@ class CallQueue(object):
 
 
         # If the queue is being held, enqueued
-        # functions are added to this list
+        # functions are added to this list,
+        # and also to the heldNames dict of
+        # {name : [List of Call instances]}
         self.__held           = []
+        self.__heldNames      = {}
+
+        self.__threadSafe     = True
+        self.setThreadSafe(threadSafe)
+
+
+    def isThreadSafe(self):
+        """Returns ``True`` if this ``CallQueue`` uses locks to protect its
+        internal state, ``False`` otherwise.
+        """
+        return self.__threadSafe
+
+
+    def setThreadSafe(self, threadSafe):
+        """Enables or disables the locks which protect the internal state of
+        this ``CallQueue``. If ``threadSafe`` is ``False``, this
+        ``CallQueue`` must only be used from a single thread.
+
+        This method must not be called while the queue is in use by another
+        thread.
+        """
+
+        # The idle.mutex decorator replaces
+        # the decorated methods on each
+        # instance with a locking wrapper
+        # when they are first accessed. A
+        # single-threaded queue bypasses
+        # this by using the undecorated
+        # methods directly, and a
+        # thread-safe queue by removing
+        # them again.
+        for name in ['dequeue',
+                     'hold',
+                     'release',
+                     'clearHeld',
+                     '_CallQueue__push',
+                     '_CallQueue__pop']:
+            if threadSafe:
+                self.__dict__.pop(name, None)
+            else:
+                func = getattr(CallQueue, name)
+                setattr(self, name, six.create_bound_method(func, self))
+
+        self.__threadSafe = threadSafe
 
 
     @idle.mutex
-    def dequeue(self, name):
+    def dequeue(self, name, owner=None):
         """If the specified function is on the queue, it is (effectively)
         dequeued, and not executed.
 
+        If an ``owner`` is specified, only calls which were enqueued on
+        behalf of that owner (see :meth:`callAll`) are affected - the owner
+        is removed from each of them, and they are only dequeued when they
+        have no other owners.
+
         If ``skipDuplicates`` is ``False``, and more than one function of
         the same name is enqueued, they are all dequeued.
         """
 
         # Get all calls with the specified name
-        calls = self.__queued.get(name, [])
+        calls = self.__queued   .get(name, ())
+        held  = self.__heldNames.get(name, ())
 
         # Set each of their execute flags to
         # False - the __call method will skip
-        # over Call instances with execute=False
+        # over Call instances with execute=False.
+        # The calls are left in the queue, so
+        # that the skipDuplicates test still
+        # applies until they have been popped.
         for call in calls:
-
-            self.__debug(call, 'Dequeueing function', 'from queue')
-            call.execute = False
+            if self.__disown(call, owner):
+                if tracing.enabled:
+                    self.__debug(call, 'Dequeueing function', 'from queue')
+                call.execute = False
 
         # Check the held queue as well
-        for call in self.__held:
-            if call.name == name:
-                self.__debug(call, 'Dequeueing held function', 'from queue')
+        for call in held:
+            if self.__disown(call, owner):
+                if tracing.enabled:
+                    self.__debug(call, 'Dequeueing held function',
+                                 'from queue')
                 call.execute = False
 
 
+    def __disown(self, call, owner):
+        """Used by :meth:`dequeue`. Removes the given ``owner`` from the
+        given ``Call``. Returns ``True`` if the call should be dequeued,
+        ``False`` otherwise.
+        """
+
+        if owner is None:
+            return True
+
+        owners = call.owners
+
+        if owners is None or owner not in owners:
+            return False
+
+        owners.remove(owner)
+
+        return len(owners) == 0
+
+
     def call(self, func, name, *args, **kwargs):
         """Enqueues the given function, and calls all functions in the queue
 
@@ -157,7 +297,11 @@ class CallQueue(object):
         being called from the queue).
 
         Assumes that the given ``funcs`` parameter is a list of
-        ``(function, name, args, kwargs)`` tuples.
+        ``(function, name, args, kwargs)`` tuples,
+        ``(function, name, args, kwargs, priority)`` tuples, or
+        ``(function, name, args, kwargs, priority, owners)`` tuples, where
+        ``owners`` is a list of the objects on whose behalf the function is
+        being called (see :meth:`dequeue`), or ``None``.
         """
 
         anyEnqueued = False
@@ -186,14 +330,19 @@ class CallQueue(object):
 
     @idle.mutex
     def clearHeld(self):
-        """Clears and returns the list of held functions. """
+        """Clears and returns the list of held functions, as
+        ``(function, name, args, kwargs, priority, owners)`` tuples.
+        """
 
         if self.__holding > 0:
             return []
 
-        held = self.__held
-        self.__held = []
-        return [(c.func, c.name, c.args, c.kwargs) for c in held if c.execute]
+        held             = self.__held
+        self.__held      = []
+        self.__heldNames = {}
+        return [(c.func, c.name, c.args, c.kwargs, c.priority, c.owners)
+                for c in held
+                if c.execute]
 
 
     def __call(self):
@@ -209,26 +358,27 @@ class CallQueue(object):
 
         while True:
 
-            try:
-                call = self.__pop()
+            call = self.__pop()
 
-                if not call.execute:
+            if call is None:
+                break
+
+            if not call.execute:
+                if tracing.enabled:
                     self.__debug(call, 'Skipping dequeued function')
-                    continue
+                continue
 
+            if tracing.enabled:
                 self.__debug(call, 'Calling function')
 
-                try:
-                    call.func(*call.args, **call.kwargs)
-
-                except Exception as e:
-                    import traceback
-                    log.warning('Function {} raised exception: {}'.format(
-                        call.name, e), exc_info=True)
-                    traceback.print_stack()
+            try:
+                call.func(*call.args, **call.kwargs)
 
-            except queue.Empty:
-                break
+            except Exception as e:
+                import traceback
+                log.warning('Function {} raised exception: {}'.format(
+                    call.name, e), exc_info=True)
+                traceback.print_stack()
 
         self.__calling = False
 
@@ -247,23 +397,90 @@ class CallQueue(object):
         Otherwise, this method returnes ``True``.
         """
 
-        enqueued = self.__queued.get(call.name, [])
+        name     = call.name
+        coalesce = self.__coalesce or call.priority == IDLE
 
         if self.__holding > 0:
-            self.__debug(call, 'Holding function')
+
+            held = self.__heldNames.get(name)
+
+            if coalesce and self.__replace(held, call):
+                if tracing.enabled:
+                    self.__debug(call, 'Coalescing held function')
+                return False
+
+            if tracing.enabled:
+                self.__debug(call, 'Holding function')
             self.__held.append(call)
+            if held is None: self.__heldNames[name] = [call]
+            else:            held.append(call)
             return False
 
+        enqueued = self.__queued.get(name)
+
+        # Replace the arguments of the pending
+        # call if there is one, rather than
+        # enqueueing a new call.
+        if coalesce:
+            if self.__replace(enqueued, call):
+                if tracing.enabled:
+                    self.__debug(call, 'Coalescing function')
+                return False
+
         # Skip this function if there are already
         # functions in the queue with the same name
-        if self.__skipDuplicates and (len(enqueued) > 0):
-            self.__debug(call, 'Skipping function')
+        elif enqueued is not None and self.__skipDuplicates:
+            if tracing.enabled:
+                self.__debug(call, 'Skipping function')
             return False
 
-        self.__debug(call, 'Queueing function', 'to queue')
+        if tracing.enabled:
+            self.__debug(call, 'Queueing function', 'to queue')
+
+        lane = self.__lanes.get(call.priority)
 
-        self.__queue.put_nowait(call)
-        self.__queued[call.name] = enqueued + [call]
+        if lane is None:
+            lane = collections.deque()
+            self.__lanes[call.priority] = lane
+            self.__priorities.append(call.priority)
+            self.__priorities.sort(reverse=True)
+
+        lane.append(call)
+
+        if enqueued is None: self.__queued[name] = collections.deque((call,))
+        else:                enqueued.append(call)
+
+        return True
+
+
+    def __replace(self, pending, call):
+        """Used by :meth:`__push` when ``coalesce`` is ``True``. If the most
+        recent of the given ``pending`` calls is still to be executed, its
+        function and arguments are replaced with those of the given ``call``,
+        the owners of the given ``call`` are added to it, and ``True`` is
+        returned. Otherwise ``False`` is returned.
+        """
+
+        if not pending:
+            return False
+
+        last = pending[-1]
+
+        if not last.execute:
+            return False
+
+        last.func   = call.func
+        last.args   = call.args
+        last.kwargs = call.kwargs
+
+        # A call with no owners can
+        # only be dequeued by name
+        if last.owners is None or call.owners is None:
+            last.owners = None
+        else:
+            for owner in call.owners:
+                if owner not in last.owners:
+                    last.owners.append(owner)
 
         return True
 
@@ -271,18 +488,30 @@ class CallQueue(object):
     @idle.mutex
     def __pop(self):
         """Pops the next function from the queue and returns the ``Call``
-        instance which encapsulates it.
+        instance which encapsulates it, or ``None`` if the queue is empty.
         """
 
-        call     = self.__queue.get_nowait()
+        call = None
+
+        for priority in self.__priorities:
+            lane = self.__lanes[priority]
+            if len(lane) > 0:
+                call = lane.popleft()
+                break
+
+        if call is None:
+            return None
+
         enqueued = self.__queued[call.name]
 
-        # TODO shouldn't the call always
-        # be at the end of the list?
-        #
-        # This will be a little bit faster
-        # if you remove the call by index.
-        enqueued.remove(call)
+        # Calls within a lane are popped in the
+        # order that they were pushed, so the
+        # call will be at the front of the list
+        # of calls with the same name, unless
+        # calls with the same name have been
+        # enqueued with different priorities.
+        if enqueued[0] is call: enqueued.popleft()
+        else:                   enqueued.remove(call)
 
         if len(enqueued) == 0:
             self.__queued.pop(call.name)
@@ -293,7 +522,7 @@ class CallQueue(object):
     def __debug(self, call, prefix, postfix=None):
         """Prints a standardised log message."""
 
-        if log.getEffectiveLevel() != logging.DEBUG:
+        if not tracing.enabled:
             return
 
         funcName, modName = self.__getCallbackDetails(call.func)
@@ -307,7 +536,7 @@ class CallQueue(object):
             modName,
             funcName,
             postfix,
-            self.__queue.qsize()))
+            sum([len(lane) for lane in self.__lanes.values()])))
 
 
     def __getCallbackDetails(self, cb):
@@ -317,9 +546,6 @@ class CallQueue(object):
 
         import inspect
 
-        if log.getEffectiveLevel() != logging.DEBUG:
-            return '', ''
-
         members = inspect.getmembers(cb)
 
         funcName  = ''
@@ -21,6 +21,8 @@ application code.
 
 import weakref
 import logging
+import contextlib
+import collections
 
 import six
 import deprecation
@@ -28,6 +30,7 @@ import deprecation
 from . import properties_value
 from . import bindable
 from . import serialise
+from . import tracing
 
 
 log = logging.getLogger(__name__)
@@ -39,6 +42,9 @@ class _InstanceData(object):
     instance and the associated :class:`.PropertyValue` instance.
     """
 
+    __slots__ = ('instance', 'propVal')
+
+
     def __init__(self, instance, propVal):
         self.instance = weakref.ref(instance)
         self.propVal  = propVal
@@ -80,12 +86,29 @@ class PropertyBase(object):
         (see the :class:`.Boolean` property for an example).
     """
 
+
+    _dtype = None
+    """``numpy`` data type which can be used to store values of this
+    property type in an array, or ``None`` if property values cannot be
+    stored in a ``numpy`` array. Used by :class:`ListPropertyBase` - see
+    :meth:`.PropertyValueList.asarray`.
+
+    Property types which set a ``_dtype`` must also implement
+    ``castArray`` and ``validateArray`` methods, which are vectorised
+    versions of :meth:`cast` and :meth:`validate`, accepting and
+    returning ``numpy`` arrays (see the :class:`.Number` class). These
+    are used by :class:`.PropertyValueList` instances to cast and
+    validate many list items at once.
+    """
+
+
     def __init__(self,
                  default=None,
                  validateFunc=None,
                  equalityFunc=None,
                  required=False,
                  allowInvalid=True,
+                 retainLast='full',
                  **atts):
         """Define a ``PropertyBase`` property.
 
@@ -114,6 +137,18 @@ class PropertyBase(object):
                               invalid - see caveats in the
                               :class:`.PropertyValue` documentation.
 
+        :param retainLast:    Whether the previous value of this property is
+                              retained, so that it can be returned by
+                              :meth:`HasProperties.getLastValue` - one of
+                              ``'full'``, ``'weak'``, or ``'none'``. See the
+                              :meth:`.PropertyValue.__init__` method. The
+                              default is ``'full'``, but types which may
+                              have large values use ``'weak'``
+                              (:class:`.Object` and :class:`.Array`) or
+                              ``'none'`` (:class:`.List`), so that the
+                              previous value can be freed as soon as it is
+                              replaced.
+
         :param atts:          Type specific attributes used to test
                               validity - passed to the
                               :meth:`.PropertyValue.__init__` method as
@@ -132,6 +167,7 @@ class PropertyBase(object):
         self._validateFunc      = validateFunc
         self._equalityFunc      = equalityFunc
         self._allowInvalid      = allowInvalid
+        self._retainLast        = retainLast
         self._defaultAttributes = atts
 
 
@@ -216,8 +252,7 @@ class PropertyBase(object):
 
         See the :meth:`disable` method for more details.
         """
-        propVal = self.getPropVal(instance)
-        return propVal.getAttribute('enabled')
+        return self.getAttribute(instance, 'enabled')
 
 
     def addListener(self, instance, *args, **kwargs):
@@ -234,7 +269,7 @@ class PropertyBase(object):
         """De-register the named listener from the ``PropertyValue`` object
         managed by this property.
         """
-        instData = self._getInstanceData(instance)
+        instData = self._getInstanceData(instance, create=False)
 
         if instData is None: return
         else:                instData.propVal.removeListener(name)
@@ -260,8 +295,12 @@ class PropertyBase(object):
         """Returns the value of the named attribute for the specified
         ``HasProperties`` instance, or the default attribute value if
         instance is ``None``. See :meth:`.PropertiesValue.getAttribute`.
+
+        If the ``PropertyValue`` for the instance has not yet been created
+        (see :attr:`HasProperties._lazyProperties`), the default attribute
+        value is returned.
         """
-        instData  = self._getInstanceData(instance)
+        instData  = self._getInstanceData(instance, create=False)
         nodefault = len(arg) == 0
 
         if instData is None:
@@ -282,11 +321,12 @@ class PropertyBase(object):
 
         if value == oldVal: return
 
-        log.debug('Changing {} attribute on {}: {} = {}'.format(
-            ''        if instance is None else self.getLabel(instance),
-            'default' if instance is None else 'instance',
-            att,
-            value))
+        if tracing.enabled:
+            log.debug('Changing {} attribute on {}: {} = {}'.format(
+                ''        if instance is None else self.getLabel(instance),
+                'default' if instance is None else 'instance',
+                att,
+                value))
 
         if instData is None: self._defaultAttributes[att] = value
         else:                instData.propVal.setAttribute(att, value)
@@ -302,17 +342,30 @@ class PropertyBase(object):
         return instData.propVal
 
 
-    def _getInstanceData(self, instance):
+    def _getInstanceData(self, instance, create=True):
         """Returns the :class:`_InstanceData` object for the given
         ``HasProperties`` instance, or ``None`` if there is no
         ``_InstanceData`` for the given instance. An ``_InstanceData``
         object, which provides a binding between a ``PropertyBase``
         object and a ``HasProperties`` instance, is created by that
         ``HasProperties`` instance when it is created (see
-        :meth:`HasProperties.__new__`).
+        :meth:`HasProperties.__new__`), or on first use if the
+        ``HasProperties`` class uses lazy property values (see
+        :attr:`HasProperties._lazyProperties`).
+
+        :arg create: If ``True`` (the default), and the ``HasProperties``
+                     instance uses lazy property values, the
+                     ``_InstanceData`` is created if it does not exist.
         """
         if instance is None: return None
-        return instance.__dict__.get(self.getLabel(instance), None)
+
+        label    = self.getLabel(instance)
+        instData = instance.__dict__.get(label, None)
+
+        if instData is None and create and label is not None:
+            instData = instance._initLazyProperty(label, self)
+
+        return instData
 
 
     def _makePropVal(self, instance):
@@ -327,6 +380,7 @@ class PropertyBase(object):
                                               validateFunc=self.validate,
                                               equalityFunc=self._equalityFunc,
                                               allowInvalid=self._allowInvalid,
+                                              retainLast=self._retainLast,
                                               **self._defaultAttributes)
 
 
@@ -408,13 +462,36 @@ class PropertyBase(object):
         returns this ``PropertyBase`` object. Otherwise, returns the value
         contained in the ``PropertyValue`` object which is attached to the
         instance.
+
+        If the ``PropertyValue`` for the instance has not yet been created
+        (see :attr:`HasProperties._lazyProperties`), the default value is
+        returned, via the :meth:`HasProperties._getLazyDefault` method.
         """
 
         if instance is None:
             return self
 
-        instData = self._getInstanceData(instance)
-        return instData.propVal.get()
+        instData = self._getInstanceData(instance, create=False)
+
+        if instData is None:
+            return instance._getLazyDefault(self.getLabel(instance), self)
+        else:
+            return instData.propVal.get()
+
+
+    def _getLazyDefault(self, instance):
+        """Called by :meth:`HasProperties._getLazyDefault` when the value of
+        this property is read from a ``HasProperties`` instance which has not
+        yet created a ``PropertyValue`` for it (see
+        :attr:`HasProperties._lazyProperties`).
+
+        Returns the default value, passed through :meth:`cast`. Property
+        types with mutable values (e.g. :class:`ListPropertyBase`), for
+        which the ``PropertyValue`` itself is returned, must override this
+        method to create the ``PropertyValue``.
+        """
+        default = self._defaultAttributes.get('default', None)
+        return self.cast(instance, self._defaultAttributes, default)
 
 
     def __set__(self, instance, value):
@@ -450,6 +527,14 @@ class ListPropertyBase(PropertyBase):
         self._listType = listType
 
 
+    def _getLazyDefault(self, instance):
+        """Overrides :meth:`PropertyBase._getLazyDefault`. List property
+        values are mutable, so the ``PropertyValueList`` is created and
+        returned.
+        """
+        return self.getPropVal(instance).get()
+
+
     def getListType(self):
         """Returns a reference to the ``PropertyBase`` instance which defines
         the value types allowsed in this ``ListPropertyBase``. This may be
@@ -469,12 +554,21 @@ class ListPropertyBase(PropertyBase):
             itemEqualityFunc = self._listType._equalityFunc
             itemAllowInvalid = self._listType._allowInvalid
             itemAttributes   = self._listType._defaultAttributes
+            itemDtype        = self._listType._dtype
         else:
             itemCastFunc     = None
             itemValidateFunc = None
             itemEqualityFunc = None
             itemAllowInvalid = True
             itemAttributes   = None
+            itemDtype        = None
+
+        if itemDtype is not None:
+            itemCastArrayFunc     = self._listType.castArray
+            itemValidateArrayFunc = self._listType.validateArray
+        else:
+            itemCastArrayFunc     = None
+            itemValidateArrayFunc = None
 
         default = self._defaultAttributes.get('default', None)
 
@@ -488,7 +582,11 @@ class ListPropertyBase(PropertyBase):
             listValidateFunc=self.validate,
             itemAllowInvalid=itemAllowInvalid,
             listAttributes=self._defaultAttributes,
-            itemAttributes=itemAttributes)
+            itemAttributes=itemAttributes,
+            itemDtype=itemDtype,
+            itemCastArrayFunc=itemCastArrayFunc,
+            itemValidateArrayFunc=itemValidateArrayFunc,
+            retainLast=self._retainLast)
 
 
     def enableItem(self, instance, index):
@@ -524,6 +622,16 @@ class ListPropertyBase(PropertyBase):
 class PropertyOwner(type):
     """Metaclass for the ``HasProperties`` class. Sets ``PropertyBase``
     labels from the corresponding class attribute names.
+
+    The ``PropertyOwner`` also maintains a per-class property registry,
+    which contains the names and ``PropertyBase`` objects of all properties
+    of the class (including those inherited from super classes), sorted by
+    name. The registry is used by :meth:`HasProperties.__new__` and
+    :meth:`HasProperties.getAllProperties`, so that these methods do not
+    have to search through the entire class namespace. The registry is
+    discarded whenever a ``PropertyBase`` attribute is added to or removed
+    from a class (e.g. by :meth:`HasProperties.addProperty`), and re-built
+    on next access.
     """
     def __new__(cls, name, bases, attrs):
 
@@ -542,9 +650,85 @@ class PropertyOwner(type):
             if isinstance(v, PropertyBase):
                 v._setLabel(newCls, n)
 
+        newCls._getPropertyRegistry()
+
         return newCls
 
 
+    def __setattr__(cls, name, value):
+        """Sets the given class attribute. If the old or new value is a
+        ``PropertyBase``, the property registry of the class, and of all
+        of its sub-classes, is invalidated.
+        """
+        old = cls.__dict__.get(name, None)
+        type.__setattr__(cls, name, value)
+        if isinstance(value, PropertyBase) or isinstance(old, PropertyBase):
+            cls._invalidatePropertyRegistry()
+
+
+    def __delattr__(cls, name):
+        """Deletes the given class attribute. If it is a ``PropertyBase``,
+        the property registry of the class, and of all of its sub-classes,
+        is invalidated.
+        """
+        old = cls.__dict__.get(name, None)
+        type.__delattr__(cls, name)
+        if isinstance(old, PropertyBase):
+            cls._invalidatePropertyRegistry()
+
+
+    def _getPropertyRegistry(cls):
+        """Returns the property registry for this class, building it if
+        necessary. The registry is a tuple containing:
+
+          - A list of the names of all properties of the class, sorted
+            by name.
+          - A list of the corresponding ``PropertyBase`` objects.
+          - A list of the names of all properties which do not begin
+            with an underscore.
+          - A list of the corresponding ``PropertyBase`` objects.
+
+        The returned lists must not be modified.
+        """
+
+        registry = cls.__dict__.get('_PropertyOwner__registry', None)
+
+        if registry is not None:
+            return registry
+
+        # Resolve attributes in the same way that
+        # getattr would - attributes of sub-classes
+        # override those of their super-classes
+        atts = {}
+        for klass in reversed(cls.__mro__):
+            atts.update(klass.__dict__)
+
+        propNames = sorted([n for n, v in atts.items()
+                            if isinstance(v, PropertyBase)])
+        props     = [atts[n] for n in propNames]
+        pubNames  = [n for n in propNames if not n.startswith('_')]
+        pubProps  = [atts[n] for n in pubNames]
+        registry  = (propNames, props, pubNames, pubProps)
+
+        type.__setattr__(cls, '_PropertyOwner__registry', registry)
+
+        return registry
+
+
+    def _invalidatePropertyRegistry(cls):
+        """Discards the property registry of this class, and of all of its
+        sub-classes.
+        """
+
+        classes = [cls]
+
+        while len(classes) > 0:
+            klass = classes.pop()
+            if '_PropertyOwner__registry' in klass.__dict__:
+                type.__delattr__(klass, '_PropertyOwner__registry')
+            classes.extend(type.__subclasses__(klass))
+
+
 class HasProperties(six.with_metaclass(PropertyOwner, object)):
     """Base class for classes which contain ``PropertyBase`` instances.  All
     classes which contain ``PropertyBase`` objects must subclass this
@@ -552,14 +736,31 @@ class HasProperties(six.with_metaclass(PropertyOwner, object)):
     """
 
 
+    _lazyProperties = False
+    """Sub-classes may set this to ``True`` to enable lazy creation of
+    property values. By default, a :class:`.PropertyValue` is created for
+    every property when a ``HasProperties`` instance is created. If
+    ``_lazyProperties`` is ``True``, the ``PropertyValue`` for a property is
+    not created until it is needed - i.e. when the property is assigned,
+    bound, or has a listener registered on it, or when its
+    ``PropertyValue`` is accessed. Until then, reading the property
+    returns its default value.
+
+    .. note:: A lazily created ``PropertyValue`` is initialised from the
+              default value and attributes of the property at the time
+              that it is created, not at the time that the owning
+              ``HasProperties`` instance was created.
+    """
+
+
     def __new__(cls, *args, **kwargs):
         """Here we create a new ``HasProperties`` instance, and loop
         through all of its ``PropertyBase`` properties to ensure that
         they are initialised.
         """
 
-        instance  = super(HasProperties, cls).__new__(cls)
-        propNames = dir(instance.__class__)
+        instance         = super(HasProperties, cls).__new__(cls)
+        propNames, props = cls._getPropertyRegistry()[:2]
 
         # By default, when a property changes,
         # all other properties are not validated.
@@ -567,15 +768,19 @@ class HasProperties(six.with_metaclass(PropertyOwner, object)):
         # validateOnChange=True to __init__.
         instance.__validateOnChange = False
 
-        for propName in propNames:
+        # Set by the batch method while
+        # a batch update is in progress
+        instance.__batch = None
 
-            prop = getattr(instance.__class__, propName)
-            if not isinstance(prop, PropertyBase): continue
+        # Property values are created on demand
+        if cls._lazyProperties:
+            return instance
 
-            # Add each class level PropertyBase
-            # object as a property of the new
-            # HasProperties instance
-            instance.addProperty(propName, prop)
+        # Add each class level PropertyBase
+        # object as a property of the new
+        # HasProperties instance
+        for propName, prop in zip(propNames, props):
+            instance.__initProperty(propName, prop)
 
         return instance
 
@@ -632,7 +837,7 @@ class HasProperties(six.with_metaclass(PropertyOwner, object)):
         if validateOnChange:
             propNames, props = self.getAllProperties()
 
-            for prop, propName in zip(propNames, props):
+            for propName, prop in zip(propNames, props):
                 propVal = prop.getPropVal(self)
                 propVal.setPreNotifyFunction(self.__valueChanged)
 
@@ -665,6 +870,129 @@ class HasProperties(six.with_metaclass(PropertyOwner, object)):
         return copy
 
 
+    @contextlib.contextmanager
+    def batch(self):
+        """Context manager which may be used to change the values of many
+        properties at once, with a single round of notification at the end.
+
+        Within the ``with`` block, property values are still cast and
+        validated as normal, but synchronisation to bound property values,
+        and notification of listeners, is deferred. When the block exits,
+        every property which changed is synchronised and notified once,
+        with its final value, and each listener is called once::
+
+            with hasProps.batch():
+                hasProps.prop1 = 'abc'
+                hasProps.prop2 = 123
+                hasProps.prop1 = 'def'
+
+        Calls to ``batch`` may be nested - notification occurs when the
+        outermost block exits.
+
+        .. note:: Changes to individual items of a list property are
+                  not deferred, but list-level listeners are only
+                  notified once, when the block exits.
+
+        .. note:: If an error is raised within the ``with`` block, the
+                  deferred notifications are discarded - any values
+                  which were set before the error are retained, and
+                  are synchronised to bound property values, but
+                  listeners are not notified of them. The error is
+                  propagated to the caller.
+        """
+
+        # Nested call - the outermost
+        # call will do the notification
+        if self.__batch is not None:
+            yield
+            return
+
+        deferred     = collections.OrderedDict()
+        self.__batch = deferred
+
+        for propVal in self.__getPropVals():
+            propVal._batch = deferred
+
+        try:
+            yield
+
+        # Bound property values must stay
+        # consistent, even if listeners
+        # are not notified
+        except Exception:
+            self.__endBatch()
+            for propVal in deferred.values():
+                bindable.syncOnly(propVal)
+            raise
+
+        self.__endBatch()
+        self.__notifyBatch(list(deferred.values()))
+
+
+    def __endBatch(self):
+        """Used by :meth:`batch`. Removes all :class:`.PropertyValue`
+        instances from the current batch update.
+        """
+
+        self.__batch = None
+
+        for propVal in self.__getPropVals():
+            propVal._batch = None
+
+
+    def update(self, **values):
+        """Sets the values of the given properties in a single batch - see
+        :meth:`batch`.
+
+        :arg values: ``name=value`` pairs, containing new values for the
+                     properties of this ``HasProperties`` instance.
+        """
+
+        with self.batch():
+            for name, value in values.items():
+                setattr(self, name, value)
+
+
+    def __getPropVals(self):
+        """Used by :meth:`batch`. Returns a list containing all of the
+        :class:`.PropertyValue` instances which have been created for this
+        ``HasProperties`` instance.
+        """
+
+        propVals = []
+        for propName in type(self)._getPropertyRegistry()[0]:
+            instData = self.__dict__.get(propName, None)
+            if instData is not None:
+                propVals.append(instData.propVal)
+        return propVals
+
+
+    def __notifyBatch(self, propVals):
+        """Used by :meth:`batch`. Synchronises and notifies the given
+        :class:`.PropertyValue` instances.
+
+        All listener calls are collected on the held
+        :attr:`.PropertyValue.queue`, which coalesces duplicate calls, so
+        each listener is only called once, with the most recent arguments,
+        at the position of its first call.
+        """
+
+        if len(propVals) == 0:
+            return
+
+        q = properties_value.PropertyValue.queue
+        q.hold()
+
+        try:
+            for propVal in propVals:
+                propVal.propNotify()
+
+        finally:
+            q.release()
+
+        q.callAll(q.clearHeld())
+
+
     def bindProps(self, *args, **kwargs):
         """See :func:`.bindable.bindProps`. """
         bindable.bindProps(self, *args, **kwargs)
@@ -708,22 +1036,48 @@ class HasProperties(six.with_metaclass(PropertyOwner, object)):
         if propName in self.__dict__:
             return
 
+        self.__initProperty(propName, propObj)
+
+
+    def __initProperty(self, propName, propObj):
+        """Called by :meth:`__new__` and :meth:`addProperty`. Creates a
+        ``PropertyValue`` for the given ``PropertyBase`` object, and
+        attaches it to this ``HasProperties`` instance.
+        """
+
         # Create a PropertyValue and an _InstanceData
         # object, which bind the PropertyBase object
-        # to this HasProperties instance.
-        propVal = propObj._makePropVal(self)
+        # to this HasProperties instance. A placeholder
+        # is stored while the PropertyValue is being
+        # created, to prevent _initLazyProperty from
+        # trying to create it again (e.g. if the
+        # property cast function calls getPropVal).
+        self.__dict__[propName] = None
+
+        try:
+            propVal = propObj._makePropVal(self)
+        except Exception:
+            self.__dict__.pop(propName)
+            raise
+
         instData = _InstanceData(self, propVal)
 
-        log.debug('Adding property to {}.{} [{}] ({})'.format(
-            self.__class__.__name__,
-            propName,
-            id(self),
-            propObj.__class__.__name__))
+        if tracing.enabled:
+            log.debug('Adding property to {}.{} [{}] ({})'.format(
+                self.__class__.__name__,
+                propName,
+                id(self),
+                propObj.__class__.__name__))
 
         # Store the _InstanceData object
         # on this instance itself
         self.__dict__[propName] = instData
 
+        # Property values created during a
+        # batch update are part of the batch
+        if self.__batch is not None:
+            propVal._batch = self.__batch
+
         # validate other properties when
         # this property changes - does
         # nothing if validation is enabled
@@ -731,6 +1085,39 @@ class HasProperties(six.with_metaclass(PropertyOwner, object)):
             propVal.setPreNotifyFunction(self.__valueChanged)
 
 
+    def _initLazyProperty(self, propName, propObj):
+        """Called by :meth:`PropertyBase._getInstanceData` when it cannot
+        find the :class:`_InstanceData` for a property. If this
+        ``HasProperties`` class uses lazy property values (see
+        :attr:`_lazyProperties`), the ``PropertyValue`` for the property is
+        created, and the ``_InstanceData`` returned. Otherwise ``None`` is
+        returned.
+        """
+
+        if not self._lazyProperties:
+            return None
+
+        # The property value is currently
+        # being created, or the property does
+        # not belong to this instance
+        if propName in self.__dict__ or \
+           getattr(type(self), propName, None) is not propObj:
+            return None
+
+        self.__initProperty(propName, propObj)
+        return self.__dict__[propName]
+
+
+    def _getLazyDefault(self, propName, propObj):
+        """Called by :meth:`PropertyBase.__get__` when the value of a property
+        is read before its ``PropertyValue`` has been created (see
+        :attr:`_lazyProperties`). Returns the value given by
+        :meth:`PropertyBase._getLazyDefault`. Sub-classes may override this
+        method to provide a different value.
+        """
+        return propObj._getLazyDefault(self)
+
+
     def __valueChanged(self, ctx, value, valid, name):
         """This method is only called if ``validateOnChange`` was set
         to true in :meth:`__init__`. It is registered as the ``preNotify``
@@ -748,8 +1135,9 @@ class HasProperties(six.with_metaclass(PropertyOwner, object)):
         # the validity of another property, meaning that the listeners of the
         # latter property need to be notified of this change in validity.
 
-        log.debug('Revalidating all instance properties '
-                  '(due to {} change)'.format(name))
+        if tracing.enabled:
+            log.debug('Revalidating all instance properties '
+                      '(due to {} change)'.format(name))
 
         propNames, props = self.getAllProperties()
         for propName, prop in zip(propNames, props):
@@ -767,18 +1155,8 @@ class HasProperties(six.with_metaclass(PropertyOwner, object)):
         returned by this method
         """
 
-        propNames = []
-        props     = []
-
-        for attName in dir(cls):
-
-            att = getattr(cls, attName)
-
-            if isinstance(att, PropertyBase) and (not attName.startswith('_')):
-                propNames.append(attName)
-                props    .append(att)
-
-        return propNames, props
+        propNames, props = cls._getPropertyRegistry()[2:]
+        return list(propNames), list(props)
 
 
     @classmethod
@@ -938,7 +1316,8 @@ class HasProperties(six.with_metaclass(PropertyOwner, object)):
 
     def addListener(self, propName, *args, **kwargs):
         """Convenience method, adds the specified listener to the specified
-        property. See :meth:`PropertyValue.addListener`.
+        property. See :meth:`PropertyValue.addListener`, which describes
+        all arguments, including the optional ``priority``.
         """
         self.getPropVal(propName).addListener(*args, **kwargs)
 
@@ -28,10 +28,13 @@ added as attributes of a :class:`.HasProperties` class definition.
     Bounds
     Point
     Array
+    MappedArray
+    SharedArray
 """
 
 
 import os.path as op
+import weakref
 
 import collections
 
@@ -50,12 +53,17 @@ class Object(props.PropertyBase):
         """Create a ``Object`` property. If an ``equalityFunc`` is not
         provided, any writes to this property will be treated as if the value
         has changed (and any listeners will be notified).
+
+        As ``Object`` values may be arbitrarily large, the previous value is
+        only weakly referenced, unless a different ``retainLast`` policy is
+        provided (see :meth:`.PropertyBase.__init__`).
         """
 
         def defaultEquals(this, other):
             return False
 
         kwargs['equalityFunc'] = kwargs.get('equalityFunc', defaultEquals)
+        kwargs['retainLast']   = kwargs.get('retainLast',   'weak')
         props.PropertyBase.__init__(self, **kwargs)
 
 
@@ -176,9 +184,77 @@ class Number(props.PropertyBase):
         return value
 
 
+    def castArray(self, instance, attributes, values):
+        """Vectorised version of :meth:`cast`, used by
+        :class:`.PropertyValueList` instances to cast many list items at
+        once. Converts the given sequence of values into a new ``numpy``
+        array with this property's data type, and clamps the array values
+        to the ``minval``/``maxval`` limits if the ``clamped`` attribute is
+        ``True``.
+
+        Values which are not numbers (e.g. strings, or ``None``) are passed
+        through :meth:`cast` one at a time, so that the same conversions
+        are performed, and the same errors are raised.
+        """
+
+        array   = np.asarray(values)
+        kind    = array.dtype.kind
+        numeric = array.ndim == 1 and kind in 'biuf'
+
+        # Non-numeric values, and non-finite
+        # values destined for an integer
+        # array, are cast one at a time
+        if numeric and kind == 'f' and np.dtype(self._dtype).kind != 'f':
+            numeric = np.all(np.isfinite(array))
+
+        if not numeric:
+            array = [self.cast(instance, attributes, v) for v in values]
+
+        values = np.array(array, dtype=self._dtype)
+
+        if not attributes['clamped']:
+            return values
+
+        minval = attributes['minval']
+        maxval = attributes['maxval']
+
+        if minval is not None: values[values < minval] = minval
+        if maxval is not None: values[values > maxval] = maxval
+
+        return values
+
+
+    def validateArray(self, instance, attributes, values):
+        """Vectorised version of :meth:`validate`, used by
+        :class:`.PropertyValueList` instances to validate many list items
+        at once. Raises a :exc:`ValueError` if any of the values in the
+        given ``numpy`` array are outside of the ``minval``/``maxval``
+        limits.
+
+        If a custom ``validateFunc`` was provided, it is called on each
+        value in turn.
+        """
+
+        if self._validateFunc is not None:
+            for v in values.tolist():
+                props.PropertyBase.validate(self, instance, attributes, v)
+
+        minval = attributes['minval']
+        maxval = attributes['maxval']
+
+        if minval is not None and np.any(values < minval):
+            raise ValueError('Must be at least {}'.format(minval))
+
+        if maxval is not None and np.any(values > maxval):
+            raise ValueError('Must be at most {}'.format(maxval))
+
+
 class Int(Number):
     """A :class:`Number` which encapsulates an integer."""
 
+    _dtype = np.int64
+
+
     def __init__(self, **kwargs):
         """Create an ``Int`` property. """
         Number.__init__(self, **kwargs)
@@ -194,6 +270,8 @@ class Int(Number):
 class Real(Number):
     """A :class:`.Number` which encapsulates a floating point number."""
 
+    _dtype = np.float64
+
 
     def __equals(self, a, b):
         """Custom equality function passed to :class`.PropertyBase.__init__`.
@@ -716,6 +794,10 @@ class List(props.ListPropertyBase):
     If you use ``List`` properties, you really should read the documentation
     for the :class:`.PropertyValueList`, as it contains important usage
     information.
+
+    By default, the previous value of a ``List`` is not retained (see the
+    ``retainLast`` parameter to :meth:`.PropertyBase.__init__`), as lists
+    may be arbitrarily long, and cannot be weakly referenced.
     """
 
     def __init__(self, listType=None, minlen=None, maxlen=None, **kwargs):
@@ -736,9 +818,10 @@ class List(props.ListPropertyBase):
             raise ValueError(
                 'A list type (a PropertyBase instance) must be specified')
 
-        kwargs['default'] = kwargs.get('default', [])
-        kwargs['minlen']  = minlen
-        kwargs['maxlen']  = maxlen
+        kwargs['default']    = kwargs.get('default',    [])
+        kwargs['retainLast'] = kwargs.get('retainLast', 'none')
+        kwargs['minlen']     = minlen
+        kwargs['maxlen']     = maxlen
 
         # This needs to be removed when you update widgets_list.py
         self.embed = False
@@ -815,14 +898,15 @@ class Colour(props.PropertyBase):
         value (which defaults to ``1.0``).
         """
 
-        pv = self.getPropVal(instance)
-
-        if pv is not None: currentVal = pv.get()
-        else:              currentVal = self.getAttribute(None, 'default')
-
         value = [float(v) for v in value]
 
         if len(value) == 3:
+
+            pv = self.getPropVal(instance)
+
+            if pv is not None: currentVal = pv.get()
+            else:              currentVal = self.getAttribute(None, 'default')
+
             value = value + [currentVal[3]]
 
         value = value[:4]
@@ -1061,24 +1145,24 @@ class BoundsValueList(propvals.PropertyValueList):
 
     def getMin(self, axis):
         """Return the minimum value (the low limit) for the specified axis."""
-        return self.getPropertyValueList()[axis * 2].getAttribute('minval')
+        return self.getPropertyValue(axis * 2).getAttribute('minval')
 
 
     def getMax(self, axis):
         """Return the maximum value (the high limit) for the specified axis."""
-        return self.getPropertyValueList()[axis * 2 + 1].getAttribute('maxval')
+        return self.getPropertyValue(axis * 2 + 1).getAttribute('maxval')
 
 
     def setMin(self, axis, value):
         """Set the minimum value for the specified axis."""
-        self.getPropertyValueList()[axis * 2]    .setAttribute('minval', value)
-        self.getPropertyValueList()[axis * 2 + 1].setAttribute('minval', value)
+        self.getPropertyValue(axis * 2)    .setAttribute('minval', value)
+        self.getPropertyValue(axis * 2 + 1).setAttribute('minval', value)
 
 
     def setMax(self, axis, value):
         """Set the maximum value for the specified axis."""
-        self.getPropertyValueList()[axis * 2]    .setAttribute('maxval', value)
-        self.getPropertyValueList()[axis * 2 + 1].setAttribute('maxval', value)
+        self.getPropertyValue(axis * 2)    .setAttribute('maxval', value)
+        self.getPropertyValue(axis * 2 + 1).setAttribute('maxval', value)
 
 
     def getLimits(self, axis):
@@ -1185,7 +1269,7 @@ class BoundsValueList(propvals.PropertyValueList):
         elif lname == 'ylim': self.setLimits(1, *value)
         elif lname == 'zlim': self.setLimits(2, *value)
         elif lname == 'tlim': self.setLimits(3, *value)
-        else:                 self.__dict__[name] = value
+        else: propvals.PropertyValueList.__setattr__(self, name, value)
 
 
 class Bounds(List):
@@ -1279,7 +1363,11 @@ class Bounds(List):
             itemValidateFunc=self._listType.validate,
             listValidateFunc=self.validate,
             listAttributes=self._defaultAttributes,
-            itemAttributes=self._listType._defaultAttributes)
+            itemAttributes=self._listType._defaultAttributes,
+            itemDtype=self._listType._dtype,
+            itemCastArrayFunc=self._listType.castArray,
+            itemValidateArrayFunc=self._listType.validateArray,
+            retainLast=self._retainLast)
 
         return bvl
 
@@ -1360,12 +1448,12 @@ class PointValueList(propvals.PropertyValueList):
 
     def getMin(self, axis):
         """Get the minimum limit for the specified axis."""
-        return self.getPropertyValueList()[axis].getAttribute('minval')
+        return self.getPropertyValue(axis).getAttribute('minval')
 
 
     def getMax(self, axis):
         """Get the maximum limit for the specified axis."""
-        return self.getPropertyValueList()[axis].getAttribute('maxval')
+        return self.getPropertyValue(axis).getAttribute('maxval')
 
 
     def getLimits(self, axis):
@@ -1375,12 +1463,12 @@ class PointValueList(propvals.PropertyValueList):
 
     def setMin(self, axis, value):
         """Set the minimum limit for the specified axis."""
-        self.getPropertyValueList()[axis].setAttribute('minval', value)
+        self.getPropertyValue(axis).setAttribute('minval', value)
 
 
     def setMax(self, axis, value):
         """Set the maximum limit for the specified axis."""
-        self.getPropertyValueList()[axis].setAttribute('maxval', value)
+        self.getPropertyValue(axis).setAttribute('maxval', value)
 
 
     def setLimits(self, axis, minval, maxval):
@@ -1421,7 +1509,7 @@ class PointValueList(propvals.PropertyValueList):
         lname = name.lower()
 
         if any([dim not in 'xyzt' for dim in lname]):
-            self.__dict__[name] = value
+            propvals.PropertyValueList.__setattr__(self, name, value)
             return
 
         if len(lname) == 1:
@@ -1512,7 +1600,11 @@ class Point(List):
             itemValidateFunc=self._listType.validate,
             listValidateFunc=self.validate,
             listAttributes=self._defaultAttributes,
-            itemAttributes=self._listType._defaultAttributes)
+            itemAttributes=self._listType._defaultAttributes,
+            itemDtype=self._listType._dtype,
+            itemCastArrayFunc=self._listType.castArray,
+            itemValidateArrayFunc=self._listType.validateArray,
+            retainLast=self._retainLast)
 
         return pvl
 
@@ -1536,21 +1628,101 @@ class ArrayProxy(propvals.PropertyValue):
 
     The underlying ``numpy`` array is accessible via the :meth:`getArray`
     method. However, changes made directly to the numpy array will
-    bypass the :class:`.PropertyValue` notification procedure.
+    bypass the :class:`.PropertyValue` notification procedure, unless
+    the :meth:`update` method is subsequently called.
+
+
+    Element assignments are performed in place - the array is not re-cast,
+    re-validated, or compared against its previous value, as an element
+    assignment cannot change its data type or shape.
+
+
+    **Dirty regions**
+
+
+    The ``ArrayProxy`` keeps track of the regions of the array which have
+    been written to since listeners were last notified. Listeners which are
+    registered with ``changes=True`` (see :meth:`.PropertyValue.addListener`)
+    are passed a list of these regions, each of which is a tuple of
+    ``slice`` objects (one for each array dimension, with a step of 1),
+    describing the bounding box of an assignment. For example, after::
+
+        proxy[3, :, 2:4] = 0
+        proxy[4, 0, 0]   = 1
+
+    a listener for a ``(10, 10, 10)`` array would be passed::
+
+        [(slice(3, 4), slice(0, 10), slice(2, 4)),
+         (slice(4, 5), slice(0, 1),  slice(0, 1))]
+
+    When a new array is assigned, the region covers the entire array. The
+    :meth:`boundingBox` method can be used to combine a list of regions.
+
+
+    **Versions**
+
+
+    Comparing two arrays requires every element of both arrays to be read,
+    so the ``ArrayProxy`` does not compare arrays to detect changes.
+    Instead, it maintains a version number (see :meth:`getVersion`), which
+    is incremented whenever listeners are notified of a change - i.e. on
+    every assignment through the ``ArrayProxy``, and whenever a different
+    array is assigned, even if it contains the same values. Re-assigning
+    the ``ArrayProxy`` to itself, or re-validating the array (e.g. when an
+    attribute is changed), does not result in notification. The version
+    number may be used by listeners to cache data derived from the array.
+
+
+    By default, two different ``ArrayProxy`` instances are never considered
+    to be equal. Comparing an ``ArrayProxy`` to any other value results in
+    an element-wise comparison of the array and the value.
     """
 
 
+    _changeRecords = True
+
+
+    _broadcast = False
+
+
+    __slots__ = ('__dirty', '__version')
+
+
     def __init__(self, *args, **kwargs):
         """Create an ``ArrayProxy``. All arguments are passed through to the
         :meth:`.PropertyValue.__init__` method.
         """
 
         def defaultEquals(this, other):
-            if isinstance(this,  ArrayProxy): this  = this .getArray()
-            if isinstance(other, ArrayProxy): other = other.getArray()
+
+            if this is other:
+                return True
+
+            thisProxy  = isinstance(this,  ArrayProxy)
+            otherProxy = isinstance(other, ArrayProxy)
+
+            # Different ArrayProxy instances are never equal
+            if thisProxy and otherProxy:
+                return False
+
+            # An array which has been replaced by a different
+            # array is assumed to have changed (this is the
+            # comparison made by PropertyValue.set)
+            if not (thisProxy or otherProxy):
+                return False
+
+            if thisProxy:  this  = this .getArray()
+            if otherProxy: other = other.getArray()
 
             return np.all(this == other)
 
+        # List of regions which have been
+        # written to since listeners were last
+        # notified, or None if the entire array
+        # has changed.
+        self.__dirty   = []
+        self.__version = 0
+
         kwargs['equalityFunc'] = kwargs.get('equalityFunc', defaultEquals)
         propvals.PropertyValue.__init__(self, *args, **kwargs)
 
@@ -1561,6 +1733,48 @@ class ArrayProxy(propvals.PropertyValue):
         return self
 
 
+    def getVersion(self):
+        """Returns the current version number of the array. The version
+        number is incremented every time that listeners are notified of a
+        change to the array.
+        """
+        return self.__version
+
+
+    def set(self, value):
+        """Overrides :meth:`.PropertyValue.set`. If the new value results in
+        notification, listeners are told that the entire array has changed.
+
+        If the value is this ``ArrayProxy`` (e.g. via
+        :meth:`.PropertyValue.revalidate`), the array is re-validated, but
+        is not re-cast.  If the value is another ``ArrayProxy`` (e.g.
+        when a bound ``ArrayProxy`` is synchronised), listeners are
+        always notified, as the two may be sharing the same array.
+        """
+
+        dirty        = self.__dirty
+        version      = self.__version
+        self.__dirty = None
+
+        if value is self:
+            castFunc       = self._castFunc
+            self._castFunc = None
+            try:
+                propvals.PropertyValue.set(self,
+                                           propvals.PropertyValue.get(self))
+            finally:
+                self._castFunc = castFunc
+        else:
+            propvals.PropertyValue.set(self, value)
+
+        if version == self.__version and isinstance(value, ArrayProxy) and \
+           value is not self:
+            self.propNotify()
+
+        if version == self.__version:
+            self.__dirty = dirty
+
+
     def getArray(self):
         """Returns a reference to the ``numpy`` array encapsulated by this
         ``ArrayProxy``.
@@ -1579,30 +1793,200 @@ class ArrayProxy(propvals.PropertyValue):
         return self.getArray().__getitem__(*args, **kwargs)
 
 
-    def __setitem__(self, *args, **kwargs):
+    def __setitem__(self, index, value):
         """Calls the ``__setitem__`` method of the ``numpy`` array, and triggers
         notification of all registered listeners.
         """
+        self.update([index], [value])
 
-        array = self.getArray()
 
-        array.__setitem__(*args, **kwargs)
+    def update(self, regions, values=None):
+        """Notifies all registered listeners that the given regions of the
+        array have changed. This method can be used to apply several
+        modifications to the array, with a single notification::
+
+            proxy.update([(3, 4, 5), (slice(0, 5), 2, 2)], [1, 2])
+
+        Or to notify listeners after the array has been modified directly::
 
-        notifState = self.getNotificationState()
-        self.disableNotification()
+            proxy.getArray()[3, 4, 5] = 1
+            proxy.update([(3, 4, 5)])
+
+        :arg regions: Sequence of indices (anything that may be used to
+                      index the array).
+
+        :arg values:  Sequence of values, one for each region, to be
+                      assigned to the array before listeners are notified.
+                      If not provided, it is assumed that the array has
+                      already been modified.
+        """
 
-        self.set(array)
+        array   = self.getArray()
+        regions = list(regions)
+
+        if values is not None:
+            for region, value in zip(regions, values):
+                array[region] = value
+
+        if self.__dirty is not None:
+            self.__dirty.extend([_indexRegion(r, array.shape)
+                                 for r in regions])
 
-        self.setNotificationState(notifState)
         self.propNotify()
 
 
+    def propNotify(self):
+        """Overrides :meth:`.PropertyValue.propNotify`. Increments the
+        version number, notifies listeners, and then clears the list of
+        dirty regions, unless notification has been deferred (see
+        :meth:`.HasProperties.batch`).
+        """
+
+        self.__version += 1
+
+        if self._batch is not None:
+            propvals.PropertyValue.propNotify(self)
+            return
+
+        try:
+            propvals.PropertyValue.propNotify(self)
+        finally:
+            self.__dirty = []
+
+
+    def _getChanges(self):
+        """Overrides :meth:`.PropertyValue._getChanges`. Returns a list of
+        regions which have been written to since listeners were last
+        notified.
+        """
+
+        if self.__dirty is None:
+            array = self.getArray()
+            if array is None: return [()]
+            else:             return [tuple(slice(0, n) for n in array.shape)]
+        return list(self.__dirty)
+
+
+    @staticmethod
+    def boundingBox(regions):
+        """Returns a tuple of ``slice`` objects which describes the bounding
+        box of all of the given regions, as passed to listeners which were
+        registered with ``changes=True``. Returns ``None`` if all of the
+        regions are empty.
+        """
+
+        # Ignore empty regions
+        regions = [r for r in regions if all([s.stop > s.start for s in r])]
+
+        if len(regions) == 0:
+            return None
+
+        ndims = max([len(r) for r in regions])
+        bbox  = []
+
+        for dim in range(ndims):
+            slcs = [r[dim] for r in regions if len(r) > dim]
+            bbox.append(slice(min([s.start for s in slcs]),
+                              max([s.stop  for s in slcs])))
+
+        return tuple(bbox)
+
+
+def _indexRegion(index, shape):
+    """Used by :class:`ArrayProxy`. Returns a tuple of ``slice`` objects
+    which describes the bounding box of the elements of an array with the
+    given ``shape`` that are selected by ``index``.
+
+    :arg index: Any object which may be used to index a ``numpy`` array.
+    :arg shape: Shape of the array.
+    """
+
+    if not isinstance(index, tuple):
+        index = (index,)
+
+    # Expand any ellipsis to full slices
+    ellipsis = [i for i, idx in enumerate(index) if idx is Ellipsis]
+    if len(ellipsis) > 0:
+        ellipsis = ellipsis[0]
+        nnew     = len([idx for idx in index if idx is None])
+        nfull    = len(shape) - (len(index) - 1 - nnew)
+        index    = index[:ellipsis]                 + \
+                   (slice(None),) * max(nfull, 0)  + \
+                   index[ellipsis + 1:]
+
+    region = []
+    dim    = 0
+
+    for idx in index:
+
+        # np.newaxis does not consume a dimension
+        if idx is None:
+            continue
+
+        if dim >= len(shape):
+            break
+
+        size = shape[dim]
+
+        if isinstance(idx, slice):
+            idxs = range(*idx.indices(size))
+            if len(idxs) == 0: region.append(slice(0, 0))
+            else:              region.append(slice(min(idxs[0], idxs[-1]),
+                                                   max(idxs[0], idxs[-1]) + 1))
+            dim += 1
+            continue
+
+        if isinstance(idx, six.integer_types + (np.integer,)) and \
+           not isinstance(idx, bool):
+            if idx < 0: idx += size
+            region.append(slice(int(idx), int(idx) + 1))
+            dim += 1
+            continue
+
+        idx = np.asarray(idx)
+
+        # Boolean masks select from as many
+        # dimensions as they have - we take
+        # the full extent of each of them
+        if idx.dtype == np.bool_:
+            ndims = max(idx.ndim, 1)
+            for d in range(dim, min(dim + ndims, len(shape))):
+                region.append(slice(0, shape[d]))
+            dim += ndims
+            continue
+
+        # Integer array
+        idx = idx.ravel()
+        if idx.size == 0:
+            region.append(slice(0, 0))
+        else:
+            idx = np.where(idx < 0, idx + size, idx)
+            region.append(slice(int(idx.min()), int(idx.max()) + 1))
+        dim += 1
+
+    # Any remaining dimensions
+    # are selected in their entirety
+    for d in range(len(region), len(shape)):
+        region.append(slice(0, shape[d]))
+
+    return tuple(region)
+
+
 class Array(props.PropertyBase):
     """A property which represents a ``numpy`` array. Each array is
     encapsulated within an :class:`ArrayProxy` instance.
+
+    By default, the previous value of an ``Array`` is only weakly referenced
+    (see the ``retainLast`` parameter to :meth:`.PropertyBase.__init__`), so
+    that it can be freed as soon as it is replaced.
     """
 
-    def __init__(self, dtype=None, shape=None, resizable=True, **kwargs):
+    def __init__(self,
+                 dtype=None,
+                 shape=None,
+                 resizable=True,
+                 copy=True,
+                 **kwargs):
         """Create an ``Array`` property.
 
         .. warning:: If you set a ``default`` value here (see
@@ -1622,15 +2006,24 @@ class Array(props.PropertyBase):
                         here. Different sized arrays will still be allowed, if
                         the ``allowInvalid`` parameter to
                         :meth:`.PropertyBase.__init__` is set to ``True``.
+
+        :arg copy:      Defaults to ``True``. If ``False``, arrays which are
+                        assigned to the property, and which already have the
+                        correct data type, are stored by reference, rather
+                        than being copied.  Changes made directly to such an
+                        array will bypass the :class:`.PropertyValue`
+                        notification procedure.
         """
 
         if dtype is None: dtype = np.float64
         if shape is None: shape = (4, 4)
 
-        kwargs['dtype']     = dtype
-        kwargs['shape']     = shape
-        kwargs['resizable'] = resizable
-        kwargs['default']   = kwargs.get('default', np.zeros(shape, dtype))
+        kwargs['dtype']      = dtype
+        kwargs['shape']      = shape
+        kwargs['resizable']  = resizable
+        kwargs['copy']       = copy
+        kwargs['default']    = kwargs.get('default', np.zeros(shape, dtype))
+        kwargs['retainLast'] = kwargs.get('retainLast', 'weak')
 
         props.PropertyBase.__init__(self, **kwargs)
 
@@ -1640,26 +2033,51 @@ class Array(props.PropertyBase):
         an :class:`.ArrayProxy` for the given ``instance``.
         """
 
+        # The default value is copied by the cast
+        # function. If copy=False, it is copied here
+        # instead, so that instances do not share
+        # the same array.
         default = self.getAttribute(None, 'default', None)
-        ap      = ArrayProxy(
+
+        if not self.getAttribute(None, 'copy', True) and default is not None:
+            default = np.array(default, self.getAttribute(None, 'dtype'))
+
+        ap = ArrayProxy(
             instance,
             name=self.getLabel(instance),
             value=default,
             castFunc=self.cast,
             validateFunc=self.validate,
             allowInvalid=self._allowInvalid,
+            retainLast=self._retainLast,
             **self._defaultAttributes)
 
         return ap
 
 
+    def _getLazyDefault(self, instance):
+        """Overrides :meth:`.PropertyBase._getLazyDefault`. Array values are
+        mutable, so the :class:`ArrayProxy` is created and returned.
+        """
+        return self.getPropVal(instance).get()
+
+
     def cast(self, instance, attributes, value):
         """Overrides :meth`.PropertyBase.cast`. Casts the given value to a
         ``numpy`` array (with the data type that was specified in
-        :meth:`__init__`).
+        :meth:`__init__`). If the ``copy`` attribute is ``False``, and the
+        value is already an array of the correct data type, it is returned
+        as-is.
         """
         dtype = attributes['dtype']
-        return np.array(value, dtype=dtype)
+
+        if isinstance(value, ArrayProxy):
+            value = value.getArray()
+
+        if attributes.get('copy', True):
+            return np.array(value, dtype=dtype)
+        else:
+            return np.asarray(value, dtype=dtype)
 
 
     def validate(self, instance, attributes, value):
@@ -1680,3 +2098,615 @@ class Array(props.PropertyBase):
         if (not resizable) and (value.shape != shape):
             raise ValueError('Invalid shape: {} (should be {})'.format(
                 value.shape, shape))
+
+
+class MappedArrayProxy(ArrayProxy):
+    """An :class:`ArrayProxy` used by the :class:`MappedArray` property type.
+    The value of a ``MappedArrayProxy`` is a file path, and the array is a
+    ``numpy.memmap`` of that file, which is opened when it is first
+    accessed (e.g. via :meth:`getArray`), rather than when the path is set.
+
+    Two ``MappedArrayProxy`` instances are considered to be equal if they
+    refer to the same file. When bound ``MappedArrayProxy`` instances are
+    synchronised, only the file path is copied - each ``MappedArrayProxy``
+    maps the file separately, so changes made to a copy-on-write array are
+    not shared.
+    """
+
+
+    __slots__ = ('__array', '__arrayPath')
+
+
+    def __init__(self, *args, **kwargs):
+        """Create a ``MappedArrayProxy``. All arguments are passed through to
+        the :meth:`ArrayProxy.__init__` method.
+        """
+
+        def defaultEquals(this, other):
+            if isinstance(this,  MappedArrayProxy): this  = this .getPath()
+            if isinstance(other, MappedArrayProxy): other = other.getPath()
+            return this == other
+
+        self.__array     = None
+        self.__arrayPath = None
+
+        kwargs['equalityFunc'] = kwargs.get('equalityFunc', defaultEquals)
+        ArrayProxy.__init__(self, *args, **kwargs)
+
+
+    def getPath(self):
+        """Returns the path to the file that is mapped by this
+        ``MappedArrayProxy``, or ``None``.
+        """
+        return propvals.PropertyValue.get(self)
+
+
+    def isOpen(self):
+        """Returns ``True`` if the file has been mapped, ``False`` otherwise.
+        """
+        return self.__array is not None and \
+            self.__arrayPath == self.getPath()
+
+
+    def getArray(self):
+        """Overrides :meth:`ArrayProxy.getArray`. Returns the memory-mapped
+        array, opening it if necessary. Returns ``None`` if a file path has
+        not been set.
+        """
+
+        path = self.getPath()
+
+        if path != self.__arrayPath:
+            self.__array     = None
+            self.__arrayPath = path
+
+        if self.__array is None and path is not None:
+            self.__array = _openMappedArray(path, self.getAttributes())
+
+        return self.__array
+
+
+    def setAttribute(self, name, value):
+        """Overrides :meth:`.PropertyValue.setAttribute`. If an attribute
+        which affects how the file is mapped is changed, the array is closed,
+        and is re-opened when it is next accessed.
+        """
+
+        if name in ('mode', 'dtype', 'shape', 'offset'):
+            self.__array     = None
+            self.__arrayPath = None
+
+        ArrayProxy.setAttribute(self, name, value)
+
+
+class MappedArray(Array):
+    """A property which represents a ``numpy`` array that is memory-mapped
+    from a file. The value of a ``MappedArray`` is a file path, which may
+    refer to either a ``.npy`` file, or a raw binary file. Each array is
+    encapsulated within a :class:`MappedArrayProxy` instance, and may be
+    accessed in the same way as an :class:`Array`::
+
+        class Image(props.HasProperties):
+            data = props.MappedArray()
+
+        img      = Image()
+        img.data = 'image.npy'
+
+        # The file is mapped here
+        print(img.data[0, 0, 0])
+
+    Files are not mapped until the array is first accessed, and data is
+    only read from the file when it is accessed, so many large files may
+    be opened without them being read into memory. By default, a
+    ``MappedArray`` does not have a value, so no array is allocated for
+    instances which do not use it.
+
+    Element assignments through the ``MappedArrayProxy`` are only possible
+    in copy-on-write mode, and are never written back to the file.
+    """
+
+    def __init__(self,
+                 mode='r',
+                 dtype=None,
+                 shape=None,
+                 offset=0,
+                 resizable=True,
+                 **kwargs):
+        """Create a ``MappedArray`` property.
+
+        :arg mode:      Either ``'r'`` (the default) for read-only access, or
+                        ``'c'`` for copy-on-write access, where changes to
+                        the array are made in memory, and are not written to
+                        the file.
+
+        :arg dtype:     ``numpy`` data type. Must be provided for raw files.
+                        For ``.npy`` files, if provided, the file must
+                        contain data of this type.
+
+        :arg shape:     Array shape. Must be provided for raw files. For
+                        ``.npy`` files, if provided and ``resizable`` is
+                        ``False``, the file must contain an array of this
+                        shape.
+
+        :arg offset:    Offset, in bytes, of the array data in raw files.
+                        Ignored for ``.npy`` files.
+
+        :arg resizable: Defaults to ``True``. If ``False``, files must
+                        contain an array of the specified ``shape``.
+        """
+
+        if mode not in ('r', 'c'):
+            raise ValueError('Invalid mode: {} (should be '
+                             '\'r\' or \'c\')'.format(mode))
+
+        kwargs['mode']       = mode
+        kwargs['dtype']      = dtype
+        kwargs['shape']      = shape
+        kwargs['offset']     = offset
+        kwargs['resizable']  = resizable
+        kwargs['default']    = kwargs.get('default',    None)
+        kwargs['retainLast'] = kwargs.get('retainLast', 'weak')
+
+        props.PropertyBase.__init__(self, **kwargs)
+
+
+    def _makePropVal(self, instance):
+        """Overrides :meth`Array._makePropVal`. Creates and returns a
+        :class:`MappedArrayProxy` for the given ``instance``.
+        """
+
+        default = self.getAttribute(None, 'default', None)
+        ap      = MappedArrayProxy(
+            instance,
+            name=self.getLabel(instance),
+            value=default,
+            castFunc=self.cast,
+            validateFunc=self.validate,
+            allowInvalid=self._allowInvalid,
+            retainLast=self._retainLast,
+            **self._defaultAttributes)
+
+        return ap
+
+
+    def cast(self, instance, attributes, value):
+        """Overrides :meth:`Array.cast`. If the given ``value`` is a
+        :class:`MappedArrayProxy`, its file path is returned. Otherwise the
+        ``value`` is returned unchanged.
+        """
+
+        if isinstance(value, MappedArrayProxy):
+            value = value.getPath()
+
+        return value
+
+
+    def validate(self, instance, attributes, value):
+        """Overrides :meth:`Array.validate`. If the given ``value`` is not
+        the path to a file, or the file does not contain an array of the
+        expected data type or shape, a :exc:`ValueError` is raised. Only the
+        file header (for ``.npy`` files) or size (for raw files) is read.
+        """
+
+        if isinstance(value, MappedArrayProxy):
+            value = value.getPath()
+
+        props.PropertyBase.validate(self, instance, attributes, value)
+
+        if value is None:
+            return
+
+        if not op.isfile(value):
+            raise ValueError('Must be a file ({})'.format(value))
+
+        expDtype  = attributes['dtype']
+        expShape  = attributes['shape']
+        resizable = attributes['resizable']
+
+        dtype, shape = _readMappedArrayHeader(value, attributes)
+
+        if expDtype is not None and dtype != expDtype:
+            raise ValueError('Invalid data type: {} (should be {})'.format(
+                dtype, expDtype))
+
+        if (not resizable) and (expShape is not None) and \
+           (tuple(shape) != tuple(expShape)):
+            raise ValueError('Invalid shape: {} (should be {})'.format(
+                shape, expShape))
+
+
+def _isNpyFile(path):
+    """Used by :class:`MappedArray`. Returns ``True`` if the given file
+    looks like a ``.npy`` file, ``False`` otherwise.
+    """
+    magic = np.lib.format.MAGIC_PREFIX
+    with open(path, 'rb') as f:
+        return f.read(len(magic)) == magic
+
+
+def _readMappedArrayHeader(path, attributes):
+    """Used by :class:`MappedArray`. Returns the data type and shape of the
+    array contained in the given file, without reading or mapping the array
+    data. A :exc:`ValueError` is raised if the file is not a valid ``.npy``
+    file, or is a raw file which is too small to contain an array of the
+    ``dtype`` and ``shape`` specified in the given ``attributes``.
+    """
+
+    if _isNpyFile(path):
+        with open(path, 'rb') as f:
+            version = np.lib.format.read_magic(f)
+            if version == (1, 0):
+                shape, _, dtype = np.lib.format.read_array_header_1_0(f)
+            else:
+                shape, _, dtype = np.lib.format.read_array_header_2_0(f)
+        return dtype, shape
+
+    dtype  = attributes['dtype']
+    shape  = attributes['shape']
+    offset = attributes['offset']
+
+    if dtype is None or shape is None:
+        raise ValueError('The dtype and shape must be specified '
+                         'for raw files ({})'.format(path))
+
+    dtype  = np.dtype(dtype)
+    nbytes = offset + int(np.prod(shape)) * dtype.itemsize
+
+    if op.getsize(path) < nbytes:
+        raise ValueError('File is too small for an array of shape '
+                         '{} and type {} ({})'.format(shape, dtype, path))
+
+    return dtype, tuple(shape)
+
+
+def _openMappedArray(path, attributes):
+    """Used by :class:`MappedArrayProxy`. Memory-maps the given file, and
+    returns a ``numpy.memmap``.
+    """
+
+    mode = attributes['mode']
+
+    if _isNpyFile(path):
+        return np.load(path, mmap_mode=mode)
+
+    return np.memmap(path,
+                     dtype=attributes['dtype'],
+                     mode=mode,
+                     shape=tuple(attributes['shape']),
+                     offset=attributes['offset'])
+
+
+class SharedArrayProxy(ArrayProxy):
+    """An :class:`ArrayProxy` used by the :class:`SharedArray` property type.
+    The array is stored in a ``multiprocessing.shared_memory`` block, which
+    is created by this ``SharedArrayProxy``, and is released when the array
+    is no longer in use.
+
+    Other processes may access the array via a :class:`SharedArrayHandle`,
+    returned by :meth:`getHandle`. Changes which are made by other processes
+    are reported back to this ``SharedArrayProxy`` through a
+    ``multiprocessing.Queue``, and are turned into normal
+    :class:`ArrayProxy` notifications by the :meth:`poll` method, which
+    must be called in the process which owns this ``SharedArrayProxy``
+    (e.g. from a timer, or after waiting for worker processes to finish)::
+
+        handle = image.data.getHandle()
+        worker = multiprocessing.Process(target=func, args=(handle,))
+        worker.start()
+        worker.join()
+        image.data.poll()
+    """
+
+
+    __slots__ = ('__queue',)
+
+
+    def __init__(self, *args, **kwargs):
+        """Create a ``SharedArrayProxy``. All arguments are passed through to
+        the :meth:`ArrayProxy.__init__` method.
+        """
+        self.__queue = None
+        ArrayProxy.__init__(self, *args, **kwargs)
+
+
+    def getName(self):
+        """Returns the name of the shared memory block which contains the
+        array, or ``None`` if an array has not been assigned.
+        """
+        return _sharedMemoryName(self.getArray())
+
+
+    def getHandle(self):
+        """Returns a :class:`SharedArrayHandle` which can be passed to other
+        processes, and which refers to the current array. The handle must be
+        passed to processes when they are created (e.g. as an argument to
+        ``multiprocessing.Process``, or to the ``initializer`` of a
+        ``multiprocessing.Pool``), as it contains a ``multiprocessing.Queue``,
+        which is created with the default ``multiprocessing`` context.
+        """
+
+        import multiprocessing as mp
+
+        array = self.getArray()
+
+        if array is None:
+            raise ValueError('{} does not have a value'.format(self._name))
+
+        if self.__queue is None:
+            self.__queue = mp.Queue()
+
+        return SharedArrayHandle(self.getName(),
+                                 array.dtype.str,
+                                 array.shape,
+                                 self.__queue)
+
+
+    def poll(self, timeout=0):
+        """Processes any changes which have been reported by other processes
+        via a :class:`SharedArrayHandle`, and notifies listeners of them
+        (see :meth:`ArrayProxy.update`). Changes which were made to a
+        previous array are ignored.
+
+        :arg timeout: Time, in seconds, to wait for a change to be reported,
+                      if none are pending. If ``None``, waits indefinitely.
+
+        :returns:     ``True`` if listeners were notified, ``False``
+                      otherwise.
+        """
+
+        from six.moves import queue
+
+        if self.__queue is None:
+            return False
+
+        name     = self.getName()
+        regions  = []
+        messages = []
+
+        try:
+            if timeout == 0: messages.append(self.__queue.get_nowait())
+            else:            messages.append(self.__queue.get(True, timeout))
+            while True:
+                messages.append(self.__queue.get_nowait())
+        except queue.Empty:
+            pass
+
+        for msgName, msgRegions in messages:
+            if msgName == name:
+                regions.extend(msgRegions)
+
+        if len(regions) == 0:
+            return False
+
+        self.update(regions)
+        return True
+
+
+class SharedArrayHandle(object):
+    """A ``SharedArrayHandle`` allows a process to access an array which is
+    managed by a :class:`SharedArrayProxy` in another process. A handle is
+    created by :meth:`SharedArrayProxy.getHandle`, and is passed to other
+    processes when they are created. Only the name of the shared memory
+    block, and the array data type and shape, are passed - the array data
+    is never copied::
+
+        def func(handle):
+            data = handle.open()
+            data[10:20, :, :] = 1
+            handle.update([slice(10, 20)])
+            handle.close()
+    """
+
+
+    def __init__(self, name, dtype, shape, queue):
+        """Create a ``SharedArrayHandle``.
+
+        :arg name:  Name of the shared memory block.
+        :arg dtype: Array data type.
+        :arg shape: Array shape.
+        :arg queue: ``multiprocessing.Queue`` used to report changes.
+        """
+        self.name  = name
+        self.dtype = dtype
+        self.shape = tuple(shape)
+        self.queue = queue
+        self.__shm = None
+
+
+    def __getstate__(self):
+        """Called when this ``SharedArrayHandle`` is pickled. The shared
+        memory block is not pickled.
+        """
+        return (self.name, self.dtype, self.shape, self.queue)
+
+
+    def __setstate__(self, state):
+        """Called when this ``SharedArrayHandle`` is unpickled. """
+        self.__init__(*state)
+
+
+    def open(self):
+        """Attaches to the shared memory block, and returns a ``numpy`` array
+        which refers to it. Changes made to the array are visible to the
+        owning process, but listeners are not notified until
+        :meth:`update` is called.
+        """
+
+        from multiprocessing import shared_memory
+
+        if self.__shm is None:
+            self.__shm = shared_memory.SharedMemory(self.name)
+
+        return np.ndarray(self.shape, self.dtype, buffer=self.__shm.buf)
+
+
+    def close(self):
+        """Detaches from the shared memory block. All arrays returned by
+        :meth:`open` must have been deleted.
+        """
+        if self.__shm is not None:
+            self.__shm.close()
+            self.__shm = None
+
+
+    def update(self, regions=None):
+        """Reports a change to the array to the owning process. Listeners
+        of the :class:`SharedArrayProxy` are notified when it next calls
+        :meth:`SharedArrayProxy.poll`.
+
+        :arg regions: Sequence of indices into the array, describing the
+                      regions which have been changed (see
+                      :meth:`ArrayProxy.update`). If not provided, the
+                      entire array is assumed to have changed.
+        """
+        if regions is None:
+            regions = [Ellipsis]
+        self.queue.put((self.name, list(regions)))
+
+
+class SharedArray(Array):
+    """A property which represents a ``numpy`` array that is stored in
+    shared memory, so that it can be accessed by other processes without
+    being copied. Each array is encapsulated within a
+    :class:`SharedArrayProxy` instance, and may be accessed in the same
+    way as an :class:`Array`.
+
+    Every array which is assigned to a ``SharedArray`` property is copied
+    into a new shared memory block. A :class:`SharedArrayHandle` may then
+    be passed to other processes - see :meth:`SharedArrayProxy.getHandle`.
+
+    By default, a ``SharedArray`` does not have a value, so no shared
+    memory is allocated for instances until an array is assigned.
+
+    .. note:: ``SharedArray`` properties require Python 3.8 or newer.
+    """
+
+
+    def __init__(self, **kwargs):
+        """Create a ``SharedArray`` property. All arguments are passed
+        through to :meth:`Array.__init__`, but the ``default`` value is
+        ``None`` unless one is provided.
+        """
+        kwargs['default'] = kwargs.get('default', None)
+        Array.__init__(self, **kwargs)
+
+
+    def _makePropVal(self, instance):
+        """Overrides :meth`Array._makePropVal`. Creates and returns a
+        :class:`SharedArrayProxy` for the given ``instance``.
+        """
+
+        default = self.getAttribute(None, 'default', None)
+        ap      = SharedArrayProxy(
+            instance,
+            name=self.getLabel(instance),
+            value=default,
+            castFunc=self.cast,
+            validateFunc=self.validate,
+            allowInvalid=self._allowInvalid,
+            retainLast=self._retainLast,
+            **self._defaultAttributes)
+
+        return ap
+
+
+    def cast(self, instance, attributes, value):
+        """Overrides :meth:`Array.cast`. Copies the given value into a new
+        shared memory block, and returns an array which refers to it.
+        ``None`` is returned unchanged.
+        """
+
+        if isinstance(value, ArrayProxy):
+            value = value.getArray()
+
+        if value is None:
+            return None
+
+        value = np.asarray(value, dtype=attributes['dtype'])
+        array = _createSharedArray(value.shape, value.dtype)
+
+        array[...] = value
+
+        return array
+
+
+    def validate(self, instance, attributes, value):
+        """Overrides :meth:`Array.validate`. A value of ``None`` is only
+        passed to :meth:`.PropertyBase.validate`.
+        """
+        if value is None:
+            props.PropertyBase.validate(self, instance, attributes, value)
+        else:
+            Array.validate(self, instance, attributes, value)
+
+
+def _createSharedArray(shape, dtype):
+    """Used by :class:`SharedArray`. Creates a shared memory block, and
+    returns a ``numpy`` array of the given ``shape`` and ``dtype`` which
+    refers to it. The block is released when the array, and any views of
+    it, are garbage-collected.
+    """
+
+    from multiprocessing import shared_memory
+
+    dtype = np.dtype(dtype)
+    size  = max(1, int(np.prod(shape)) * dtype.itemsize)
+    shm   = shared_memory.SharedMemory(create=True, size=size)
+    array = np.ndarray(shape, dtype, buffer=shm.buf)
+
+    _sharedMemoryBlocks[id(array)] = (weakref.ref(array), shm.name)
+
+    weakref.finalize(array, _releaseSharedMemory, shm, id(array))
+
+    return array
+
+
+def _releaseSharedMemory(shm, arrayId):
+    """Used by :func:`_createSharedArray`. Releases the given shared memory
+    block.
+    """
+
+    # The entry is only removed if its
+    # array is dead - the id may already
+    # have been re-used by a new array
+    entry = _sharedMemoryBlocks.get(arrayId, None)
+    if entry is not None and entry[0]() is None:
+        _sharedMemoryBlocks.pop(arrayId)
+
+    # The block may still be referenced
+    # at interpreter exit - it is still
+    # unlinked, so that it is removed
+    # from the system
+    try:
+        shm.close()
+    except BufferError:
+        pass
+
+    try:
+        shm.unlink()
+    except OSError:
+        pass
+
+
+def _sharedMemoryName(array):
+    """Used by :class:`SharedArrayProxy`. Returns the name of the shared
+    memory block which was created for the given array by
+    :func:`_createSharedArray`, or ``None`` if the array was not created
+    by :func:`_createSharedArray`.
+    """
+
+    entry = _sharedMemoryBlocks.get(id(array), None)
+
+    if entry is None or entry[0]() is not array:
+        return None
+
+    return entry[1]
+
+
+_sharedMemoryBlocks = {}
+"""Used by :func:`_createSharedArray`. Contains ``{id : (ref, name)}``
+mappings for all arrays which have been created by
+:func:`_createSharedArray`, where ``ref`` is a weak reference to the array.
+As array ids may be re-used after an array has been garbage-collected,
+the reference is used to check that an entry refers to the given array.
+"""
@@ -13,6 +13,7 @@ classes.
 
     PropertyValue
     PropertyValueList
+    ListChange
 
 
 ``PropertyValue`` and ``PropertyValueList`` instances are intended to be
@@ -32,10 +33,16 @@ import uuid
 import logging
 import weakref
 
+import collections
+
+import six
+import numpy as np
+
 from collections import OrderedDict
 
 from . import callqueue
 from . import bindable
+from . import tracing
 
 import fsl.utils.weakfuncref as weakfuncref
 
@@ -43,11 +50,55 @@ import fsl.utils.weakfuncref as weakfuncref
 log = logging.getLogger(__name__)
 
 
+def _defaultEquals(a, b):
+    """Default equality function used by :class:`PropertyValue` instances.
+    """
+    return a == b
+
+
 class Listener(object):
     """The ``Listener`` class is used by :class:`PropertyValue` instances to
     manage their listeners - see :meth:`PropertyValue.addListener`.
+
+    If the listener function is a ``WeakFunctionRef``, the ``Listener``
+    keeps a weak reference, with a callback, to the object which owns the
+    function, so that the owning ``PropertyValue`` can discard its cached
+    list of listeners when the function is garbage-collected.
+
+    The ``queueName`` attribute contains the name which is used for this
+    listener when it is passed to the :class:`.CallQueue`. For listeners
+    in the :data:`.callqueue.IDLE` lane, the queue name is derived from the
+    listener name, so that calls to listeners with the same name on
+    different ``PropertyValue`` objects are coalesced. Each call is
+    enqueued with the ``Listener`` as its owner, so that removing a
+    listener only dequeues calls that were made on its behalf.
+
+    For listeners which have asked to receive change records (e.g.
+    :class:`ListChange` records), the ``changes`` attribute is a list
+    containing the records which have not yet been passed to the listener
+    function (see :meth:`callWithChanges`). For all other listeners, it is
+    ``None``.
     """
-    def __init__(self, propVal, name, function, enabled, immediate):
+
+    __slots__ = ('propVal',
+                 'name',
+                 'enabled',
+                 'immediate',
+                 'queueName',
+                 'changes',
+                 '__priority',
+                 '__function',
+                 '__deathRef')
+
+
+    def __init__(self,
+                 propVal,
+                 name,
+                 function,
+                 enabled,
+                 immediate,
+                 priority=0,
+                 changes=False):
         """Create a ``Listener``.
 
         :arg propVal:   The ``PropertyValue`` that owns this ``Listener``.
@@ -56,24 +107,173 @@ class Listener(object):
         :arg enabled:   Whether the listener is enabled/disabled.
         :arg immediate: Whether the listener is to be called immediately, or
                         via the :attr:`PropertyValue.queue`.
+        :arg priority:  Priority of the listener on the
+                        :attr:`PropertyValue.queue`.
+        :arg changes:   Whether the listener is to be passed change
+                        records.
         """
 
-        self.propVal   = weakref.ref(propVal)
-        self.name      = name
-        self.function  = function
-        self.enabled   = enabled
-        self.immediate = immediate
+        self.propVal    = weakref.ref(propVal)
+        self.name       = name
+        self.__priority = priority
+        self.function   = function
+        self.enabled    = enabled
+        self.immediate  = immediate
+        self.changes    = [] if changes else None
+
+
+    def __updateQueueName(self):
+        """Called when the function or priority of this ``Listener`` changes.
+        Generates its :attr:`queueName`. The name is generated here, rather
+        than on every notification.
+        """
+
+        pv = self.propVal()
+
+        # Idle listeners are coalesced by
+        # name, across all PropertyValues
+        if self.__priority == callqueue.IDLE:
+            salt           = 'PropertyValue_{}_'.format(pv._name)
+            self.queueName = 'idle {}'.format(self.name[len(salt):])
+
+        else:
+            ctxName        = pv._context().__class__.__name__
+            self.queueName = '{} ({}.{})'.format(self.name, ctxName, pv._name)
+
+
+    @property
+    def priority(self):
+        """The priority of this listener on the :attr:`PropertyValue.queue`.
+        """
+        return self.__priority
+
+
+    @priority.setter
+    def priority(self, priority):
+        """Set the priority of this listener. """
+        self.__priority = priority
+        self.__updateQueueName()
+
+
+    @property
+    def function(self):
+        """The listener callback function, which may be a
+        ``WeakFunctionRef``.
+        """
+        return self.__function
+
+
+    @function.setter
+    def function(self, function):
+        """Set the listener callback function. """
+
+        self.__function = function
+        self.__deathRef = None
+
+        self.__updateQueueName()
+
+        if not isinstance(function, weakfuncref.WeakFunctionRef):
+            return
+
+        if function.obj is not None: target = function.obj()
+        else:                        target = function.func()
+
+        if target is None:
+            return
+
+        pvref = self.propVal
+
+        def dead(ref):
+            pv = pvref()
+            if pv is not None:
+                pv._invalidateListeners()
+
+        self.__deathRef = weakref.ref(target, dead)
+
+
+    def getFunction(self):
+        """Returns the listener callback function, or ``None`` if it was
+        a weakly referenced function which has been garbage-collected.
+        """
+
+        func = self.__function
+
+        if not isinstance(func, weakfuncref.WeakFunctionRef):
+            return func
+
+        # Bound method - rather than asking the
+        # WeakFunctionRef to look up the method
+        # on its owner by name (which is slow for
+        # private methods), we re-bind the function
+        # directly.
+        if func.obj is not None:
+            obj = func.obj()
+            fn  = func.func()
+
+            if obj is None or fn is None: return None
+            else:                         return six.create_bound_method(fn,
+                                                                         obj)
+
+        return func.func()
+
+
+    def callWithChanges(self, *args):
+        """Used in place of the listener function for listeners which
+        receive change records. Calls the listener function
+        with the given arguments, followed by a list containing all of the
+        change records which have been added to ``changes`` since the last
+        call.
+
+        Calls to a listener may be coalesced by the :class:`.CallQueue`,
+        so one call may need to deliver several records. If there are no
+        pending records (because they were delivered by an earlier call),
+        the listener function is not called.
+        """
+
+        func    = self.getFunction()
+        changes = self.changes
+
+        if func is None or len(changes) == 0:
+            return
+
+        self.changes = []
+        func(*(args + (changes,)))
 
 
     def makeQueueName(self):
         """Returns a more descriptive name for this ``Listener``, which
         is used as its name when passed to the :class:`.CallQueue`.
         """
-
-        ctxName = self.propVal()._context().__class__.__name__
-        pvName  = self.propVal()._name
-
-        return '{} ({}.{})'.format(self.name, ctxName, pvName)
+        return self.queueName
+
+
+class ListChange(collections.namedtuple('ListChange', ('kind', 'indices'))):
+    """A ``ListChange`` describes a single modification to a
+    :class:`PropertyValueList`. ``ListChange`` records are passed to list
+    listeners which were registered with ``changes=True`` (see
+    :meth:`PropertyValue.addListener`). The ``kind`` is one of:
+
+      - ``'inserted'``:     Items were inserted - ``indices`` contains the
+                            indices of the new items.
+      - ``'removed'``:      Items were removed - ``indices`` contains the
+                            indices that the removed items had, before they
+                            were removed.
+      - ``'moved'``:        Items were moved - ``indices`` is a permutation,
+                            where ``newList[i] == oldList[indices[i]]``.
+      - ``'itemsChanged'``: The values of some items were changed -
+                            ``indices`` contains the indices of the items.
+      - ``'reset'``:        The list was changed in a way that is not
+                            described by any of the above (e.g. all of its
+                            items were replaced, or the change was made in a
+                            :meth:`.HasProperties.batch`). ``indices`` is
+                            ``None``, and the listener should re-read the
+                            entire list.
+
+    The records are applied in the order in which they are given. Records
+    are not generated for changes which are made while notification is
+    disabled on the list.
+    """
+    __slots__ = ()
 
 
 class PropertyValue(object):
@@ -85,16 +285,106 @@ class PropertyValue(object):
     Notification of value and attribute listeners is performed by the
     :mod:`.bindable` module - see the :func:`.bindable.syncAndNotify` and
     :func:`.bindable.syncAndNotifyAtts` functions.
+
+
+    ``PropertyValue`` instances are created in large numbers, so the class
+    uses ``__slots__``, and some internal state (listener dictionaries, the
+    pre/post notify listeners, and the default name) is only created when
+    it is needed. The following attributes are managed by the
+    :mod:`.bindable` module:
+
+      - ``boundPropVals``:    A ``WeakValueDictionary`` of ``{id : PV}``
+                              mappings, for other PVs whose values are
+                              bound to this one, or ``None``.
+      - ``boundAttPropVals``: As above, for PVs whose attributes are bound
+                              to this one.
+      - ``_syncing``:         Flag used to prevent recursive syncs.
+      - ``_listPropValMaps``: For :class:`PropertyValueList` instances, a
+                              dictionary of ``{id : Bidict}`` mappings,
+                              used to synchronise bound lists, or ``None``.
+      - ``_bpvComponent``:    The :class:`.bindable.BindingComponent` of PVs
+                              whose values are bound to this one, or
+                              ``None``.
+      - ``_bapvComponent``:   As above, for PVs whose attributes are bound
+                              to this one.
+      - ``_publisher``:       A weak reference to the PV that this PV is
+                              subscribed to via a broadcast binding (see
+                              :func:`.bindable.broadcastPropVals`), or
+                              ``None``. Use :meth:`_getPublisher` to access
+                              it.
+      - ``_subscribers``:     A ``WeakValueDictionary`` of ``{id : PV}``
+                              mappings, for PVs which are subscribed to this
+                              one, or ``None``.
+
+    The ``_batch`` attribute is managed by :meth:`.HasProperties.batch`. When
+    it is not ``None``, it is a dictionary to which this ``PropertyValue`` is
+    added by :meth:`propNotify`, instead of synchronising and notifying
+    listeners immediately.
     """
 
 
-    queue = callqueue.CallQueue(skipDuplicates=True)
+    _changeRecords = False
+    """Whether this type of ``PropertyValue`` is able to pass change
+    records to its listeners - see :meth:`addListener` and
+    :meth:`_getChanges`.
+    """
+
+
+    _broadcast = True
+    """Whether this type of ``PropertyValue`` may be used in a broadcast
+    binding - see :func:`.bindable.broadcastPropVals`. Sub-classes which
+    do not access their value solely via :meth:`get` and :meth:`set` must
+    set this to ``False``.
+    """
+
+
+    __slots__ = ('_context',
+                 '_validate',
+                 '__name',
+                 '_equalityFunc',
+                 '_castFunc',
+                 '_allowInvalid',
+                 '_attributes',
+                 '_changeListeners',
+                 '_attributeListeners',
+                 '_preNotifyListener',
+                 '_postNotifyListener',
+                 '__valueDispatch',
+                 '__attDispatch',
+                 '__value',
+                 '__valid',
+                 '__lastValue',
+                 '__lastValid',
+                 '__retainLast',
+                 '__notification',
+                 '__parent',
+                 'boundPropVals',
+                 'boundAttPropVals',
+                 '_syncing',
+                 '_listPropValMaps',
+                 '_bpvComponent',
+                 '_bapvComponent',
+                 '_publisher',
+                 '_subscribers',
+                 '_batch',
+                 '__weakref__')
+
+
+    queue = callqueue.CallQueue(coalesce=True)
     """A :class:`.CallQueue` instance which is shared by all
     :class:`PropertyValue` instances, and used for notifying listeners
     of value and attribute changes.
 
     A queue is used for notification so that listeners are notified in
-    the order that values were changed.
+    the order that values were changed. The queue coalesces duplicate
+    calls, so if a value changes several times while its listeners are
+    already on the queue, they are called once, with the most recent value.
+
+    The queue is thread-safe by default. Applications which only change
+    property values from a single thread (e.g. the GUI thread) may disable
+    its locks, which reduces the cost of notifying listeners::
+
+        PropertyValue.queue.setThreadSafe(False)
     """
 
 
@@ -109,6 +399,7 @@ class PropertyValue(object):
                  postNotifyFunc=None,
                  allowInvalid=True,
                  parent=None,
+                 retainLast='full',
                  **attributes):
         """Create a ``PropertyValue`` object.
 
@@ -169,6 +460,18 @@ class PropertyValue(object):
                                :meth:`PropertyValueList._listPVChanged` method
                                is called.
 
+        :param retainLast:     Controls whether the previous value is
+                               retained, so that it can be returned by
+                               :meth:`getLast`. If ``'full'`` (the default),
+                               a reference to the previous value is kept.
+                               If ``'weak'``, a weak reference is kept, so
+                               the previous value is only available while
+                               it is referenced elsewhere (values which do
+                               not support weak references, e.g. ``int``,
+                               are not retained). If ``'none'``, the
+                               previous value is not retained, and
+                               :meth:`getLast` returns ``None``.
+
         :param attributes:     Any key-value pairs which are to be associated
                                with this :class:`PropertyValue` object, and
                                passed to the ``castFunc`` and ``validateFunc``
@@ -182,47 +485,78 @@ class PropertyValue(object):
                                values change.
         """
 
-        if name     is     None: name  = 'PropertyValue_{}'.format(id(self))
         if castFunc is not None: value = castFunc(context, attributes, value)
-        if equalityFunc is None: equalityFunc = lambda a, b: a == b
+        if equalityFunc is None: equalityFunc = _defaultEquals
+
+        if retainLast not in ('full', 'weak', 'none'):
+            raise ValueError('Invalid retainLast value: {}'.format(retainLast))
 
         self._context                 = weakref.ref(context)
         self._validate                = validateFunc
-        self._name                    = name
+        self.__name                   = name
         self._equalityFunc            = equalityFunc
         self._castFunc                = castFunc
         self._allowInvalid            = allowInvalid
         self._attributes              = attributes.copy()
-        self._changeListeners         = OrderedDict()
-        self._attributeListeners      = OrderedDict()
+
+        # Listener dictionaries, and the pre/post
+        # notify listeners, are created on demand
+        self._changeListeners         = None
+        self._attributeListeners      = None
+        self._preNotifyListener       = None
+        self._postNotifyListener      = None
+
+        # Cached tuples of the value/attribute
+        # listeners to be notified on a change -
+        # see prepareListeners.
+        self.__valueDispatch          = None
+        self.__attDispatch            = None
 
         self.__value                  = value
         self.__valid                  = False
         self.__lastValue              = None
         self.__lastValid              = False
+        self.__retainLast             = retainLast
         self.__notification           = True
 
-        self._preNotifyListener  = Listener(self,
-                                            'prenotify',
-                                            preNotifyFunc,
-                                            True,
-                                            True)
-        self._postNotifyListener = Listener(self,
-                                            'postnotify',
-                                            postNotifyFunc,
-                                            True,
-                                            False)
+        # Managed by the bindable module
+        self.boundPropVals            = None
+        self.boundAttPropVals         = None
+        self._syncing                 = False
+        self._listPropValMaps         = None
+        self._bpvComponent            = None
+        self._bapvComponent           = None
+        self._publisher               = None
+        self._subscribers             = None
+
+        # Managed by HasProperties.batch
+        self._batch                   = None
 
         if parent is not None: self.__parent = weakref.ref(parent)
         else:                  self.__parent = None
 
+        if preNotifyFunc  is not None:
+            self.setPreNotifyFunction(preNotifyFunc)
+        if postNotifyFunc is not None:
+            self.setPostNotifyFunction(postNotifyFunc)
+
         if not allowInvalid and validateFunc is not None:
             validateFunc(context, self._attributes, value)
 
 
+    @property
+    def _name(self):
+        """The name of this ``PropertyValue``. If a name was not passed to
+        :meth:`__init__`, a unique name is generated on first access.
+        """
+        if self.__name is None:
+            self.__name = 'PropertyValue_{}'.format(id(self))
+        return self.__name
+
+
     def __repr__(self):
         """Returns a string representation of this PropertyValue object."""
-        return 'PV({})'.format(self.__value)
+        return 'PV({})'.format(PropertyValue.get(self))
 
 
     def __str__(self):
@@ -385,53 +719,66 @@ class PropertyValue(object):
                           immediately; otherwise, it is called via the
                           :attr:`queue`.
         """
-        log.debug('Adding attribute listener on {}.{} ({}): {}'.format(
-            self._context().__class__.__name__, self._name, id(self), name))
+        if tracing.enabled:
+            log.debug('Adding attribute listener on {}.{} ({}): {}'.format(
+                self._context().__class__.__name__,
+                self._name,
+                id(self),
+                name))
 
         if weak:
             listener = weakfuncref.WeakFunctionRef(listener)
 
+        if self._attributeListeners is None:
+            self._attributeListeners = OrderedDict()
+
         name = self.__saltListenerName(name)
         self._attributeListeners[name] = Listener(self,
                                                   name,
                                                   listener,
                                                   True,
                                                   immediate)
+        self._invalidateListeners()
 
 
     def disableAttributeListener(self, name):
         """Disables the attribute listener with the specified ``name``. """
         name = self.__saltListenerName(name)
-        log.debug('Disabling attribute listener on {}: {}'.format(self._name,
-                                                                  name))
-        self._attributeListeners[name].enabled = False
+        if tracing.enabled:
+            log.debug('Disabling attribute listener on {}: {}'.format(
+                self._name, name))
+        (self._attributeListeners or {})[name].enabled = False
+        self._invalidateListeners()
 
 
     def enableAttributeListener(self, name):
         """Enables the attribute listener with the specified ``name``. """
         name = self.__saltListenerName(name)
-        log.debug('Enabling attribute listener on {}: {}'.format(self._name,
-                                                                 name))
-        self._attributeListeners[name].enabled = True
+        if tracing.enabled:
+            log.debug('Enabling attribute listener on {}: {}'.format(
+                self._name, name))
+        (self._attributeListeners or {})[name].enabled = True
+        self._invalidateListeners()
 
 
     def removeAttributeListener(self, name):
         """Removes the attribute listener of the given name."""
-        log.debug('Removing attribute listener on {}.{}: {}'.format(
-            self._context().__class__.__name__, self._name, name))
+        if tracing.enabled:
+            log.debug('Removing attribute listener on {}.{}: {}'.format(
+                self._context().__class__.__name__, self._name, name))
+
+        if self._attributeListeners is None:
+            return
 
         name     = self.__saltListenerName(name)
         listener = self._attributeListeners.pop(name, None)
 
         if listener is not None:
 
-            cb = listener.function
+            self._invalidateListeners()
 
-            if isinstance(cb, weakfuncref.WeakFunctionRef):
-                cb = cb.function()
-
-            if cb is not None:
-                PropertyValue.queue.dequeue(listener.makeQueueName())
+            if listener.getFunction() is not None:
+                PropertyValue.queue.dequeue(listener.queueName, listener)
 
 
     def getAttributes(self):
@@ -472,14 +819,18 @@ class PropertyValue(object):
 
         self._attributes[name] = value
 
-        if oldVal == value: return
+        # Identity test first, for attribute values
+        # which cannot be compared with == (e.g.
+        # the default value of an Array property)
+        if oldVal is value or oldVal == value: return
 
-        log.debug('Attribute on {}.{} ({}) changed: {} = {}'.format(
-            self._context().__class__.__name__,
-            self._name,
-            id(self),
-            name,
-            value))
+        if tracing.enabled:
+            log.debug('Attribute on {}.{} ({}) changed: {} = {}'.format(
+                self._context().__class__.__name__,
+                self._name,
+                id(self),
+                name,
+                value))
 
         self.notifyAttributeListeners(name, value)
 
@@ -487,8 +838,13 @@ class PropertyValue(object):
 
 
     def prepareListeners(self, att, name=None, value=None):
-        """Prepares a list of :class:`Listener` instances ready to be called,
-        and a list of arguments to pass to them.
+        """Prepares a tuple of :class:`Listener` instances ready to be called,
+        and a tuple of arguments to pass to them.
+
+        The listener tuples are cached, and only re-built after a listener
+        has been added, removed, enabled, or disabled, or after a weakly
+        referenced listener function has been garbage-collected (see
+        :meth:`_invalidateListeners`).
 
         :arg att:   If ``True``, attribute listeners are returned, otherwise
                     value listeners are returned.
@@ -497,11 +853,47 @@ class PropertyValue(object):
         """
 
         if not self.__notification:
-            return [], []
+            return (), ()
+
+        if att:
+            listeners = self.__attDispatch
+            if listeners is None:
+                listeners          = self.__buildDispatch(True)
+                self.__attDispatch = listeners
+        else:
+            listeners = self.__valueDispatch
+            if listeners is None:
+                listeners            = self.__buildDispatch(False)
+                self.__valueDispatch = listeners
+
+        # Don't bother preparing arguments
+        # if there is nobody to pass them to
+        if len(listeners) == 0:
+            return (), ()
+
+        if att:
+            args = (self._context(), name, value, self._name)
+        else:
+            args = (self.get(),
+                    self.__getValid(),
+                    self._context(),
+                    self._name)
+
+        return listeners, args
+
+
+    def __buildDispatch(self, att):
+        """Called by :meth:`prepareListeners`. Builds and returns a tuple
+        containing all enabled value or attribute listeners. Listeners with
+        functions which have been garbage-collected are removed.
+        """
 
         if att: lDict = self._attributeListeners
         else:   lDict = self._changeListeners
 
+        if lDict is None:
+            lDict = {}
+
         allListeners = []
 
         for lName, listener in list(lDict.items()):
@@ -509,16 +901,12 @@ class PropertyValue(object):
             if not listener.enabled:
                 continue
 
-            cb = listener.function
-
-            if isinstance(cb, weakfuncref.WeakFunctionRef):
-                cb = cb.function()
-
             # The owner of the referred function/method
             # has been GC'd - remove it
-            if cb is None:
+            if listener.getFunction() is None:
 
-                log.debug('Removing dead listener {}'.format(lName))
+                if tracing.enabled:
+                    log.debug('Removing dead listener {}'.format(lName))
                 if att:
                     self.removeAttributeListener(
                         self.__unsaltListenerName(lName))
@@ -533,18 +921,27 @@ class PropertyValue(object):
         # the pre-notify and post-notify functions
         if not att:
 
-            if self._preNotifyListener.function is not None and \
-               self._preNotifyListener.enabled:
-                allListeners = [self._preNotifyListener] + allListeners
+            pre  = self._preNotifyListener
+            post = self._postNotifyListener
+
+            if pre is not None and pre.function is not None and pre.enabled:
+                allListeners = [pre] + allListeners
+
+            if post is not None and post.function is not None and \
+               post.enabled:
+                allListeners = allListeners + [post]
 
-            if self._postNotifyListener.function is not None and \
-               self._postNotifyListener.enabled:
-                allListeners = allListeners + [self._postNotifyListener]
+        return tuple(allListeners)
 
-        if att: args = self._context(), name, value, self._name
-        else:   args = (self.get(), self.__valid, self._context(), self._name)
 
-        return allListeners, args
+    def _invalidateListeners(self):
+        """Discards the cached listener tuples used by
+        :meth:`prepareListeners`. Called whenever a listener is added,
+        removed, enabled or disabled, and when a weakly referenced listener
+        function is garbage-collected.
+        """
+        self.__valueDispatch = None
+        self.__attDispatch   = None
 
 
     def notifyAttributeListeners(self, name, value):
@@ -560,7 +957,9 @@ class PropertyValue(object):
                     callback,
                     overwrite=False,
                     weak=True,
-                    immediate=False):
+                    immediate=False,
+                    priority=0,
+                    changes=False):
         """Adds a listener for this value.
 
         When the value changes, the listener callback function is called. The
@@ -599,16 +998,45 @@ class PropertyValue(object):
                           ``CallQueue`` will not be used, and this listener
                           will be notified as soon as this ``PropertyValue``
                           changes.
+
+        :param priority:  Priority of this listener on the :attr:`queue`.
+                          Queued listeners with a higher priority are called
+                          before those with a lower priority. If
+                          :data:`.callqueue.IDLE`, the listener is only called
+                          when no other listeners are pending, and calls to
+                          its function are coalesced - see the
+                          :class:`.CallQueue`. Ignored for ``immediate``
+                          listeners.
+
+        :param changes:   Only applicable to :class:`PropertyValueList`
+                          and :class:`.ArrayProxy` instances. If ``True``,
+                          the callback function is passed a fifth argument -
+                          a list of records which describe the modifications
+                          that have been made to the value since the
+                          callback was last called (:class:`ListChange`
+                          records for lists, or the regions which were
+                          written to for arrays). This allows listeners to
+                          update their state incrementally, instead of
+                          comparing the entire value with its previous
+                          value.
         """
 
         if name in ('prenotify', 'postnotify'):
             raise ValueError('Reserved listener name used: {}. '
                              'Use a different name.'.format(name))
 
-        log.debug('Adding listener on {}.{}: {}'.format(
-            self._context().__class__.__name__,
-            self._name,
-            name))
+        if changes and not self._changeRecords:
+            raise ValueError('Change records are not available '
+                             'for {} listeners'.format(type(self).__name__))
+
+        if tracing.enabled:
+            log.debug('Adding listener on {}.{}: {}'.format(
+                self._context().__class__.__name__,
+                self._name,
+                name))
+
+        if self._changeListeners is None:
+            self._changeListeners = OrderedDict()
 
         fullName = self.__saltListenerName(name)
         prior    = self._changeListeners.get(fullName, None)
@@ -620,15 +1048,21 @@ class PropertyValue(object):
             raise RuntimeError('Listener {} already exists'.format(name))
 
         elif prior is not None:
+            prior.priority  = priority
             prior.function  = callback
             prior.immediate = immediate
+            prior.changes   = [] if changes else None
 
         else:
             self._changeListeners[fullName] = Listener(self,
                                                        fullName,
                                                        callback,
                                                        True,
-                                                       immediate)
+                                                       immediate,
+                                                       priority,
+                                                       changes)
+
+        self._invalidateListeners()
 
 
     def removeListener(self, name):
@@ -643,7 +1077,7 @@ class PropertyValue(object):
         #          this method
         # So to be a bit more informative, we'll examine the stack
         # and extract the (assumed) location of the original call
-        if log.getEffectiveLevel() == logging.DEBUG:
+        if tracing.enabled:
             import inspect
             stack = inspect.stack()
 
@@ -660,6 +1094,9 @@ class PropertyValue(object):
                 srcMod,
                 srcLine))
 
+        if self._changeListeners is None:
+            return
+
         name     = self.__saltListenerName(name)
         listener = self._changeListeners.pop(name, None)
 
@@ -672,20 +1109,19 @@ class PropertyValue(object):
             # a removed listener.
             listener.enabled = False
 
-            cb = listener.function
-
-            if isinstance(cb, weakfuncref.WeakFunctionRef):
-                cb = cb.function()
+            self._invalidateListeners()
 
-            if cb is not None:
-                PropertyValue.queue.dequeue(listener.makeQueueName())
+            if listener.getFunction() is not None:
+                PropertyValue.queue.dequeue(listener.queueName, listener)
 
 
     def enableListener(self, name):
         """(Re-)Enables the listener with the specified ``name``."""
         name = self.__saltListenerName(name)
-        log.debug('Enabling listener on {}: {}'.format(self._name, name))
-        self._changeListeners[name].enabled = True
+        if tracing.enabled:
+            log.debug('Enabling listener on {}: {}'.format(self._name, name))
+        (self._changeListeners or {})[name].enabled = True
+        self._invalidateListeners()
 
 
     def disableListener(self, name):
@@ -693,8 +1129,10 @@ class PropertyValue(object):
         remove it from the list of listeners.
         """
         name = self.__saltListenerName(name)
-        log.debug('Disabling listener on {}: {}'.format(self._name, name))
-        self._changeListeners[name].enabled = False
+        if tracing.enabled:
+            log.debug('Disabling listener on {}: {}'.format(self._name, name))
+        (self._changeListeners or {})[name].enabled = False
+        self._invalidateListeners()
 
 
     def getListenerState(self, name):
@@ -706,7 +1144,7 @@ class PropertyValue(object):
         """
 
         fullName = self.__saltListenerName(name)
-        listener = self._changeListeners.get(fullName, None)
+        listener = (self._changeListeners or {}).get(fullName, None)
 
         return listener.enabled
 
@@ -723,34 +1161,156 @@ class PropertyValue(object):
         ``False`` otherwise.
         """
 
+        if self._changeListeners is None:
+            return False
+
         name = self.__saltListenerName(name)
-        return name in self._changeListeners.keys()
+        return name in self._changeListeners
 
 
     def setPreNotifyFunction(self, preNotifyFunc):
         """Sets the function to be called on value changes, before any
         registered listeners.
         """
-        self._preNotifyListener.function = preNotifyFunc
+        if self._preNotifyListener is None:
+            self._preNotifyListener = Listener(self,
+                                               'prenotify',
+                                               preNotifyFunc,
+                                               True,
+                                               True)
+        else:
+            self._preNotifyListener.function = preNotifyFunc
+
+        self._invalidateListeners()
 
 
     def setPostNotifyFunction(self, postNotifyFunc):
         """Sets the function to be called on value changes, after any
         registered listeners.
         """
-        self._postNotifyListener.function = postNotifyFunc
+        if self._postNotifyListener is None:
+            self._postNotifyListener = Listener(self,
+                                                'postnotify',
+                                                postNotifyFunc,
+                                                True,
+                                                False)
+        else:
+            self._postNotifyListener.function = postNotifyFunc
+
+        self._invalidateListeners()
 
 
     def getLast(self):
-        """Returns the most recent property value before the current one."""
-        return self.__lastValue
+        """Returns the most recent property value before the current one, or
+        ``None`` if it has not been retained (see the ``retainLast``
+        parameter to :meth:`__init__`).
+        """
+
+        publisher = self._getPublisher()
+
+        if publisher is not None:
+            return publisher.getLast()
+
+        lastValue = self.__lastValue
+
+        if self.__retainLast == 'weak' and lastValue is not None:
+            lastValue = lastValue()
+
+        return lastValue
 
 
     def get(self):
-        """Returns the current property value."""
+        """Returns the current property value. If this ``PropertyValue`` is
+        subscribed to another one (see :func:`.bindable.broadcastPropVals`),
+        the value of the latter is returned.
+        """
+        publisher = self._getPublisher()
+
+        if publisher is not None:
+            return publisher.get()
         return self.__value
 
 
+    def __getValid(self):
+        """Returns the validity of the current property value. """
+        publisher = self._getPublisher()
+
+        if publisher is not None:
+            return publisher.__getValid()
+        return self.__valid
+
+
+    def _getPublisher(self):
+        """Returns the ``PropertyValue`` that this ``PropertyValue`` is
+        subscribed to (see :func:`.bindable.broadcastPropVals`), or ``None``.
+
+        If the publisher, or its context, no longer exists, this
+        ``PropertyValue`` is unsubscribed from it, and keeps the most
+        recent value of the publisher.
+        """
+
+        if self._publisher is None:
+            return None
+
+        publisher = self._publisher()
+
+        if publisher is not None and publisher._context() is not None:
+            return publisher
+
+        if tracing.enabled:
+            log.debug('Publisher of {}.{} ({}) no longer exists - '
+                      'unsubscribing'.format(
+                          self._context().__class__.__name__,
+                          self._name,
+                          id(self)))
+
+        if publisher is not None:
+            publisher._subscribers.pop(id(self), None)
+            self._copyPublisherValue(publisher)
+
+        self._publisher = None
+        return None
+
+
+    def _copyPublisherValue(self, publisher):
+        """Called by :func:`.bindable.broadcastPropVals` and
+        :func:`.bindable.syncAndNotify` when this ``PropertyValue`` is
+        subscribed to the given ``publisher``, or when the value of the
+        ``publisher`` has changed. Keeps a reference to the publisher value
+        and validity, so that they are retained if the publisher is deleted
+        (see :meth:`_getPublisher`).
+        """
+        self.__value = publisher.get()
+        self.__valid = publisher.__getValid()
+
+
+    def _setPublisher(self, publisher):
+        """Called by :func:`.bindable.broadcastPropVals`. Sets the
+        ``PropertyValue`` from which this ``PropertyValue`` reads its value,
+        or clears it if ``publisher is None``. When it is cleared, the
+        current value of the publisher is copied, so that this
+        ``PropertyValue`` retains it.
+
+        Returns ``True`` if the value, or its validity, has changed as a
+        result, ``False`` otherwise.
+        """
+
+        oldValue = self.get()
+        oldValid = self.__getValid()
+
+        if publisher is None:
+            self.__value    = oldValue
+            self.__valid    = oldValid
+            self._publisher = None
+            return False
+
+        self._publisher = weakref.ref(publisher)
+        self._copyPublisherValue(publisher)
+
+        return (oldValid != self.__valid) or \
+            not self._equalityFunc(oldValue, self.__value)
+
+
     def set(self, newValue):
         """Sets the property value.
 
@@ -759,8 +1319,43 @@ class PropertyValue(object):
         :meth:`propNotify` method.  If ``allowInvalid`` was set to
         ``False``, and the new value is not valid, a :exc:`ValueError` is
         raised, and listeners are not notified.
+
+        If this ``PropertyValue`` is subscribed to another one (see
+        :func:`.bindable.broadcastPropVals`), the value is cast and validated
+        by this ``PropertyValue``, and then passed to the latter, which will
+        notify the listeners of this ``PropertyValue``.
         """
 
+        # Values are passed to our publisher, if
+        # we have one, after being cast and
+        # validated with our own context. If we
+        # are part of a batch update, so is the
+        # publisher, for the duration of the call.
+        publisher = self._getPublisher()
+        if publisher is not None:
+
+            if self._castFunc is not None:
+                newValue = self._castFunc(self._context(),
+                                          self._attributes,
+                                          newValue)
+
+            if self._validate is not None and not self._allowInvalid:
+                self._validate(self._context(), self._attributes, newValue)
+
+            allow = publisher.allowInvalid()
+            batch = publisher._batch
+
+            publisher.allowInvalid(self._allowInvalid)
+            if batch is None:
+                publisher._batch = self._batch
+
+            try:
+                publisher.set(newValue)
+            finally:
+                publisher.allowInvalid(allow)
+                publisher._batch = batch
+            return
+
         # cast the value if necessary.
         # Allow any errors to be thrown
         if self._castFunc is not None:
@@ -782,33 +1377,53 @@ class PropertyValue(object):
             validStr = str(e)
             if not self._allowInvalid:
                 import traceback
-                log.debug('Attempt to set {}.{} to an invalid value ({}), '
-                          'but allowInvalid is False ({})'.format(
-                              self._context().__class__.__name__,
-                              self._name,
-                              newValue,
-                              e), exc_info=True)
+                if tracing.enabled:
+                    log.debug('Attempt to set {}.{} to an invalid value ({}), '
+                              'but allowInvalid is False ({})'.format(
+                                  self._context().__class__.__name__,
+                                  self._name,
+                                  newValue,
+                                  e), exc_info=True)
                 traceback.print_stack()
                 raise e
 
-        self.__lastValue = self.__value
-        self.__lastValid = self.__valid
+        lastValue        = self.__value
+        lastValid        = self.__valid
+        self.__lastValid = lastValid
         self.__value     = newValue
         self.__valid     = valid
 
+        # Keep a reference to the previous
+        # value, if we have been asked to
+        retain = self.__retainLast
+
+        if retain == 'full':
+            self.__lastValue = lastValue
+        elif retain == 'weak':
+            try:              self.__lastValue = weakref.ref(lastValue)
+            except TypeError: self.__lastValue = None
+
+        # If this is a list item, the parent
+        # list needs to discard its array
+        # of item values (see asarray)
+        if self.__parent is not None:
+            parent = self.__parent()
+            if parent is not None: parent._clearArray()
+
         # If the value or its validity has not
         # changed, listeners are not notified
-        changed = (self.__valid != self.__lastValid) or \
-                  not self._equalityFunc(self.__value, self.__lastValue)
+        changed = (valid != lastValid) or \
+                  not self._equalityFunc(newValue, lastValue)
 
         if not changed: return
 
-        log.debug('Value {}.{} changed: {} -> {} ({})'.format(
-            self._context().__class__.__name__,
-            self._name,
-            self.__lastValue,
-            self.__value,
-            'valid' if valid else 'invalid - {}'.format(validStr)))
+        if tracing.enabled:
+            log.debug('Value {}.{} changed: {} -> {} ({})'.format(
+                self._context().__class__.__name__,
+                self._name,
+                lastValue,
+                newValue,
+                'valid' if valid else 'invalid - {}'.format(validStr)))
 
         # Notify any registered listeners.
         self.propNotify()
@@ -817,8 +1432,16 @@ class PropertyValue(object):
     def propNotify(self):
         """Notifies registered listeners - see the
         :func:`.bindable.syncAndNotify` function.
+
+        If this ``PropertyValue`` is part of a batch update (see
+        :meth:`.HasProperties.batch`), synchronisation and notification is
+        deferred until the batch is finished.
         """
 
+        if self._batch is not None:
+            self._batch[id(self)] = self
+            return
+
         bindable.syncAndNotify(self)
 
         # If this PV is a member of a PV list,
@@ -845,6 +1468,16 @@ class PropertyValue(object):
         return True
 
 
+    def _getChanges(self):
+        """Returns a list of records which describe the change that is
+        currently being notified. The records are passed to listeners which
+        were registered with ``changes=True`` (see :meth:`addListener`).
+        Must be overridden by sub-classes which set ``_changeRecords`` to
+        ``True``.
+        """
+        raise NotImplementedError()
+
+
 class PropertyValueList(PropertyValue):
     """A ``PropertyValueList`` is a :class:`PropertyValue` instance which
     stores other :class:`PropertyValue` instance in a list. Instances of
@@ -905,14 +1538,70 @@ class PropertyValueList(PropertyValue):
     are accessible through the :meth:`getPropertyValueList` method) to be
     nofitied of changes to those values only.
 
+    In order to keep memory usage down for large lists, the ``PropertyValue``
+    instance for each list item is not created until it is needed - list
+    items are stored as plain (cast and, if necessary, validated) values
+    until :meth:`getPropertyValue` or :meth:`getPropertyValueList` is
+    called, e.g. to register a listener on, or to set an attribute of, an
+    item. All items of a list which is bound to another list are stored as
+    ``PropertyValue`` instances.
+
     There are some interesting type-specific subclasses of the
     ``PropertyValueList``, which provide additional functionality:
 
       - The :class:`.PointValueList`, for :class:`.Point` properties.
 
       - The :class:`.BoundsValueList`, for :class:`.Bounds` properties.
+
+
+    While a list modification is being synchronised and notified, the
+    ``_listChanges`` attribute contains a tuple which describes the
+    modification, so that bound lists can be patched, instead of being
+    compared item by item (see :func:`.bindable._syncPropValLists`). It
+    is one of:
+
+      - ``('insert', index, count)``: ``count`` items were inserted at
+        ``index``.
+      - ``('delete', indices)``: The items at the given (sorted) indices
+        were removed.
+      - ``('move', from_, to)``: An item was moved (see :meth:`move`).
+      - ``('reorder', idxs)``: The list was re-ordered (see
+        :meth:`reorder`).
+      - ``('set', indices)``: The values of the items at the given
+        indices were changed.
+
+    At all other times, ``_listChanges`` is ``None``.
+    """
+
+
+    _changeRecords = True
+
+
+    _broadcast = False
+
+
+    _arrayCastThreshold = 32
+    """Minimum number of items for which the vectorised item cast/validate
+    functions are used (see :meth:`__init__`). For smaller numbers of items,
+    the overhead of creating ``numpy`` arrays outweighs the cost of casting
+    and validating the items one by one.
     """
 
+
+    __slots__ = ('_itemCastFunc',
+                 '_itemValidateFunc',
+                 '_itemEqualityFunc',
+                 '_itemAllowInvalid',
+                 '_itemAttributes',
+                 '_itemName',
+                 '_itemDtype',
+                 '_itemCastArrayFunc',
+                 '_itemValidateArrayFunc',
+                 '_ignoreListItems',
+                 '_listChanges',
+                 '__indexMap',
+                 '__array')
+
     def __init__(self,
                  context,
                  name=None,
@@ -925,7 +1614,11 @@ class PropertyValueList(PropertyValue):
                  preNotifyFunc=None,
                  postNotifyFunc=None,
                  listAttributes=None,
-                 itemAttributes=None):
+                 itemAttributes=None,
+                 itemDtype=None,
+                 itemCastArrayFunc=None,
+                 itemValidateArrayFunc=None,
+                 retainLast='full'):
         """Create a ``PropertyValueList``.
 
         :param context:          See :meth:`PropertyValue.__init__`.
@@ -955,6 +1648,25 @@ class PropertyValueList(PropertyValue):
         :param itemAttributes:   Attributes to be associated with new
                                  ``PropertyValue`` items added to
                                  the list.
+
+        :param itemDtype:        ``numpy`` data type to use for the array
+                                 returned by :meth:`asarray`. If not
+                                 provided, the data type is inferred from
+                                 the list values.
+
+        :param itemCastArrayFunc:     Function which casts many list items
+                                      at once, returning a ``numpy`` array
+                                      of type ``itemDtype``. Only used if
+                                      ``itemDtype`` is provided.
+
+        :param itemValidateArrayFunc: Function which validates a ``numpy``
+                                      array of list items. Only used if
+                                      ``itemDtype`` is provided.
+
+        :param retainLast:       See :meth:`PropertyValue.__init__`. Only
+                                 ``'full'`` and ``'none'`` are useful for
+                                 lists, as the list of previous values cannot
+                                 be weakly referenced.
         """
         if name is None: name = 'PropertyValueList_{}'.format(id(self))
 
@@ -991,6 +1703,7 @@ class PropertyValueList(PropertyValue):
             validateFunc=listValid,
             preNotifyFunc=preNotifyFunc,
             postNotifyFunc=postNotifyFunc,
+            retainLast=retainLast,
             **listAttributes)
 
         # These attributes are passed to the PropertyValue
@@ -1000,6 +1713,19 @@ class PropertyValueList(PropertyValue):
         self._itemEqualityFunc = itemEquals
         self._itemAllowInvalid = itemAllowInvalid
         self._itemAttributes   = itemAttributes
+        self._itemName         = '{}_Item'.format(name)
+        self._itemDtype        = itemDtype
+
+        # Vectorised item cast/validation functions
+        # - these are used in place of the item
+        # cast/validate functions when many items
+        # without a PropertyValue are assigned
+        if itemDtype is None:
+            itemCastArrayFunc     = None
+            itemValidateArrayFunc = None
+
+        self._itemCastArrayFunc     = itemCastArrayFunc
+        self._itemValidateArrayFunc = itemValidateArrayFunc
 
         # Internal flag used in the __setitem__
         # and _listPVChanged methods indicating
@@ -1009,8 +1735,21 @@ class PropertyValueList(PropertyValue):
         # may change in the future.
         self._ignoreListItems  = False
 
-        # The list of PropertyValue objects.
-        if values is not None: values = [self.__newItem(v) for v in values]
+        # Describes the list modification which
+        # is currently being notified, and a
+        # {id(PV) : index} mapping for the items
+        # in the list, created on demand
+        self._listChanges      = None
+        self.__indexMap        = None
+
+        # A read-only numpy array containing
+        # the list values, created on demand
+        # by asarray, and cleared whenever
+        # the list values change.
+        self.__array           = None
+
+        # The list of items - see __listItems.
+        if values is not None: values = self.__listItems(values)
         else:                  values = []
 
         PropertyValue.set(self, values)
@@ -1029,7 +1768,7 @@ class PropertyValueList(PropertyValue):
 
         return all([self._itemEqualityFunc(ai, bi)
                     for ai, bi
-                    in zip(self[:], other[:])])
+                    in zip(self, other)])
 
 
     def getPropertyValueList(self):
@@ -1037,7 +1776,217 @@ class PropertyValueList(PropertyValue):
         access to the ``PropertyValue`` instances which manage each list
         item.
         """
-        return list(PropertyValue.get(self))
+        items = PropertyValue.get(self)
+
+        for i, item in enumerate(items):
+            if not isinstance(item, PropertyValue):
+                self.__createItemPropVal(items, i)
+
+        return list(items)
+
+
+    def getPropertyValue(self, index):
+        """Return the ``PropertyValue`` instance which manages the list item
+        at the given index. Use this instead of :meth:`getPropertyValueList`
+        if you only need access to one item, as it does not copy the list,
+        nor create ``PropertyValue`` instances for any other items.
+        """
+        items = PropertyValue.get(self)
+
+        if isinstance(items[index], PropertyValue):
+            return items[index]
+
+        return self.__createItemPropVal(items, index)
+
+
+    def __createItemPropVal(self, items, index):
+        """Creates a ``PropertyValue`` instance for the raw list item at
+        the given index, and replaces the item with it in the given
+        ``items`` list (which must be the underlying list).
+        """
+
+        propVal         = self.__newItem(items[index])
+        items[index]    = propVal
+        self.__indexMap = None
+
+        return propVal
+
+
+    def __listItems(self, values):
+        """Called whenever new items are added to the list. Returns a list
+        of items to be stored - for bound lists (see the :mod:`.bindable`
+        module), ``PropertyValue`` instances are created. Otherwise the
+        values are cast and validated, and stored as-is.
+        """
+
+        if self._listPropValMaps:
+            return [self.__newItem(v) for v in values]
+        else:
+            return self.__castItems(values)
+
+
+    def __castItems(self, values):
+        """Casts and validates all of the given values, in the same way
+        as :meth:`__castItem`, and returns them in a list. For numeric
+        lists, the values are cast, clamped and validated at once, using
+        the vectorised item cast/validate functions.
+        """
+
+        if not isinstance(values, (list, tuple, np.ndarray)):
+            values = list(values)
+
+        if not self.__castAsArray(values):
+            return [self.__castItem(v) for v in values]
+
+        if self._itemAttributes is None: itemAtts = {}
+        else:                            itemAtts = self._itemAttributes
+
+        ctx    = self._context()
+        values = self._itemCastArrayFunc(ctx, itemAtts, values)
+
+        if not self._itemAllowInvalid and \
+           self._itemValidateArrayFunc is not None:
+            self._itemValidateArrayFunc(ctx, itemAtts, values)
+
+        return values.tolist()
+
+
+    def __castAsArray(self, values):
+        """Returns ``True`` if the given sequence of values should be
+        cast and validated with the vectorised item functions, ``False``
+        otherwise.
+        """
+        return self._itemCastArrayFunc is not None and \
+            len(values) >= self._arrayCastThreshold
+
+
+    def __castItem(self, item):
+        """Casts and validates the given value, in the same way that a
+        ``PropertyValue`` item would, without creating a ``PropertyValue``.
+        Raises a :exc:`ValueError` if the value is invalid, and invalid
+        item values are not allowed.
+        """
+
+        if self._itemAttributes is None: itemAtts = {}
+        else:                            itemAtts = self._itemAttributes
+
+        if self._itemCastFunc is not None:
+            item = self._itemCastFunc(self._context(), itemAtts, item)
+
+        if not self._itemAllowInvalid and self._itemValidateFunc is not None:
+            self._itemValidateFunc(self._context(), itemAtts, item)
+
+        return item
+
+
+    def _setPropertyValueList(self, propVals, changes=None):
+        """Replaces the underlying property value list with the given list of
+        ``PropertyValue`` items, and notifies listeners. All modifications
+        to the list are made through this method.
+
+        :arg propVals: New list of ``PropertyValue`` items.
+        :arg changes:  A tuple describing the modification - see the
+                       class documentation.
+        """
+
+        self.__indexMap   = None
+        self.__array      = None
+        self._listChanges = changes
+
+        try:
+            PropertyValue.set(self, propVals)
+        finally:
+            self._listChanges = None
+
+
+    def asarray(self):
+        """Returns the values in this list as a read-only ``numpy`` array.
+        The array is created on the first call, and is then re-used until
+        the list is modified, or the value of any item changes, so this
+        method is cheap to call repeatedly.
+        """
+
+        if self.__array is None:
+
+            values = (_itemValue(i) for i in PropertyValue.get(self))
+
+            if self._itemDtype is not None:
+                array = np.fromiter(values, self._itemDtype, len(self))
+            else:
+                array = np.array(list(values))
+
+            array.flags.writeable = False
+            self.__array          = array
+
+        return self.__array
+
+
+    def _clearArray(self):
+        """Called when the value of a list item has been set. Clears the
+        array returned by :meth:`asarray`.
+        """
+        self.__array = None
+
+
+    def _getChanges(self):
+        """Overrides :meth:`PropertyValue._getChanges`. Returns a list
+        containing a single :class:`ListChange`, which describes the change
+        that is currently being notified on this list.
+        """
+        return [self._getListChange()]
+
+
+    def _getListChange(self):
+        """Returns a :class:`ListChange` which describes the change that is
+        currently being notified on this list (see the ``_listChanges``
+        attribute).
+        """
+
+        changes = self._listChanges
+
+        if changes is None:
+            return ListChange('reset', None)
+
+        op = changes[0]
+
+        if op == 'insert':
+            index, count = changes[1:]
+            return ListChange('inserted', tuple(range(index, index + count)))
+
+        elif op == 'delete':  return ListChange('removed',      changes[1])
+        elif op == 'set':     return ListChange('itemsChanged', changes[1])
+        elif op == 'reorder': return ListChange('moved',        changes[1])
+
+        # op == 'move'
+        from_, to = changes[1:]
+        perm      = list(range(len(self)))
+        perm.insert(to, perm.pop(from_))
+
+        return ListChange('moved', tuple(perm))
+
+
+    def _indexOfPropVal(self, propVal):
+        """Returns the index of the given ``PropertyValue`` item in this list,
+        or ``None`` if it is not in the list.
+        """
+
+        indexMap = self.__indexMap
+
+        if indexMap is None:
+            propVals        = PropertyValue.get(self)
+            indexMap        = {id(pv) : i for i, pv in enumerate(propVals)}
+            self.__indexMap = indexMap
+
+        return indexMap.get(id(propVal), None)
+
+
+    def __normIndex(self, index):
+        """Converts the given (possibly negative) index into a positive
+        index, in the same way as ``list.pop``.
+        """
+        if index < 0:
+            index += len(PropertyValue.get(self))
+        return index
 
 
     def get(self):
@@ -1055,7 +2004,10 @@ class PropertyValueList(PropertyValue):
         length,  an :exc:`IndexError` is raised.
         """
 
-        if self._itemCastFunc is not None:
+        # Large numeric lists are cast
+        # when the values are assigned
+        if self._itemCastFunc is not None and \
+           not self.__castAsArray(newValues):
             newValues = [self._itemCastFunc(
                 self._context(),
                 self._itemAttributes,
@@ -1074,7 +2026,7 @@ class PropertyValueList(PropertyValue):
 
         propVal = PropertyValue(
             self._context(),
-            name='{}_Item'.format(self._name),
+            name=self._itemName,
             value=item,
             castFunc=self._itemCastFunc,
             allowInvalid=self._itemAllowInvalid,
@@ -1093,7 +2045,7 @@ class PropertyValueList(PropertyValue):
         lastVal = PropertyValue.getLast(self)
 
         if lastVal is None: return None
-        else:               return [pv.get() for pv in lastVal]
+        else:               return [_itemValue(i) for i in lastVal]
 
 
     def _listPVChanged(self, pv):
@@ -1105,65 +2057,86 @@ class PropertyValueList(PropertyValue):
         if self._ignoreListItems:
             return
 
-        log.debug('List item {}.{} changed ({}) - notifying '
-                  'list-level listeners ({})'.format(
-                      self._context().__class__.__name__,
-                      self._name,
-                      id(self._context()),
-                      pv))
-        self.propNotify()
+        if tracing.enabled:
+            log.debug('List item {}.{} changed ({}) - notifying '
+                      'list-level listeners ({})'.format(
+                          self._context().__class__.__name__,
+                          self._name,
+                          id(self._context()),
+                          pv))
 
+        index = self._indexOfPropVal(pv)
 
+        if index is not None: self._listChanges = ('set', (index,))
+
+        try:
+            self.propNotify()
+        finally:
+            self._listChanges = None
+
+
+    # Items are never added to, removed from,
+    # or moved within the underlying list in
+    # place - a new list is created on every
+    # such change (see _setPropertyValueList).
+    # So the methods below can access it
+    # directly, without having to copy it,
+    # and iteration is not affected by
+    # additions/removals made while iterating.
     def __getitem__(self, key):
-        vals = [pv.get() for pv in PropertyValue.get(self)]
-        return vals.__getitem__(key)
+        items = PropertyValue.get(self)
+        if isinstance(key, slice):
+            return [_itemValue(i) for i in items[key]]
+        return _itemValue(items[key])
 
     def __len__(     self):
-        return self[:].__len__()
+        return len(PropertyValue.get(self))
     def __repr__(    self):
         return self[:].__repr__()
     def __str__(     self):
         return self[:].__str__()
     def __iter__(    self):
-        return self[:].__iter__()
+        return (_itemValue(i) for i in PropertyValue.get(self))
     def __contains__(self, item):
-        return self[:].__contains__(item)
-    def index(       self, item):
-        return self[:].index(item)
+        return any(v == item for v in self)
     def count(       self, item):
-        return self[:].count(item)
+        return sum(1 for v in self if v == item)
+
+    def index(self, item):
+        for i, v in enumerate(self):
+            if v == item:
+                return i
+        raise ValueError('{} is not in list'.format(item))
 
 
     def insert(self, index, item):
         """Inserts the given item before the given index. """
-
-        propVals = self.getPropertyValueList()
-        propVals.insert(index, self.__newItem(item))
-        PropertyValue.set(self, propVals)
+        self.insertAll(index, [item])
 
 
     def insertAll(self, index, items):
         """Inserts all of the given items before the given index."""
 
-        propVals = self.getPropertyValueList()
-        propVals[index:index] = [self.__newItem(i) for i in items]
-        PropertyValue.set(self, propVals)
+        propVals = list(PropertyValue.get(self))
+        newItems = self.__listItems(items)
+
+        # Normalise the index in the same
+        # way that list.insert does
+        index = min(max(self.__normIndex(index), 0), len(propVals))
+
+        propVals[index:index] = newItems
+        self._setPropertyValueList(propVals,
+                                   ('insert', index, len(newItems)))
 
 
     def append(self, item):
         """Appends the given item to the end of the list."""
-
-        propVals = self.getPropertyValueList()
-        propVals.append(self.__newItem(item))
-        PropertyValue.set(self, propVals)
+        self.insertAll(len(self), [item])
 
 
     def extend(self, iterable):
         """Appends all items in the given iterable to the end of the list."""
-
-        propVals = self.getPropertyValueList()
-        propVals.extend([self.__newItem(i) for i in iterable])
-        PropertyValue.set(self, propVals)
+        self.insertAll(len(self), iterable)
 
 
     def pop(self, index=-1):
@@ -1171,18 +2144,19 @@ class PropertyValueList(PropertyValue):
         last).
         """
 
-        propVals      = self.getPropertyValueList()
+        propVals      = list(PropertyValue.get(self))
+        index         = self.__normIndex(index)
         poppedPropVal = propVals.pop(index)
-        PropertyValue.set(self, propVals)
-        return poppedPropVal.get()
+        self._setPropertyValueList(propVals, ('delete', (index,)))
+        return _itemValue(poppedPropVal)
 
 
     def move(self, from_, to):
         """Move the item from 'from\_' to 'to'."""
 
-        propVals = self.getPropertyValueList()
+        propVals = list(PropertyValue.get(self))
         propVals.insert(to, propVals.pop(from_))
-        PropertyValue.set(self, propVals)
+        self._setPropertyValueList(propVals, ('move', from_, to))
 
 
     def remove(self, value):
@@ -1197,13 +2171,19 @@ class PropertyValueList(PropertyValue):
         values.
         """
 
-        propVals = self.getPropertyValueList()
-        listVals = [pv.get() for pv in propVals]
+        propVals = list(PropertyValue.get(self))
+        listVals = [_itemValue(i) for i in propVals]
+        indices  = list(range(len(propVals)))
+        removed  = []
 
         for v in values:
-            propVals.pop(listVals.index(v))
+            idx = listVals.index(v)
+            listVals.pop(idx)
+            propVals.pop(idx)
+            removed.append(indices.pop(idx))
 
-        PropertyValue.set(self, propVals)
+        self._setPropertyValueList(propVals,
+                                   ('delete', tuple(sorted(removed))))
 
 
     def reorder(self, idxs):
@@ -1219,10 +2199,10 @@ class PropertyValueList(PropertyValue):
         if idxs == list(range(len(self))):
             return
 
-        propVals = self.getPropertyValueList()
+        propVals = PropertyValue.get(self)
         propVals = [propVals[i] for i in idxs]
 
-        PropertyValue.set(self, propVals)
+        self._setPropertyValueList(propVals, ('reorder', tuple(idxs)))
 
 
     def __setitem__(self, key, values):
@@ -1236,7 +2216,7 @@ class PropertyValueList(PropertyValue):
                     'PropertyValueList does not support complex slices')
 
         elif isinstance(key, int):
-            indices = [key]
+            indices = [self.__normIndex(key)]
             values  = [values]
         else:
             raise IndexError('Invalid key type')
@@ -1244,55 +2224,91 @@ class PropertyValueList(PropertyValue):
         # Replacement of all items in list
         if len(indices) == len(self) and \
            len(indices) != len(values):
-
-            notifState = self.getNotificationState()
-            self.disableNotification()
-            del self[:]
-            self.setNotificationState(notifState)
-            self.extend(values)
+            self._setPropertyValueList(self.__listItems(values))
             return
 
-        # prepare the new values
-        propVals    = self.getPropertyValueList()
-        oldVals     = [pv.get() for pv in propVals]
-        changedVals = [False] * len(self)
+        # prepare the new values - we
+        # only need to look at the items
+        # which are being assigned
+        propVals    = PropertyValue.get(self)
+        changedVals = {}
+
+        # If none of the assigned items have
+        # a PV, the new values can be cast
+        # and validated all at once
+        preCast = self.__castAsArray(values) and \
+            not any(isinstance(propVals[i], PropertyValue) for i in indices)
+
+        if preCast:
+            values = self.__castItems(values)
 
         # Update the PV instances that
         # correspond to the new values,
-        # but suppress notification on them
+        # but suppress notification on them.
+        # Items which do not have a PV are
+        # updated in place.
         self._ignoreListItems = True
 
         try:
             for idx, val in zip(indices, values):
 
-                propVal    = propVals[idx]
-                notifState = propVal.getNotificationState()
+                propVal = propVals[idx]
+
+                if preCast:
+                    oldVal        = propVal
+                    newVal        = val
+                    propVals[idx] = newVal
+
+                elif isinstance(propVal, PropertyValue):
+                    oldVal     = propVal.get()
+                    notifState = propVal.getNotificationState()
+
+                    propVal.disableNotification()
+                    propVal.set(val)
+                    propVal.setNotificationState(notifState)
+
+                    newVal = propVal.get()
+
+                else:
+                    oldVal        = propVal
+                    newVal        = self.__castItem(val)
+                    propVals[idx] = newVal
 
-                propVal.disableNotification()
-                propVal.set(val)
-                propVal.setNotificationState(notifState)
+                changedVals[idx] = changedVals.get(idx, False) or \
+                    not self._itemEqualityFunc(newVal, oldVal)
 
-                changedVals[idx] = not self._itemEqualityFunc(
-                    propVal.get(), oldVals[idx])
+            self.__array = None
 
             # Notify list-level and item-level listeners
             # if any values in the list were changed
-            if any(changedVals):
+            if any(changedVals.values()):
 
-                log.debug('Notifying list-level listeners ({}.{} {})'.format(
-                    self._context().__class__.__name__,
-                    self._name,
-                    id(self._context())))
+                if tracing.enabled:
+                    log.debug('Notifying list-level listeners '
+                              '({}.{} {})'.format(
+                                  self._context().__class__.__name__,
+                                  self._name,
+                                  id(self._context())))
 
-                self.propNotify()
+                changed = tuple([i for i in indices if changedVals[i]])
 
-                log.debug('Notifying item-level listeners ({}.{} {})'.format(
-                    self._context().__class__.__name__,
-                    self._name,
-                    id(self._context())))
+                self._listChanges = ('set', changed)
+
+                try:
+                    self.propNotify()
+                finally:
+                    self._listChanges = None
+
+                if tracing.enabled:
+                    log.debug('Notifying item-level listeners '
+                              '({}.{} {})'.format(
+                                  self._context().__class__.__name__,
+                                  self._name,
+                                  id(self._context())))
 
                 for idx in indices:
-                    if changedVals[idx]:
+                    if changedVals[idx] and \
+                       isinstance(propVals[idx], PropertyValue):
                         propVals[idx].propNotify()
 
         finally:
@@ -1302,9 +2318,23 @@ class PropertyValueList(PropertyValue):
     def __delitem__(self, key):
         """Remove items at the specified index/slice from the list."""
 
-        propVals = self.getPropertyValueList()
+        propVals = list(PropertyValue.get(self))
+
+        if isinstance(key, slice):
+            indices = sorted(range(*key.indices(len(propVals))))
+        else:
+            indices = [self.__normIndex(key)]
+
         propVals.__delitem__(key)
-        PropertyValue.set(self, propVals)
+        self._setPropertyValueList(propVals, ('delete', tuple(indices)))
+
+
+def _itemValue(item):
+    """Used by :class:`PropertyValueList`. Returns the value of the given list
+    item, which may or may not be a :class:`PropertyValue`.
+    """
+    if isinstance(item, PropertyValue): return item.get()
+    else:                               return item
 
 
 def safeCall(func, *args, **kwargs):
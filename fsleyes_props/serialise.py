@@ -190,3 +190,16 @@ def _serialise_Point(value, *a):
 def _deserialise_Point(value, *a):
     value = value.split(DELIMITER)
     return map(float, value)
+
+
+def _serialise_MappedArray(value, *a):
+
+    # Only the file path is stored
+    path = value.getPath()
+    if path is None: return ''
+    else:            return path
+
+
+def _deserialise_MappedArray(value, *a):
+    if value == '': return None
+    else:           return value
@@ -54,15 +54,32 @@ This synchronisation can be toggled on the child instance, via the
 :class:`SyncableHasProperties` class.  Listeners to sync state changes may
 be registered on the child instance via the :meth:`addSyncChangeListener`
 method (and de-registered via the :meth:`removeSyncChangeListener` method).
+
+By default, sync change listeners are not notified of changes made through
+:meth:`syncToParent`, :meth:`unsyncFromParent`, or any of the other methods
+of the ``SyncableHasProperties`` class - sub-classes may set the
+:attr:`SyncableHasProperties._notifySyncChanges` attribute to ``True`` to
+change this.
+
+Where possible, the properties of a child are synchronised with a broadcast
+binding (see :func:`.bindable.broadcastProps`) - while a property is
+synchronised, the child does not store its own value, but returns the value
+of the parent, so that a change to a parent value does not require the
+value of every child to be updated. When the property is unsynchronised,
+the child takes a copy of the parent value.
 """
 
 
 import weakref
 import logging
 
+import deprecation
+
 from . import properties       as props
-from . import suppress         as suppress
 from . import properties_types as types
+from . import properties_value as propvals
+from . import bindable
+from . import tracing
 
 
 log = logging.getLogger(__name__)
@@ -72,44 +89,152 @@ _SYNC_SALT_ = '_sync_'
 """Constant string added to sync-related property names and listeners."""
 
 
+def _saltSyncPropertyName(propName):
+    """Adds a prefix to the given property name, to be used as the name of
+    the corresponding sync property.
+    """
+    return '{}{}'.format(_SYNC_SALT_, propName)
+
+
+def _unsaltSyncPropertyName(syncPropName):
+    """Removes the prefix added by :func:`_saltSyncPropertyName`. """
+    return syncPropName[len(_SYNC_SALT_):]
+
+
 class SyncableHasProperties(props.HasProperties):
     """An extension to the ``HasProperties`` class which supports parent-child
     relationships between instances.
     """
 
 
-    @classmethod
-    def __saltSyncPropertyName(cls, propName):
-        """Adds a prefix to the given property name, to be used as the
-        name for the corresponding boolean sync property.
-        """
-        return '{}{}'.format(_SYNC_SALT_, propName)
+    _notifySyncChanges = False
+    """Sub-classes may set this to ``True`` so that sync change listeners
+    (see :meth:`addSyncChangeListener`) are notified of every sync state
+    change, including those made through :meth:`syncToParent`,
+    :meth:`unsyncFromParent`, and the other methods of this class. By
+    default, sync change listeners are only notified when the sync state
+    is changed through the property returned by :meth:`getSyncProperty`.
+    """
 
 
-    @classmethod
-    def __unsaltSyncPropertyName(cls, propName):
-        """Removes a prefix from the given property name, which was
-        added by the :meth:`_saltSyncPropertyName` method.
-        """
-        return propName[len(_SYNC_SALT_):]
+    __synced = None
+    """Set on each instance by :meth:`__init__`. Defined here so that it can
+    be used to tell whether an instance has been initialised - see
+    :meth:`_initLazyProperty`.
+    """
+
+
+    __syncPropVals = None
+    """Set on each instance by :meth:`__init__`. """
 
 
     @classmethod
+    @deprecation.deprecated(deprecated_in='1.3.0',
+                            removed_in='2.0.0',
+                            details='Use syncToParent, unsyncFromParent, '
+                                    'isSyncedToParent and '
+                                    'addSyncChangeListener instead')
     def getSyncPropertyName(cls, propName):
         """Returns the name of the boolean property which can be used to
         toggle binding of the given property to the parent property of
-        this instance.
+        this instance. See :meth:`getSyncProperty`.
         """
-        return cls.__saltSyncPropertyName(propName)
+        cls.__addSyncProperty(propName)
+        return _saltSyncPropertyName(propName)
 
 
     @classmethod
+    @deprecation.deprecated(deprecated_in='1.3.0',
+                            removed_in='2.0.0',
+                            details='Use syncToParent, unsyncFromParent, '
+                                    'isSyncedToParent and '
+                                    'addSyncChangeListener instead')
     def getSyncProperty(cls, propName):
-        """Returns the :class:`.PropertyBase` instance of the boolean property
-        which can be used to toggle binding of the given property to the parent
-        property of this instance.
+        """Returns the :class:`.Boolean` property which can be used to toggle
+        binding of the given property to the parent property of this
+        instance.
+
+        Sync state is no longer stored in properties, so the ``Boolean``
+        property is added to the class the first time that it is requested.
+        """
+        return cls.__addSyncProperty(propName)
+
+
+    @classmethod
+    def __addSyncProperty(cls, propName):
+        """Used by :meth:`getSyncPropertyName` and :meth:`getSyncProperty`.
+        Adds a :class:`.Boolean` property which controls the sync state of
+        the given property to this class, if it has not already been added,
+        and returns it.
+        """
+
+        syncPropName = _saltSyncPropertyName(propName)
+        syncProp     = getattr(cls, syncPropName, None)
+
+        if not isinstance(syncProp, types.Boolean):
+            syncProp = types.Boolean(default=True)
+            setattr(cls, syncPropName, syncProp)
+
+        # Property labels are normally set by
+        # the PropertyOwner metaclass, so we
+        # need to set them on this class, and
+        # on any existing sub-classes
+        classes = [cls]
+
+        while len(classes) > 0:
+            klass = classes.pop()
+            if klass not in syncProp._label and \
+               getattr(klass, syncPropName, None) is syncProp:
+                syncProp._setLabel(klass, syncPropName)
+            classes.extend(type.__subclasses__(klass))
+
+        return syncProp
+
+
+    def __isSyncProperty(self, propName, propObj):
+        """Returns ``True`` if the given property is a sync property which
+        was added by :meth:`getSyncProperty`, ``False`` otherwise.
+        """
+        return propName.startswith(_SYNC_SALT_)   and \
+            isinstance(propObj, types.Boolean)    and \
+            getattr(type(self), propName, None) is propObj
+
+
+    def _initLazyProperty(self, propName, propObj):
+        """Overrides :meth:`.HasProperties._initLazyProperty`. Sync properties
+        (see :meth:`getSyncProperty`) are given the ``PropertyValue`` which
+        is used to notify sync change listeners (see
+        :meth:`addSyncChangeListener`). This ``PropertyValue`` is created on
+        demand, regardless of the value of
+        :attr:`.HasProperties._lazyProperties`, as a sync property may have
+        been added after this instance was created.
+        """
+
+        if self.__synced is None or \
+           propName in self.__dict__ or \
+           not self.__isSyncProperty(propName, propObj):
+            return props.HasProperties._initLazyProperty(
+                self, propName, propObj)
+
+        syncPropVal = self.__getSyncPropVal(_unsaltSyncPropertyName(propName))
+        instData    = props._InstanceData(self, syncPropVal)
+
+        self.__dict__[propName] = instData
+
+        return instData
+
+
+    def _getLazyDefault(self, propName, propObj):
+        """Overrides :meth:`.HasProperties._getLazyDefault`. Returns the
+        current sync state for sync properties (see :meth:`getSyncProperty`)
+        which have not been given a ``PropertyValue``.
         """
-        return cls.getProp(cls.getSyncPropertyName(propName))
+
+        if self.__synced is None or \
+           not self.__isSyncProperty(propName, propObj):
+            return props.HasProperties._getLazyDefault(self, propName, propObj)
+
+        return self.isSyncedToParent(_unsaltSyncPropertyName(propName))
 
 
     def __init__(self, **kwargs):
@@ -157,6 +282,19 @@ class SyncableHasProperties(props.HasProperties):
         self.__nobind   = list(set(nobind))
         self.__nounbind = list(set(nounbind))
 
+        # The names of all properties which are
+        # currently synced to the parent. Sync
+        # state is stored here, rather than in
+        # a property, as children may be created
+        # in large numbers. A PropertyValue is
+        # only created for a property when a
+        # sync change listener is registered on
+        # it (see addSyncChangeListener), or
+        # when its sync property is accessed
+        # (see getSyncProperty).
+        self.__synced       = set()
+        self.__syncPropVals = None
+
         # If parent is none, then this instance
         # is a 'parent' instance, and doesn't need
         # to worry about being bound. So we've got
@@ -168,6 +306,7 @@ class SyncableHasProperties(props.HasProperties):
             # parent
             self.__children = []
             self.__parent   = None
+            self.__initSyncPropVals()
             return
 
         # Otherwise, this instance is a 'child'
@@ -184,23 +323,23 @@ class SyncableHasProperties(props.HasProperties):
         self.__parent = weakref.ref(parent)
         parent.__children.append(weakref.ref(self))
 
-        # This dictionary contains
-        #
-        # { propName : boolean }
-        #
-        # mappings, indicating the binding
-        # direction that should be used
-        # when a property is synchronised
-        # to the parent. A value of True
-        # implies a parent -> child  binding
-        # direction (i.e. the child will
-        # inherit the value of the parent),
-        # and a value of False implies a
-        # child -> parent binding direction.
+        # The binding direction that should
+        # be used when a property is synchronised
+        # to the parent. A value of True implies
+        # a parent -> child  binding direction
+        # (i.e. the child will inherit the value
+        # of the parent), and a value of False
+        # implies a child -> parent binding
+        # direction. The __bindDirections dict
+        # contains { propName : boolean } mappings
+        # for properties which have a different
+        # direction to the default.
+        self.__direction      = direction
         self.__bindDirections = {}
 
-        log.debug('Binding properties of {} ({}) to parent ({})'.format(
-            self.__class__.__name__, id(self), id(parent)))
+        if tracing.enabled:
+            log.debug('Binding properties of {} ({}) to parent ({})'.format(
+                self.__class__.__name__, id(self), id(parent)))
 
         # Get a list of all the
         # properties of this class
@@ -208,23 +347,16 @@ class SyncableHasProperties(props.HasProperties):
 
         for pn in propNames:
 
-            # Add a boolean sync property
-            # for this regular property.
-            bindProp = types.Boolean(default=True)
-
-            self.addProperty(self.__saltSyncPropertyName(pn), bindProp)
-
-            # Initialise the binding direction
-            # and initial state
-            self.__bindDirections[pn] = direction
-
+            # Initialise the initial state
             if isinstance(state, dict): pState = state.get(pn, True)
             else:                       pState = state
 
             if   not self.canBeSyncedToParent(    pn): pState = False
             elif not self.canBeUnsyncedFromParent(pn): pState = True
 
-            self.__initSyncProperty(pn, pState)
+            self.__initSyncState(pn, pState)
+
+        self.__initSyncPropVals()
 
 
     def getParent(self):
@@ -253,27 +385,13 @@ class SyncableHasProperties(props.HasProperties):
         return children
 
 
-    def __saltSyncListenerName(self, propName):
-        """Adds a prefix and a suffix to the given property name, to be used
-        as the name for an internal listener on the corresponding boolean sync
-        property.
-
-        """
-        return '{}{}_{}'.format(_SYNC_SALT_, propName, id(self))
-
-
-    def __initSyncProperty(self, propName, initState):
+    def __initSyncState(self, propName, initState):
         """Called by child instances from :meth:`__init__`.
 
         Configures a binding between this instance and its parent for the
         specified property.
         """
 
-        bindPropName  = self.__saltSyncPropertyName(propName)
-        bindPropObj   = self.getProp(bindPropName)
-        bindPropVal   = bindPropObj.getPropVal(self)
-        direction     = self.__bindDirections[propName]
-
         if initState and not self.canBeSyncedToParent(propName):
             raise ValueError('Invalid initial state for '
                              'nobind property {}'.format(propName))
@@ -282,55 +400,174 @@ class SyncableHasProperties(props.HasProperties):
             raise ValueError('Invalid initial state for '
                              'nounbindproperty {}'.format(propName))
 
-        if not self.canBeSyncedToParent(propName):
-            bindPropVal.set(False)
+        if not initState:
             return
 
-        bindPropVal.set(initState)
+        self.__synced.add(propName)
 
-        if self.canBeUnsyncedFromParent(propName):
-            lName = self.__saltSyncListenerName(propName)
-            bindPropVal.addListener(lName, self.__syncPropChanged)
+        bindable.broadcastProps(self.__parent(),
+                                propName,
+                                self,
+                                inherit=self.getBindingDirection(propName))
 
-        if initState:
-            if direction: slave, master = self, self.__parent()
-            else:         slave, master = self.__parent(), self
-            slave.bindProps(propName, master)
 
+    def __changeSyncState(self, propName, state, direction=None):
+        """Called by :meth:`syncToParent` and :meth:`unsyncFromParent`.
+        Changes the sync state of the specified property, binds or unbinds
+        it accordingly, and, if :attr:`_notifySyncChanges` is ``True``,
+        notifies any registered sync change listeners.
 
-    def __syncPropChanged(self, value, valid, ctx, bindPropName):
-        """Called when a hidden boolean property controlling the sync
-        state of the specified real property changes.
-
-        Changes the sync state of the property accordingly.
+        If ``direction`` is provided, it is used instead of the binding
+        direction of the property (see :meth:`getBindingDirection`).
         """
 
-        propName    = self.__unsaltSyncPropertyName(bindPropName)
-        bindPropVal = getattr(self, bindPropName)
-        direction   = self.__bindDirections[propName]
-
-        if bindPropVal and (propName in self.__nobind):
+        if state and (propName in self.__nobind):
             raise RuntimeError('{} cannot be bound to '
                                'parent'.format(propName))
 
-        if (not bindPropVal) and (propName in self.__nounbind):
+        if (not state) and (propName in self.__nounbind):
             raise RuntimeError('{} cannot be unbound from '
                                'parent'.format(propName))
 
-        log.debug('Sync property changed for {} - '
-                  'changing binding state'.format(propName))
+        if (propName in self.__synced) == state:
+            return
+
+        if state: self.__synced.add(    propName)
+        else:     self.__synced.discard(propName)
+
+        if tracing.enabled:
+            log.debug('Sync state changed for {} - '
+                      'changing binding state'.format(propName))
+
+        if direction is None:
+            direction = self.getBindingDirection(propName)
+
+        bindable.broadcastProps(self.__parent(),
+                                propName,
+                                self,
+                                inherit=direction,
+                                unbind=(not state))
+
+        syncPropVal = self.__getSyncPropVal(propName, create=False)
+
+        if syncPropVal is not None:
+            self.__setSyncPropVal(syncPropVal, state, self._notifySyncChanges)
+
+
+    def __getSyncPropVal(self, propName, create=True):
+        """Returns the :class:`.PropertyValue` which is used to notify sync
+        change listeners of changes to the sync state of the given property.
+
+        :arg create: If ``True`` (the default), the ``PropertyValue`` is
+                     created if it does not exist. Otherwise ``None`` is
+                     returned.
+        """
+
+        if self.__syncPropVals is not None:
+            syncPropVal = self.__syncPropVals.get(propName, None)
+            if syncPropVal is not None:
+                return syncPropVal
+
+        if not create:
+            return None
+
+        # If a sync property has been added to
+        # the class (see getSyncProperty), the
+        # PropertyValue is created from it.
+        # Otherwise it is given the attributes
+        # of a Boolean property, in case a sync
+        # property is added later on.
+        syncPropName = _saltSyncPropertyName(propName)
+        syncProp     = getattr(type(self), syncPropName, None)
+
+        if self.__isSyncProperty(syncPropName, syncProp):
+            syncPropVal = syncProp._makePropVal(self)
+        else:
+            syncPropVal = propvals.PropertyValue(
+                self,
+                name=syncPropName,
+                value=self.isSyncedToParent(propName),
+                retainLast='none',
+                default=True,
+                enabled=True)
+
+        self.__initSyncPropVal(propName, syncPropVal)
+
+        return syncPropVal
+
+
+    def __initSyncPropVal(self, propName, syncPropVal):
+        """Initialises the given ``PropertyValue`` so that it reflects, and
+        can be used to control, the sync state of the given property.
+        """
+
+        if self.__syncPropVals is None:
+            self.__syncPropVals = {}
+
+        self.__syncPropVals[propName] = syncPropVal
+        self.__setSyncPropVal(syncPropVal,
+                              self.isSyncedToParent(propName),
+                              False)
+
+        # The sync property (see getSyncProperty)
+        # may be used to change the sync state
+        if self.__parent is not None:
+            syncPropVal.addListener(
+                '{}_{}'.format(_saltSyncPropertyName(propName), id(self)),
+                self.__syncPropValChanged)
+
+
+    def __initSyncPropVals(self):
+        """Called by :meth:`__init__`. Initialises the ``PropertyValue``
+        instances which were created for any sync properties (see
+        :meth:`getSyncProperty`) by :meth:`.HasProperties.__new__`.
+        """
+
+        for propName in type(self)._getPropertyRegistry()[0]:
+
+            if not propName.startswith(_SYNC_SALT_):
+                continue
+
+            instData = self.__dict__.get(propName, None)
+
+            if instData is not None:
+                self.__initSyncPropVal(_unsaltSyncPropertyName(propName),
+                                       instData.propVal)
+
+
+    def __setSyncPropVal(self, syncPropVal, state, notify):
+        """Sets the value of the given sync ``PropertyValue``. Listeners are
+        only notified if ``notify`` is ``True``.
+        """
 
-        if direction: slave, master = self, self.__parent()
-        else:         slave, master = self.__parent(), self
+        if notify:
+            syncPropVal.set(state)
+            return
+
+        notifState = syncPropVal.getNotificationState()
+        syncPropVal.disableNotification()
+
+        try:
+            syncPropVal.set(state)
+        finally:
+            syncPropVal.setNotificationState(notifState)
 
-        slave.bindProps(propName, master, unbind=(not bindPropVal))
+
+    def __syncPropValChanged(self, value, valid, ctx, syncPropName):
+        """Called when a sync ``PropertyValue`` is set, other than by this
+        ``SyncableHasProperties`` instance (e.g. through the property
+        returned by :meth:`getSyncProperty`). Changes the sync state of the
+        property accordingly.
+        """
+        self.__changeSyncState(_unsaltSyncPropertyName(syncPropName),
+                               bool(value))
 
 
     def getBindingDirection(self, propName):
         """Returns the current binding direction for the given property. See
         the :meth:`setBindingDirection` method.
         """
-        return self.__bindDirections[propName]
+        return self.__bindDirections.get(propName, self.__direction)
 
 
     def setBindingDirection(self, direction, propName=None):
@@ -342,11 +579,11 @@ class SyncableHasProperties(props.HasProperties):
         If a property is not specified, the binding direction of all
         properties will be changed.
         """
-        if propName is None: propNames = self.__bindDirections.keys()
-        else:                propNames = [propName]
-
-        for pn in propNames:
-            self.__bindDirections[pn] = direction
+        if propName is None:
+            self.__direction      = direction
+            self.__bindDirections = {}
+        else:
+            self.__bindDirections[propName] = direction
 
 
     def syncToParent(self, propName):
@@ -360,19 +597,7 @@ class SyncableHasProperties(props.HasProperties):
         ..note:: The ``nobind`` check can be avoided by calling
                  :func:`.bindable.bindProps` directly. But don't do that.
         """
-        if propName in self.__nobind:
-            raise RuntimeError('{} cannot be bound to '
-                               'parent'.format(propName))
-
-        bindPropName = self.__saltSyncPropertyName(propName)
-
-        if getattr(self, bindPropName):
-            return
-
-        with suppress.suppress(self, bindPropName):
-            setattr(self, bindPropName, True)
-
-        self.__syncPropChanged(None, None, None, bindPropName)
+        self.__changeSyncState(propName, True)
 
 
     def unsyncFromParent(self, propName):
@@ -386,49 +611,140 @@ class SyncableHasProperties(props.HasProperties):
         ..note:: The ``nounbind`` check can be avoided by calling
                  :func:`bindable.bindProps` directly. But don't do that.
         """
-        if propName in self.__nounbind:
-            raise RuntimeError('{} cannot be unbound from '
-                               'parent'.format(propName))
-
-        bindPropName = self.__saltSyncPropertyName(propName)
-
-        if not getattr(self, bindPropName):
-            return
-
-        with suppress.suppress(self, bindPropName):
-            setattr(self, bindPropName, False)
-
-        self.__syncPropChanged(None, None, None, bindPropName)
+        self.__changeSyncState(propName, False)
 
 
     def syncAllToParent(self):
         """Synchronises all properties to the parent instance.
 
         Does not attempt to synchronise properties in the ``nobind`` list.
+        All properties are bound before any listeners are notified - see
+        :meth:`syncChildren`.
         """
-        propNames = self.getAllProperties()[0]
-
-        for propName in propNames:
-            if propName in self.__nounbind or \
-               propName in self.__nobind:
-                continue
-
-            self.syncToParent(propName)
+        self.__changeAllSyncStates(self.getParent(), [self], None, True)
 
 
     def unsyncAllFromParent(self):
         """Unynchronises all properties from the parent instance.
 
         Does not attempt to synchronise properties in the ``nounbind`` list.
+        All properties are unbound before any listeners are notified - see
+        :meth:`syncChildren`.
         """
-        propNames = self.getAllProperties()[0]
+        self.__changeAllSyncStates(self.getParent(), [self], None, False)
 
-        for propName in propNames:
-            if propName in self.__nounbind or \
-               propName in self.__nobind:
-                continue
 
-            self.unsyncFromParent(propName)
+    def syncChildren(self, propNames=None, children=None):
+        """Synchronises the specified properties of the specified children
+        to this parent instance.
+
+        All of the properties are bound before any listeners are notified.
+        Listener calls are then coalesced, so that each listener is called
+        once for each property value which has changed, rather than once
+        for every change made while the properties are being bound.
+
+        If this ``SyncableHasProperties`` instance is not a parent, a
+        :exc:`RuntimeError` is raised.
+
+        :arg propNames: Names of the properties to synchronise. If not
+                        provided, all properties are synchronised.
+                        Properties in the ``nobind`` list of a child are
+                        not synchronised.
+
+        :arg children:  Children to synchronise. If not provided, all
+                        children are synchronised.
+        """
+
+        if self.__parent is not None:
+            raise RuntimeError('syncChildren can only '
+                               'be called on a parent')
+
+        if children is None:
+            children = self.getChildren()
+
+        self.__changeAllSyncStates(self, children, propNames, True)
+
+
+    def unsyncChildren(self, propNames=None, children=None):
+        """Unsynchronises the specified properties of the specified children
+        from this parent instance. See :meth:`syncChildren`.
+
+        Properties in the ``nounbind`` list of a child are not unsynchronised.
+        """
+
+        if self.__parent is not None:
+            raise RuntimeError('unsyncChildren can only '
+                               'be called on a parent')
+
+        if children is None:
+            children = self.getChildren()
+
+        self.__changeAllSyncStates(self, children, propNames, False)
+
+
+    def __changeAllSyncStates(self, parent, children, propNames, state):
+        """Used by :meth:`syncAllToParent`, :meth:`unsyncAllFromParent`,
+        :meth:`syncChildren` and :meth:`unsyncChildren`. Changes the sync
+        state of the given properties of each of the given children of
+        ``parent``.
+
+        The :attr:`.PropertyValue.queue` is held while the properties are
+        bound or unbound, so that all listener calls (including those to
+        sync change listeners) are deferred until every binding has been
+        changed, and calls to the same listener are coalesced.
+        """
+
+        if propNames is None:
+            propNames = parent.getAllProperties()[0]
+
+        for child in children:
+            if child.getParent() is not parent:
+                raise ValueError('{} is not a child of {}'.format(
+                    id(child), id(parent)))
+
+        q = propvals.PropertyValue.queue
+        q.hold()
+
+        try:
+            for propName in propNames:
+
+                if state:
+                    pending = [c for c in children
+                               if c.canBeSyncedToParent(propName)]
+                    pending = [c for c in pending
+                               if not c.isSyncedToParent(propName)]
+                else:
+                    pending = [c for c in children
+                               if c.canBeUnsyncedFromParent(propName)]
+                    pending = [c for c in pending
+                               if c.isSyncedToParent(propName)]
+
+                directions = [c.getBindingDirection(propName)
+                              for c in pending]
+
+                # When children are synced with a
+                # child -> parent direction, the parent,
+                # and every synced child, will end up
+                # with the value of the last of those
+                # children. So we sync that one first,
+                # and then sync all of the others with
+                # a parent -> child direction. This
+                # gives the same result, without every
+                # bound child being re-synced each time
+                # the parent takes the value of a child.
+                if state and (False in directions):
+                    last       = directions[::-1].index(False)
+                    last       = len(directions) - 1 - last
+                    pending.insert(0, pending.pop(last))
+                    directions = [False] + [True] * (len(pending) - 1)
+
+                for child, direction in zip(pending, directions):
+                    child.__changeSyncState(propName, state, direction)
+
+        finally:
+            q.release()
+
+        q.callAll(q.clearHeld())
 
 
     def detachFromParent(self, propName):
@@ -440,16 +756,10 @@ class SyncableHasProperties(props.HasProperties):
         if self.__parent is None:     return
         if propName in self.__nobind: return
 
-        self.unsyncFromParent(propName)
+        if propName in self.__nounbind: self.__nounbind.remove(propName)
 
-        if propName     in self.__nounbind: self.__nounbind.remove(propName)
-        if propName not in self.__nobind:   self.__nobind  .append(propName)
-
-        syncPropName = self.__saltSyncPropertyName(propName)
-        lName        = self.__saltSyncListenerName(propName)
-
-        if self.hasListener(syncPropName, lName):
-            self.removeListener(syncPropName, lName)
+        self.unsyncFromParent(propName)
+        self.__nobind.append(propName)
 
 
     def detachAllFromParent(self):
@@ -465,21 +775,12 @@ class SyncableHasProperties(props.HasProperties):
         if self.__parent is None:
             return
 
-        parent    = self.__parent()
-        propNames = self.getAllProperties()[0]
-
-        for propName in propNames:
-            if propName not in self.__nounbind:
-                syncPropName = self.__saltSyncPropertyName(propName)
-                lName        = self.__saltSyncListenerName(propName)
-
-                self.removeListener(syncPropName, lName)
-
-                # The parent may have been GC'd
-                if parent is not None:
-                    self.unsyncFromParent(propName)
+        parent = self.__parent()
 
+        # The parent may have been GC'd
         if parent is not None:
+            self.__changeAllSyncStates(parent, [self], None, False)
+
             for c in list(parent.__children):
                 if c() is self:
                     parent.__children.remove(c)
@@ -491,15 +792,14 @@ class SyncableHasProperties(props.HasProperties):
         """Returns ``True`` if the specified property is synced to the parent
         of this ``SyncableHasProperties`` instance, ``False`` otherwise.
         """
-        return getattr(self, self.__saltSyncPropertyName(propName))
+        return propName in self.__synced
 
 
     def anySyncedToParent(self):
         """Returns ``True`` if any properties are synced to the parent
         of this ``SyncableHasProperties`` instance, ``False`` otherwise.
         """
-        propNames = self.getAllProperties()[0]
-        return any([self.isSyncedToParent(p) for p in propNames])
+        return len(self.__synced) > 0
 
 
     def allSyncedToParent(self):
@@ -533,19 +833,28 @@ class SyncableHasProperties(props.HasProperties):
                               overwrite=False,
                               weak=True):
         """Registers the given callback function to be called when
-        the sync state of the specified property changes.
+        the sync state of the specified property changes. See the
+        :attr:`_notifySyncChanges` attribute.
+
+        The callback is passed the same arguments as a property listener,
+        i.e. the new sync state, its validity (always ``True``), this
+        ``SyncableHasProperties`` instance, and the name returned by
+        :meth:`getSyncPropertyName`.
         """
-        bindPropName = self.__saltSyncPropertyName(propName)
-        self.addListener(bindPropName,
-                         listenerName,
-                         callback,
-                         overwrite=overwrite,
-                         weak=weak)
+
+        syncPropVal = self.__getSyncPropVal(propName)
+        syncPropVal.addListener(listenerName,
+                                callback,
+                                overwrite=overwrite,
+                                weak=weak)
 
 
     def removeSyncChangeListener(self, propName, listenerName):
         """De-registers the given listener from receiving sync
         state changes.
         """
-        bindPropName = self.__saltSyncPropertyName(propName)
-        self.removeListener(bindPropName, listenerName)
+
+        syncPropVal = self.__getSyncPropVal(propName, create=False)
+
+        if syncPropVal is not None:
+            syncPropVal.removeListener(listenerName)
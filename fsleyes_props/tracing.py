@@ -0,0 +1,63 @@
+#!/usr/bin/env python
+#
+# tracing.py - Switch for debug logging on the notification code path.
+#
+# Author: Paul McCarthy <pauldmccarthy@gmail.com>
+#
+"""This module contains a switch which controls whether the
+:class:`.PropertyValue` notification, binding and synchronisation code emits
+debug log messages.
+
+
+Generating these messages is expensive - they contain class names, ids, and
+string representations of entire lists and arrays. So rather than building
+them on every property value change, and leaving it up to the ``logging``
+module to discard them, the relevant code checks the module-level
+:data:`enabled` flag first, and skips the message entirely when it is
+``False``.
+
+
+Tracing is enabled by default only if the ``fsleyes_props`` logger is
+enabled for ``DEBUG`` messages when this module is first imported. If you
+configure logging after ``fsleyes_props`` has been imported, you need to
+call :func:`enable` to turn tracing on:
+
+.. autosummary::
+   :nosignatures:
+
+   enable
+   disable
+   isEnabled
+
+
+.. note:: This module is not to be confused with the :mod:`.trace` module,
+          which contains functions for use during development only.
+"""
+
+
+import logging
+
+
+enabled = logging.getLogger('fsleyes_props').isEnabledFor(logging.DEBUG)
+"""If ``True``, debug log messages are generated on the notification code
+path. Do not modify this directly - use :func:`enable` and :func:`disable`.
+"""
+
+
+def enable():
+    """Enables generation of debug log messages. """
+    global enabled
+    enabled = True
+
+
+def disable():
+    """Disables generation of debug log messages. """
+    global enabled
+    enabled = False
+
+
+def isEnabled():
+    """Returns ``True`` if debug log message generation is enabled, ``False``
+    otherwise.
+    """
+    return enabled
@@ -0,0 +1,503 @@
+#!/usr/bin/env python
+#
+# test_bindable.py -
+#
+# Author: Paul McCarthy <pauldmccarthy@gmail.com>
+#
+
+import gc
+
+import numpy as np
+
+import fsleyes_props          as props
+import fsleyes_props.bindable as bindable
+
+
+class Thing(props.HasProperties):
+    myint = props.Int()
+
+
+class ListThing(props.HasProperties):
+    mylist = props.List(props.Int())
+
+
+class PointThing(props.HasProperties):
+    mypoint = props.Point(ndims=3)
+
+
+def test_long_chain():
+
+    # Long chains of bound PVs used to
+    # hit the recursion limit
+    things = [Thing() for i in range(2000)]
+    for t1, t2 in zip(things[:-1], things[1:]):
+        t2.bindProps('myint', t1)
+
+    things[0].myint = 5
+    assert all([t.myint == 5 for t in things])
+
+    things[-1].myint = 6
+    assert all([t.myint == 6 for t in things])
+
+
+def test_buildBPVList_cache():
+
+    t1, t2, t3, t4 = [Thing() for i in range(4)]
+
+    pv1 = t1.getPropVal('myint')
+    pv2 = t2.getPropVal('myint')
+    pv3 = t3.getPropVal('myint')
+    pv4 = t4.getPropVal('myint')
+
+    assert bindable.buildBPVList(pv1, 'boundPropVals') == ([], [])
+
+    t2.bindProps('myint', t1)
+    t3.bindProps('myint', t2)
+
+    bpvs, parents = bindable.buildBPVList(pv1, 'boundPropVals')
+    assert [id(b) for b in bpvs]    == [id(pv2), id(pv3)]
+    assert [id(p) for p in parents] == [id(pv1), id(pv2)]
+
+    # Binding changes are picked up
+    t4.bindProps('myint', t1)
+    bpvs, parents = bindable.buildBPVList(pv1, 'boundPropVals')
+    assert sorted([id(b) for b in bpvs]) == sorted([id(pv2),
+                                                    id(pv3),
+                                                    id(pv4)])
+
+    t2.unbindProps('myint', t1)
+    bpvs, parents = bindable.buildBPVList(pv1, 'boundPropVals')
+    assert [id(b) for b in bpvs] == [id(pv4)]
+
+    t1.myint = 3
+    assert t4.myint == 3
+    assert t2.myint == 0
+
+    # As is garbage collection
+    # of bound PVs
+    del t4
+    del pv4
+    del bpvs
+    del parents
+    gc.collect()
+    assert bindable.buildBPVList(pv1, 'boundPropVals') == ([], [])
+    t1.myint = 4
+
+
+def test_binding_components():
+
+    t1, t2, t3, t4, t5 = [Thing() for i in range(5)]
+    pvs = [t.getPropVal('myint') for t in (t1, t2, t3, t4, t5)]
+    pv1, pv2, pv3, pv4, pv5 = pvs
+
+    assert bindable._getComponent(pv1, 'boundPropVals') is None
+
+    # A chain of three PVs share one component
+    t2.bindProps('myint', t1)
+    t3.bindProps('myint', t2)
+    comp = bindable._getComponent(pv1, 'boundPropVals')
+    assert bindable._getComponent(pv2, 'boundPropVals') is comp
+    assert bindable._getComponent(pv3, 'boundPropVals') is comp
+    assert len(comp) == 3
+
+    # Unrelated bindings do not
+    # affect the component
+    version = comp.version
+    t5.bindProps('myint', t4)
+    assert comp.version == version
+    assert bindable._getComponent(pv4, 'boundPropVals') is not comp
+
+    # Joining two components
+    t4.bindProps('myint', t3)
+    comp = bindable._getComponent(pv1, 'boundPropVals')
+    assert all([bindable._getComponent(pv, 'boundPropVals') is comp
+                for pv in pvs])
+    t1.myint = 5
+    assert all([t.myint == 5 for t in (t1, t2, t3, t4, t5)])
+
+    # Removing a binding splits the component
+    t4.unbindProps('myint', t3)
+    c1 = bindable._getComponent(pv1, 'boundPropVals')
+    c2 = bindable._getComponent(pv5, 'boundPropVals')
+    assert c1 is not c2
+    assert len(c1) == 3
+    assert len(c2) == 2
+    t1.myint = 6
+    assert [t.myint for t in (t1, t2, t3, t4, t5)] == [6, 6, 6, 5, 5]
+
+    # As does garbage collection of a PV
+    del t2
+    del pv2
+    del pvs
+    gc.collect()
+    assert bindable._getComponent(pv1, 'boundPropVals') is None
+    assert bindable._getComponent(pv3, 'boundPropVals') is None
+    t1.myint = 7
+    assert t3.myint == 6
+
+
+def test_list_sync_changes():
+
+    # a chain of three lists, plus
+    # one bound directly to the first
+    l1, l2, l3, l4 = [ListThing() for i in range(4)]
+    l1.mylist = [1, 2, 3, 4, 5]
+    l2.bindProps('mylist', l1)
+    l3.bindProps('mylist', l2)
+    l4.bindProps('mylist', l1)
+
+    pv1 = l1.getPropVal('mylist')
+    pv3 = l3.getPropVal('mylist')
+
+    changes = []
+
+    def record(*a):
+        changes.append(pv1._listChanges)
+
+    l1.addListener('mylist', 'record', record, immediate=True)
+
+    def check(expected):
+        for lst in (l1, l2, l3, l4):
+            assert lst.mylist == expected
+        for lst in (l2, l3, l4):
+            l1pvs = l1.getPropVal('mylist').getPropertyValueList()
+            lpvs  = lst.getPropVal('mylist').getPropertyValueList()
+            assert [pv.get() for pv in l1pvs] == [pv.get() for pv in lpvs]
+
+    l1.mylist.append(6)
+    check([1, 2, 3, 4, 5, 6])
+    l1.mylist.insert(0, 0)
+    check([0, 1, 2, 3, 4, 5, 6])
+    l3.mylist.insertAll(-2, [10, 11])
+    check([0, 1, 2, 3, 4, 10, 11, 5, 6])
+    l1.mylist.pop(-3)
+    check([0, 1, 2, 3, 4, 10, 5, 6])
+    del l3.mylist[1:4]
+    check([0, 4, 10, 5, 6])
+    l1.mylist.removeAll([10, 0])
+    check([4, 5, 6])
+    l3.mylist.move(0, 2)
+    check([5, 6, 4])
+    l1.mylist.reorder([2, 0, 1])
+    check([4, 5, 6])
+    l3.mylist[1] = 15
+    check([4, 15, 6])
+    l1.mylist[:] = [7, 8, 9]
+    check([7, 8, 9])
+    pv3.getPropertyValueList()[0].set(3)
+    check([3, 8, 9])
+
+    # the change descriptions are only
+    # available during notification, and
+    # only on the list that was changed
+    assert pv1._listChanges is None
+    assert [c for c in changes if c is not None] == [
+        ('insert', 5, 1),
+        ('insert', 0, 1),
+        ('delete', (6,)),
+        ('delete', (0, 2)),
+        ('reorder', (2, 0, 1)),
+        ('set', (0, 1, 2))]
+
+
+def test_bound_point_asarray():
+
+    p1, p2 = PointThing(), PointThing()
+    p2.bindProps('mypoint', p1)
+
+    a1 = p1.mypoint.asarray()
+    a2 = p2.mypoint.asarray()
+
+    assert a1.dtype == np.float64
+    assert np.all(a1 == [0, 0, 0])
+    assert np.all(a2 == [0, 0, 0])
+
+    p1.mypoint = [1, 2, 3]
+    assert np.all(p2.mypoint.asarray() == [1, 2, 3])
+
+    p2.mypoint.y = 4
+    assert np.all(p1.mypoint.asarray() == [1, 4, 3])
+    assert np.all(p2.mypoint.asarray() == [1, 4, 3])
+
+
+def test_list_change_records():
+
+    l1, l2 = ListThing(), ListThing()
+    l1.mylist = [1, 2, 3]
+    l2.bindProps('mylist', l1)
+
+    # Maintain a mirror of each list from
+    # the change records. Inserted/changed
+    # items are marked with None, and filled
+    # in from the list afterwards.
+    mirrors = {}
+    records = {}
+
+    def makeListener(lt):
+        mirror = list(lt.mylist)
+        mirrors[id(lt)] = mirror
+        records[id(lt)] = []
+
+        def listener(value, valid, ctx, name, changes):
+            records[id(lt)].extend(changes)
+            for kind, indices in changes:
+                if kind == 'inserted':
+                    for i in indices:
+                        mirror.insert(i, None)
+                elif kind == 'removed':
+                    for i in reversed(indices):
+                        mirror.pop(i)
+                elif kind == 'moved':
+                    mirror[:] = [mirror[i] for i in indices]
+                elif kind == 'itemsChanged':
+                    for i in indices:
+                        mirror[i] = None
+                elif kind == 'reset':
+                    mirror[:] = [None] * len(lt.mylist)
+        return listener
+
+    listener1 = makeListener(l1)
+    listener2 = makeListener(l2)
+    l1.addListener('mylist', 'listener', listener1, changes=True)
+    l2.addListener('mylist', 'listener', listener2, changes=True,
+                   immediate=True)
+
+    def check():
+        for lt in (l1, l2):
+            mirror = mirrors[id(lt)]
+            assert len(mirror) == len(lt.mylist)
+            for i, (m, v) in enumerate(zip(mirror, lt.mylist)):
+                if m is None: mirror[i] = v
+                else:         assert m == v
+
+    l1.mylist.append(4)
+    check()
+    l2.mylist.extend([5, 6])
+    check()
+    l1.mylist.insert(1, 7)
+    check()
+    l1.mylist.pop(0)
+    check()
+    l2.mylist.move(0, 4)
+    check()
+    l1.mylist.reorder([5, 4, 3, 2, 1, 0])
+    check()
+    l1.mylist.removeAll([3, 4])
+    check()
+    l2.mylist[1:3] = [8, 9]
+    check()
+    del l1.mylist[0]
+    check()
+    l1.mylist = [10, 11, 12, 13, 14]
+    check()
+    l2.mylist.getPropertyValue(2).set(15)
+    check()
+
+    assert l1.mylist == l2.mylist
+    assert mirrors[id(l1)] == list(l1.mylist)
+    assert mirrors[id(l2)] == list(l2.mylist)
+
+    # Both lists get the same records
+    assert [r.kind for r in records[id(l2)]][:5] == \
+        ['inserted', 'inserted', 'inserted', 'removed', 'moved']
+    assert records[id(l2)][1] == props.ListChange('inserted', (4, 5))
+    assert records[id(l2)][4] == props.ListChange('moved', (1, 2, 3, 4, 0, 5))
+
+    # Queued calls are coalesced,
+    # but no records are lost
+    calls = []
+
+    def coalesced(value, valid, ctx, name, changes):
+        calls.append(changes)
+
+    def makeChanges(*a):
+        l1.mylist.append(16)
+        l1.mylist.pop(0)
+
+    l1.addListener('mylist', 'coalesced', coalesced, weak=False, changes=True)
+    props.safeCall(makeChanges)
+
+    assert len(calls) == 1
+    assert [c.kind for c in calls[0]] == ['inserted', 'removed']
+
+
+def test_one_list_notification_per_change():
+
+    # l1 <- l2 <- l3, and l1 <- l4
+    lists = [ListThing() for i in range(4)]
+    l1, l2, l3, l4 = lists
+    l1.mylist = list(range(10))
+    l2.bindProps('mylist', l1)
+    l3.bindProps('mylist', l2)
+    l4.bindProps('mylist', l1)
+
+    counts = [0] * 4
+
+    def makeListener(i):
+        def listener(*a):
+            counts[i] += 1
+        return listener
+
+    listeners = [makeListener(i) for i in range(4)]
+    for lt, listener in zip(lists, listeners):
+        lt.addListener('mylist', 'count', listener, immediate=True)
+
+    def check(func):
+        counts[:] = [0] * 4
+        func()
+        assert counts == [1, 1, 1, 1]
+        assert all([lt.mylist == l1.mylist for lt in lists])
+
+    def setslice():
+        l3.mylist[2:8] = [20, 21, 22, 23, 24, 25]
+
+    def setall():
+        l1.mylist[:] = list(range(30, 40))
+
+    def setitem():
+        l4.mylist[5] = 50
+
+    def setpv():
+        l2.getPropVal('mylist').getPropertyValue(3).set(60)
+
+    def append():
+        l3.mylist.append(70)
+
+    def remove():
+        l1.mylist.removeAll([70, 60])
+
+    def reorder():
+        l4.mylist.reorder(list(reversed(range(len(l4.mylist)))))
+
+    def replace():
+        l2.mylist = [1, 2, 3]
+
+    for func in [setslice, setall, setitem, setpv,
+                 append, remove, reorder, replace]:
+        check(func)
+
+    # A list item which is bound to
+    # another property value - its list
+    # is notified once per change
+    class Thing(props.HasProperties):
+        myint = props.Int()
+
+    t = Thing()
+    bindable.bindPropVals(l3.getPropVal('mylist').getPropertyValue(1),
+                          t.getPropVal('myint'))
+
+    def setint():
+        t.myint = 80
+
+    check(setint)
+    assert l3.mylist[1] == 80
+
+
+def test_broadcast():
+
+    class Thing(props.HasProperties):
+        myint  = props.Int(minval=0, maxval=10, clamped=False)
+        mylist = props.List(props.Int())
+
+    parent   = Thing()
+    children = [Thing() for i in range(3)]
+    other    = Thing()
+    called   = []
+
+    def listener(value, valid, ctx, name):
+        called.append((ctx, value, valid))
+
+    for i, c in enumerate([parent] + children + [other]):
+        c.addListener('myint', 'listener{}'.format(i), listener)
+
+    children[0].myint = 5
+    children[1].myint = 3
+    children[2].myint = 4
+    parent.setAttribute('myint', 'maxval', 20)
+    parent.myint      = 3
+    called[:]         = []
+
+    for c in children:
+        bindable.broadcastProps(parent, 'myint', c)
+
+    # Children take the parent value and
+    # attributes, and are only notified
+    # if their value has changed
+    assert called == [(children[0], 3, True), (children[2], 3, True)]
+    for c in children:
+        assert c.myint == 3
+        assert c.getAttribute('myint', 'maxval') == 20
+        assert c.isBound('myint', parent) is None
+        assert bindable.propValsAreBound(parent   .getPropVal('myint'),
+                                         c.getPropVal('myint'))
+
+    # Parent changes are broadcast, and
+    # child changes passed to the parent.
+    # Other bindings on a child still work.
+    other.bindProps('myint', children[1])
+    called[:] = []
+    parent.myint = 15
+    assert all([c.myint == 15 for c in children + [other]])
+    assert len(called) == 5
+    called[:] = []
+    other.myint = 25
+    assert parent.myint == 25
+    assert len(called)  == 5
+    assert not children[2].getPropVal('myint').isValid()
+    assert all([not a[2] for a in called])
+    assert children[2].getLastValue('myint') == 15
+
+    # Attribute changes are synced as normal
+    children[2].setAttribute('myint', 'maxval', 30)
+    assert parent.getAttribute('myint', 'maxval') == 30
+    assert parent.getPropVal('myint').isValid()
+
+    # Unbinding copies the parent value
+    called[:] = []
+    bindable.broadcastProps(parent, 'myint', children[0], unbind=True)
+    assert called            == []
+    assert children[0].myint == 25
+    parent.myint = 1
+    assert children[0].myint == 25
+    assert (children[0], 1, True) not in called
+
+    # Binding in the other direction
+    children[0].myint = 7
+    bindable.broadcastProps(parent, 'myint', children[0], inherit=False)
+    assert parent.myint == 7
+    assert all([c.myint == 7 for c in children])
+
+    # Cycles, and multiple publishers, are not allowed
+    try:
+        bindable.broadcastPropVals(children[0].getPropVal('myint'),
+                                   parent     .getPropVal('myint'))
+        assert False
+    except ValueError:
+        pass
+    try:
+        bindable.broadcastPropVals(other      .getPropVal('myint'),
+                                   children[0].getPropVal('myint'))
+        assert False
+    except ValueError:
+        pass
+
+    # List properties are bound normally
+    parent.mylist = [1, 2, 3]
+    bindable.broadcastProps(parent, 'mylist', children[0])
+    assert children[0].mylist == [1, 2, 3]
+    assert children[0].getPropVal('mylist')._getPublisher() is None
+    assert children[0].isBound('mylist', parent) is None
+    try:
+        bindable.broadcastPropVals(parent     .getPropVal('mylist'),
+                                   children[0].getPropVal('mylist'))
+        assert False
+    except ValueError:
+        pass
+
+    # Publishers do not keep their subscribers alive
+    child     = children.pop()
+    called[:] = []
+    del child
+    del c
+    gc.collect()
+    assert len(parent.getPropVal('myint')._subscribers) == 2
@@ -287,3 +287,170 @@ def test_hold_threaded():
 
     # TODO
     assert True
+
+
+def test_singleThreaded():
+
+    q      = callqueue.CallQueue(skipDuplicates=True, threadSafe=False)
+    called = []
+
+    def func(name):
+        called.append(name)
+        if name == 'one':
+            q.call(func, 'three', 'three')
+            q.call(func, 'two',   'two')
+            q.dequeue('two')
+
+    q.callAll([(func, 'one', ('one',), {}),
+               (func, 'two', ('two',), {})])
+    assert called == ['one', 'three']
+
+    # Duplicates are skipped
+    called[:] = []
+    q.hold()
+    q.call(func, 'four', 'four')
+    q.call(func, 'five', 'five')
+    q.dequeue('four')
+    q.release()
+    q.callAll(q.clearHeld() + [(func, 'six', ('six',), {}),
+                               (func, 'six', ('seven',), {})])
+    assert called == ['five', 'six']
+
+    # Locking can be toggled
+    assert not q.isThreadSafe()
+    for threadSafe in [True, False]:
+        q.setThreadSafe(threadSafe)
+        assert q.isThreadSafe() == threadSafe
+        called[:] = []
+        q.callAll([(func, 'one', ('one',), {}),
+                   (func, 'two', ('two',), {})])
+        assert called == ['one', 'three']
+
+
+def test_coalesce():
+
+    q      = callqueue.CallQueue(coalesce=True)
+    called = []
+
+    def func(val):
+        called.append(val)
+
+    def burst():
+        called.append('burst')
+        for i in range(5):
+            q.call(func, 'func', i)
+        q.call(func, 'other', 'other')
+        q.call(func, 'func', 5)
+
+    q.call(burst, 'burst')
+
+    # A single call, with the latest
+    # arguments, at the position of
+    # the first call
+    assert called == ['burst', 5, 'other']
+
+    # Dequeued calls are not revived
+    called[:] = []
+
+    def burst():
+        q.call(func, 'func', 1)
+        q.dequeue('func')
+        q.call(func, 'func', 2)
+    q.call(burst, 'burst')
+    assert called == [2]
+
+    # Held calls are coalesced too
+    called[:] = []
+    q.hold()
+    q.call(func, 'func', 1)
+    q.call(func, 'other', 'other')
+    q.call(func, 'func', 2)
+    q.release()
+    held = q.clearHeld()
+    assert [h[1] for h in held] == ['func', 'other']
+    q.callAll(held)
+    assert called == [2, 'other']
+
+
+def test_priority():
+
+    q      = callqueue.CallQueue()
+    called = []
+
+    def func(name):
+        called.append(name)
+
+    def first():
+        q.callAll([(func, 'low',  ('low',),  {}, -1),
+                   (func, 'idle', ('idle1',), {}, callqueue.IDLE),
+                   (func, 'mid',  ('mid',),  {}),
+                   (func, 'idle', ('idle2',), {}, callqueue.IDLE),
+                   (func, 'high', ('high',), {}, 10)])
+
+    q.call(first, 'first')
+    assert called == ['high', 'mid', 'low', 'idle2']
+
+    # Idle calls are only executed
+    # when nothing else is pending
+    called[:] = []
+
+    def idle(name):
+        called.append(name)
+        if name == 'idle1':
+            q.call(func, 'normal', 'normal')
+
+    q.callAll([(idle, 'idle1', ('idle1',), {}, callqueue.IDLE),
+               (idle, 'idle2', ('idle2',), {}, callqueue.IDLE)])
+    assert called == ['idle1', 'normal', 'idle2']
+
+    # Held calls retain their priority
+    called[:] = []
+    q.hold()
+    q.call(func, 'one', 'one')
+    q.release()
+    held = q.clearHeld()
+    held = [h[:4] + (-5,) for h in held]
+    q.callAll([(func, 'two', ('two',), {})] + held)
+    assert called == ['two', 'one']
+
+
+def test_dequeue_owner():
+
+    q      = callqueue.CallQueue(coalesce=True)
+    called = []
+    owner1 = object()
+    owner2 = object()
+
+    def func(val):
+        called.append(val)
+
+    # A coalesced call is only dequeued
+    # when all of its owners are removed
+    def burst():
+        q.callAll([(func, 'func', (1,), {}, 0, [owner1]),
+                   (func, 'func', (2,), {}, 0, [owner2])])
+        q.dequeue('func', owner1)
+
+    q.call(burst, 'burst')
+    assert called == [2]
+
+    called[:] = []
+
+    def burst():
+        q.callAll([(func, 'func', (1,), {}, 0, [owner1]),
+                   (func, 'func', (2,), {}, 0, [owner2])])
+        q.dequeue('func', owner1)
+        q.dequeue('func', owner2)
+
+    q.call(burst, 'burst')
+    assert called == []
+
+    # Owners are retained on held calls
+    q.hold()
+    q.callAll([(func, 'func', (3,), {}, 0, [owner1])])
+    q.dequeue('func', owner2)
+    q.release()
+    held = q.clearHeld()
+    assert held[0][5] == [owner1]
+    q.callAll(held)
+    assert called == [3]
@@ -0,0 +1,265 @@
+#!/usr/bin/env python
+#
+# test_properties.py -
+#
+# Author: Paul McCarthy <pauldmccarthy@gmail.com>
+#
+
+
+import fsleyes_props as props
+
+
+def test_getAllProperties():
+
+    class Base(props.HasProperties):
+        b     = props.Int()
+        a     = props.Real()
+        _priv = props.Boolean()
+        notAProp = 5
+
+    class Sub(Base):
+        c = props.String()
+        a = props.Int()
+
+    names, objs = Base.getAllProperties()
+    assert names == ['a', 'b']
+    assert objs  == [Base.getProp('a'), Base.getProp('b')]
+
+    names, objs = Sub.getAllProperties()
+    assert names == ['a', 'b', 'c']
+    assert objs  == [Sub.getProp('a'), Base.getProp('b'), Sub.getProp('c')]
+    assert isinstance(objs[0], props.Int)
+
+    # Modifying the returned lists
+    # must not affect the class
+    names.append('d')
+    assert Sub.getAllProperties()[0] == ['a', 'b', 'c']
+
+    # Private properties are still
+    # added to new instances
+    s = Sub()
+    assert s.getPropVal('_priv') is not None
+    s.c = 'abc'
+    s.a = 4
+    assert s.c == 'abc'
+    assert s.a == 4
+
+
+def test_addProperty_class_level():
+
+    class Base(props.HasProperties):
+        a = props.Int()
+
+    class Sub(Base):
+        b = props.Int()
+
+    assert Base.getAllProperties()[0] == ['a']
+    assert Sub .getAllProperties()[0] == ['a', 'b']
+
+    # addProperty adds the property to the class
+    # of the instance, so its registry (and that
+    # of its sub-classes) must be updated
+    base = Base()
+    base.addProperty('c', props.Int(default=3))
+
+    assert Base.getAllProperties()[0] == ['a', 'c']
+    assert Sub .getAllProperties()[0] == ['a', 'b', 'c']
+
+    # New instances get the new property
+    assert Base().c == 3
+
+    # Properties assigned/removed directly
+    # on the class are picked up as well
+    Sub.d = props.Int(default=4)
+    assert Base.getAllProperties()[0] == ['a', 'c']
+    assert Sub .getAllProperties()[0] == ['a', 'b', 'c', 'd']
+
+    del Sub.d
+    assert Sub .getAllProperties()[0] == ['a', 'b', 'c']
+
+
+def test_lazyProperties():
+
+    class Thing(props.HasProperties):
+        _lazyProperties = True
+        myint  = props.Int(default=3)
+        myreal = props.Real(default=1)
+        mylist = props.List(default=[1, 2, 3])
+        mycol  = props.Colour(default=(0.5, 0.5, 0.5))
+
+    t = Thing()
+
+    # No property values are created up front
+    for name in Thing.getAllProperties()[0]:
+        assert name not in t.__dict__
+
+    # Reading a scalar property returns
+    # the (cast) default value
+    assert t.myint  == 3
+    assert t.myreal == 1.0
+    assert isinstance(t.myreal, float)
+    assert t.mycol  == [0.5, 0.5, 0.5, 1.0]
+    assert t.getAttribute('myint', 'minval') is None
+    assert 'myint'  not in t.__dict__
+    assert 'myreal' not in t.__dict__
+
+    # List properties are created on first read
+    assert t.mylist == [1, 2, 3]
+    assert 'mylist' in t.__dict__
+
+    # Adding a listener creates the property value
+    called = {}
+
+    def listener(value, *a):
+        called['myint'] = value
+
+    t.addListener('myint', 'listener', listener, weak=False)
+    assert 'myint' in t.__dict__
+    t.myint = 5
+    assert called['myint'] == 5
+    assert t.myint == 5
+
+    # Assigning creates the property value
+    t.myreal = 2
+    assert 'myreal' in t.__dict__
+    assert t.myreal == 2.0
+
+    # Setting an attribute on an instance must
+    # not modify the class-level default
+    t2 = Thing()
+    t2.setAttribute('myint', 'maxval', 10)
+    assert t2.getAttribute('myint', 'maxval') == 10
+    assert Thing.getProp('myint').getAttribute(None, 'maxval') is None
+    assert Thing().getAttribute('myint', 'maxval') is None
+
+    # Binding
+    t3 = Thing()
+    t4 = Thing()
+    t3.bindProps('myint', t4)
+    t4.myint = 8
+    assert t3.myint == 8
+
+
+def test_batch():
+
+    class Thing(props.HasProperties):
+        myint  = props.Int()
+        myreal = props.Real()
+        mylist = props.List(props.Int())
+
+    t1     = Thing()
+    t2     = Thing()
+    called = []
+
+    def listener(value, valid, ctx, name):
+        called.append((name, value))
+
+    t2.bindProps('myint', t1)
+
+    t1.addGlobalListener('listener', listener, weak=False)
+    t2.addListener('myint', 'listener2', listener, weak=False)
+
+    with t1.batch():
+        t1.myint  = 1
+        t1.myint  = 2
+        t1.myreal = 3
+        t1.myint  = 4
+        t1.mylist = [1, 2, 3]
+
+        # Values are cast and stored immediately,
+        # but not synced or notified
+        assert t1.myint  == 4
+        assert t1.myreal == 3.0
+        assert t2.myint  == 0
+        assert called    == []
+
+        # Nested batches are notified
+        # by the outermost batch
+        with t1.batch():
+            t1.myreal = 5
+
+        assert called == []
+
+    assert t2.myint == 4
+    assert sorted(called) == sorted([('myint',  4),
+                                     ('myint',  4),
+                                     ('myreal', 5.0),
+                                     ('mylist', [1, 2, 3])])
+
+    # Changes after the batch are
+    # notified as normal
+    called[:] = []
+    t1.myint = 6
+    assert t2.myint == 6
+    assert len(called) == 2
+
+    # update
+    called[:] = []
+    t1.update(myint=7, myreal=8)
+    assert t1.myint  == 7
+    assert t1.myreal == 8
+    assert t2.myint  == 7
+    assert sorted(called) == [('myint', 7), ('myint', 7), ('myreal', 8.0)]
+
+    # Invalid values/casts still raise
+    # errors - previous changes are
+    # retained, and synced to bound
+    # properties, but are not notified
+    called[:] = []
+    try:
+        with t1.batch():
+            t1.myint = 9
+            t1.myint = 'abc'
+        assert False
+    except ValueError:
+        pass
+    assert t1.myint == 9
+    assert t2.myint == 9
+    assert called   == []
+
+    # The batch is released after an
+    # error, so subsequent changes
+    # are notified as normal
+    t1.myreal = 10
+    assert called == [('myreal', 10.0)]
+    t2.myint = 11
+    assert t1.myint == 11
+
+
+def test_retainLast_defaults():
+
+    import gc
+
+    class Thing(object):
+        pass
+
+    class Things(props.HasProperties):
+        myint   = props.Int()
+        myobj   = props.Object()
+        mylist  = props.List(props.Int())
+        mypoint = props.Point(ndims=2)
+
+    t = Things()
+
+    t.myint   = 1
+    t.myint   = 2
+    t.mylist  = [1, 2]
+    t.mylist  = [3, 4, 5]
+    t.mypoint = [1, 2]
+    t.mypoint = [3, 4]
+
+    # Small types retain the previous value
+    assert t.getLastValue('myint') == 1
+
+    # Lists do not
+    assert t.getLastValue('mylist')  is None
+    assert t.getLastValue('mypoint') is None
+
+    # Objects are weakly referenced
+    o1, o2  = Thing(), Thing()
+    t.myobj = o1
+    t.myobj = o2
+    assert t.getLastValue('myobj') is o1
+    del o1
+    gc.collect()
+    assert t.getLastValue('myobj') is None
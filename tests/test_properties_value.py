@@ -76,3 +76,384 @@ def test_listener():
 
     assert called['al1'] == 2
     assert called['al2'] == 2
+
+
+def test_slots():
+
+    ctx = Context()
+    pv  = properties_value.PropertyValue(ctx)
+
+    assert not hasattr(pv, '__dict__')
+
+    # Bound PVs are stored in declared fields
+    pv2 = properties_value.PropertyValue(ctx)
+    properties_value.bindable.bindPropVals(pv, pv2)
+    assert properties_value.bindable.propValsAreBound(pv, pv2)
+
+    # Default names and pre/post notify
+    # listeners are created on demand
+    assert pv._name.startswith('PropertyValue_')
+    assert pv._preNotifyListener is None
+
+    called = {}
+
+    def prenotify(*a):
+        called['pre'] = True
+
+    pv.setPreNotifyFunction(prenotify)
+    pv.set('New value')
+    assert called['pre']
+
+
+def test_memory():
+
+    import gc
+    import tracemalloc
+
+    ctx = Context()
+    n   = 1000
+
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    pvs    = [properties_value.PropertyValue(ctx, name='pv', value=1)
+              for i in range(n)]
+    after  = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    # ~1kb per PV before __slots__ were used
+    assert (after - before) / float(n) < 500
+    assert len(pvs) == n
+
+
+def test_listener_cache():
+
+    ctx    = Context()
+    pv     = properties_value.PropertyValue(ctx, value=0)
+    called = {}
+
+    def l1(*a):
+        called['l1'] = called.get('l1', 0) + 1
+
+    def l2(*a):
+        called['l2'] = called.get('l2', 0) + 1
+
+    class Owner(object):
+        def listener(self, *a):
+            called['owner'] = called.get('owner', 0) + 1
+
+    owner = Owner()
+
+    pv.addListener('l1',    l1, weak=False)
+    pv.addListener('owner', owner.listener)
+
+    # The listener list is re-used
+    # until something changes
+    first = pv.prepareListeners(False)[0]
+    assert len(first) == 2
+    assert pv.prepareListeners(False)[0] is first
+
+    pv.addListener('l2', l2, weak=False)
+    listeners = pv.prepareListeners(False)[0]
+    assert listeners is not first
+    assert len(listeners) == 3
+
+    pv.disableListener('l1')
+    assert len(pv.prepareListeners(False)[0]) == 2
+    pv.set(1)
+    assert 'l1' not in called
+    assert called['l2']    == 1
+    assert called['owner'] == 1
+
+    pv.enableListener('l1')
+    pv.removeListener('l2')
+    pv.set(2)
+    assert called['l1']    == 1
+    assert called['l2']    == 1
+    assert called['owner'] == 2
+
+    # GC of the owner of a weakly
+    # referenced listener invalidates
+    # the cache
+    listeners = pv.prepareListeners(False)[0]
+    del owner
+    import gc
+    gc.collect()
+    assert pv.prepareListeners(False)[0] is not listeners
+    assert len(pv.prepareListeners(False)[0]) == 1
+    assert not pv.hasListener('owner')
+
+    pv.set(3)
+    assert called['l1'] == 2
+
+
+def test_queue_coalesce():
+
+    ctx    = Context()
+    pv1    = properties_value.PropertyValue(ctx, value=0)
+    pv2    = properties_value.PropertyValue(ctx, value=0)
+    called = []
+
+    def l1(*a):
+        for i in range(1, 6):
+            pv2.set(i)
+
+    def l2(value, *a):
+        called.append(value)
+
+    pv1.addListener('l1', l1, weak=False)
+    pv2.addListener('l2', l2, weak=False)
+
+    pv1.set(1)
+
+    # Listener is called once, with
+    # the most recent value
+    assert called == [5]
+
+
+def test_listener_priority():
+
+    ctx    = Context()
+    pvs    = [properties_value.PropertyValue(ctx, name='pv{}'.format(i))
+              for i in range(4)]
+    called = []
+
+    def listener(value, valid, ctx, name):
+        called.append(name)
+
+    def refresh(value, valid, ctx, name):
+        called.append('refresh')
+
+    def trigger(value, *a):
+        for pv in pvs[1:]:
+            pv.set(value)
+
+    pvs[0].addListener('trigger', trigger, weak=False)
+    pvs[1].addListener('l', listener, weak=False)
+    pvs[2].addListener('l', listener, weak=False, priority=5)
+    pvs[3].addListener('l', listener, weak=False, priority=-5)
+
+    # The same idle listener registered on several
+    # PVs is called once, after everything else
+    for pv in pvs:
+        pv.addListener('refresh',
+                       refresh,
+                       weak=False,
+                       priority=properties_value.callqueue.IDLE)
+
+    pvs[0].set(1)
+    assert called == ['pv2', 'pv1', 'pv3', 'refresh']
+
+    # Overwriting a listener changes its priority
+    called[:] = []
+    pvs[3].addListener('l', listener, weak=False, priority=10, overwrite=True)
+    pvs[0].set(2)
+    assert called == ['pv3', 'pv2', 'pv1', 'refresh']
+
+    # Removing an idle listener from one PV
+    # does not cancel the pending idle call
+    # of the same listener on another PV
+    def remove(value, *a):
+        pvs[2].removeListener('refresh')
+
+    called[:] = []
+    pvs[1].addListener('remove', remove, weak=False)
+    pvs[0].set(3)
+    assert called == ['pv3', 'pv2', 'pv1', 'refresh']
+
+    # But it is cancelled when the listener
+    # is removed from all of them
+    def removeAll(value, *a):
+        for pv in pvs:
+            pv.removeListener('refresh')
+
+    called[:] = []
+    pvs[1].addListener('remove', removeAll, weak=False, overwrite=True)
+    pvs[0].set(4)
+    assert called == ['pv3', 'pv2', 'pv1']
+
+
+def test_list_access():
+
+    ctx = Context()
+    pvl = properties_value.PropertyValueList(ctx, 'list', [3, 1, 4, 1, 5])
+
+    assert len(pvl)        == 5
+    assert pvl[0]          == 3
+    assert pvl[-1]         == 5
+    assert pvl[1:3]        == [1, 4]
+    assert pvl[::2]        == [3, 4, 5]
+    assert list(pvl)       == [3, 1, 4, 1, 5]
+    assert pvl.index(1)    == 1
+    assert pvl.count(1)    == 2
+    assert 4      in pvl
+    assert 9  not in pvl
+    assert pvl.getPropertyValue(2).get() == 4
+
+    try:
+        pvl.index(9)
+        assert False
+    except ValueError:
+        pass
+
+    # Modifying the list during
+    # iteration does not affect
+    # the iteration
+    vals = []
+    for v in pvl:
+        vals.append(v)
+        if len(vals) == 1:
+            pvl.append(9)
+            pvl[0] = 2
+
+    assert vals == [3, 1, 4, 1, 5]
+    assert pvl  == [2, 1, 4, 1, 5, 9]
+
+    pvl[-1] = 6
+    assert pvl[:] == [2, 1, 4, 1, 5, 6]
+
+
+def test_list_lazy_items():
+
+    ctx = Context()
+    pvl = properties_value.PropertyValueList(
+        ctx, 'list', ['1', '2', '3'], itemCastFunc=lambda c, a, v: int(v))
+
+    def isPV(i):
+        items = properties_value.PropertyValue.get(pvl)
+        return isinstance(items[i], properties_value.PropertyValue)
+
+    # Items are cast, but PVs are not
+    # created until they are needed
+    assert pvl[:] == [1, 2, 3]
+    assert not any([isPV(i) for i in range(3)])
+
+    listCalls = []
+    itemCalls = []
+
+    def listListener(*a):
+        listCalls.append(pvl[:])
+
+    def itemListener(value, *a):
+        itemCalls.append(value)
+
+    pvl.addListener('list', listListener, weak=False)
+
+    pvl.append('4')
+    pvl[0] = '5'
+    assert pvl[:]    == [5, 2, 3, 4]
+    assert listCalls == [[1, 2, 3, 4], [5, 2, 3, 4]]
+    assert not any([isPV(i) for i in range(4)])
+
+    # Accessing one item creates a PV for that
+    # item only, without changing the list
+    pv = pvl.getPropertyValue(1)
+    pv.addListener('item', itemListener, weak=False)
+    assert     isPV(1)
+    assert not isPV(0)
+    assert pvl[:]         == [5, 2, 3, 4]
+    assert len(listCalls) == 2
+
+    # Item and list-level listeners
+    # are called as normal
+    pv.set(6)
+    pvl[1] = 7
+    pvl[2] = 8
+    assert pvl[:]    == [5, 7, 8, 4]
+    assert itemCalls == [6, 7]
+    assert listCalls[2:] == [[5, 6, 3, 4], [5, 7, 3, 4], [5, 7, 8, 4]]
+
+    pvl.move(1, 3)
+    assert pvl.getPropertyValue(3) is pv
+    assert pvl.pop(3) == 7
+
+    assert [p.get() for p in pvl.getPropertyValueList()] == [5, 8, 4]
+    assert all([isPV(i) for i in range(3)])
+
+
+def test_list_asarray():
+
+    import numpy as np
+
+    ctx = Context()
+    pvl = properties_value.PropertyValueList(
+        ctx, 'list', [1, 2, 3], itemDtype=np.float32)
+
+    arr = pvl.asarray()
+    assert arr.dtype == np.float32
+    assert np.all(arr == [1, 2, 3])
+    assert pvl.asarray() is arr
+
+    try:
+        arr[0] = 5
+        assert False
+    except ValueError:
+        pass
+
+    # Any change to the list
+    # causes a new array to
+    # be created
+    pvl[0] = 5
+    assert np.all(pvl.asarray() == [5, 2, 3])
+    pvl.getPropertyValue(1).set(6)
+    assert np.all(pvl.asarray() == [5, 6, 3])
+    pvl.append(7)
+    assert np.all(pvl.asarray() == [5, 6, 3, 7])
+    pvl.reorder([3, 2, 1, 0])
+    assert np.all(pvl.asarray() == [7, 3, 6, 5])
+    assert np.all(arr == [1, 2, 3])
+
+    # Data type is inferred if not provided
+    pvl = properties_value.PropertyValueList(ctx, 'list', [1, 2, 3])
+    assert pvl.asarray().dtype.kind == 'i'
+
+
+def test_retain_last():
+
+    import gc
+
+    class Thing(object):
+        pass
+
+    ctx = Context()
+
+    full = properties_value.PropertyValue(ctx, value=1)
+    none = properties_value.PropertyValue(ctx, value=1, retainLast='none')
+    weak = properties_value.PropertyValue(ctx, value=1, retainLast='weak')
+
+    for pv in (full, none, weak):
+        pv.set(2)
+
+    # ints cannot be weakly referenced
+    assert full.getLast() == 1
+    assert none.getLast() is None
+    assert weak.getLast() is None
+
+    # Change detection does not
+    # depend on the last value
+    called = []
+    none.addListener('l', lambda *a: called.append(a), weak=False)
+    none.set(2)
+    none.set(3)
+    assert len(called) == 1
+
+    # Weakly referenced values are
+    # available while they are alive
+    t1, t2 = Thing(), Thing()
+    weak.set(t1)
+    weak.set(t2)
+    assert weak.getLast() is t1
+    del t1
+    gc.collect()
+    assert weak.getLast() is None
+
+    pvl = properties_value.PropertyValueList(
+        ctx, 'list', [1, 2, 3], retainLast='none')
+    pvl.append(4)
+    assert pvl.getLast() is None
+
+    try:
+        properties_value.PropertyValue(ctx, retainLast='bad')
+        assert False
+    except ValueError:
+        pass
@@ -0,0 +1,457 @@
+#!/usr/bin/env python
+#
+# test_property_array.py -
+#
+# Author: Paul McCarthy <pauldmccarthy@gmail.com>
+#
+
+
+import os.path as op
+
+import numpy  as np
+import pytest
+
+import fsleyes_props                  as props
+import fsleyes_props.properties_value as propvals
+import fsleyes_props.properties_types as proptypes
+
+
+class Thing(props.HasProperties):
+    copied   = props.Array(dtype=np.float32, shape=(10, 10))
+    shared   = props.Array(dtype=np.float32, shape=(10, 10), copy=False)
+
+
+def test_copy():
+
+    t1  = Thing()
+    t2  = Thing()
+    arr = np.zeros((10, 10), dtype=np.float32)
+
+    # Default values are not shared
+    for name in ('copied', 'shared'):
+        default = Thing.getProp(name).getAttribute(None, 'default')
+        a1      = getattr(t1, name).getArray()
+        a2      = getattr(t2, name).getArray()
+        assert a1 is not a2
+        assert not np.shares_memory(a1, default)
+        assert a1.dtype == np.float32
+
+    t1.copied = arr
+    t1.shared = arr
+    assert t1.copied.getArray() is not arr
+    assert t1.shared.getArray() is     arr
+
+    # Arrays of a different type are
+    # always cast, and therefore copied
+    t1.shared = np.ones((10, 10), dtype=np.float64)
+    assert t1.shared.getArray().dtype == np.float32
+    assert np.all(t1.shared.getArray() == 1)
+
+
+def test_setitem():
+
+    t      = Thing()
+    called = []
+
+    def listener(value, *a):
+        called.append(value[2, 3])
+
+    t.addListener('copied', 'listener', listener)
+    t.addListener('shared', 'listener', listener)
+
+    for name in ('copied', 'shared'):
+
+        called[:] = []
+        proxy     = getattr(t, name)
+        array     = proxy.getArray()
+
+        # Element writes are applied in place,
+        # and always result in notification
+        proxy[2, 3] = 5
+        proxy[2, 3] = 5
+        proxy[:, 0] = 1
+
+        assert proxy.getArray() is array
+        assert array[2, 3] == 5
+        assert np.all(array[:, 0] == 1)
+        assert called == [5, 5, 5]
+
+
+
+def test_indexRegion():
+
+    shape = (10, 10, 10)
+    s     = slice
+
+    tests = [
+        (3,                      (s(3, 4),  s(0, 10), s(0, 10))),
+        (-1,                     (s(9, 10), s(0, 10), s(0, 10))),
+        ((3, 4, 5),              (s(3, 4),  s(4, 5),  s(5, 6))),
+        ((s(2, 5), 1),           (s(2, 5),  s(1, 2),  s(0, 10))),
+        ((s(None, None, 3),),    (s(0, 10), s(0, 10), s(0, 10))),
+        ((s(1, 8, 3),),          (s(1, 8),  s(0, 10), s(0, 10))),
+        ((s(8, 1, -2),),         (s(2, 9),  s(0, 10), s(0, 10))),
+        ((Ellipsis, 2),          (s(0, 10), s(0, 10), s(2, 3))),
+        ((1, Ellipsis, 2),       (s(1, 2),  s(0, 10), s(2, 3))),
+        ((1, None, 2),           (s(1, 2),  s(2, 3),  s(0, 10))),
+        (([1, 5, 3], 0),         (s(1, 6),  s(0, 1),  s(0, 10))),
+        (np.ones((10, 10), bool), (s(0, 10), s(0, 10), s(0, 10))),
+        ((s(5, 5),),             (s(0, 0),  s(0, 10), s(0, 10))),
+    ]
+
+    for index, expected in tests:
+        assert proptypes._indexRegion(index, shape) == expected
+
+
+def test_dirty_regions():
+
+    class Vol(props.HasProperties):
+        data = props.Array(dtype=np.float32, shape=(10, 10, 10))
+
+    vol     = Vol()
+    changes = []
+    s       = slice
+
+    def listener(value, valid, ctx, name, regions):
+        changes.append(regions)
+
+    vol.addListener('data', 'listener', listener, changes=True)
+
+    vol.data[3, :, 2:4] = 0
+    vol.data.update([(4, 0, 0), (s(0, 2), 1, 1)], [1, 2])
+
+    assert changes == [
+        [(s(3, 4), s(0, 10), s(2, 4))],
+        [(s(4, 5), s(0, 1),  s(0, 1)), (s(0, 2), s(1, 2), s(1, 2))]]
+    assert vol.data[4, 0, 0] == 1
+    assert np.all(vol.data[:2, 1, 1] == 2)
+
+    # Modify directly, then notify
+    changes[:] = []
+    vol.data.getArray()[5, 5, 5] = 9
+    vol.data.update([(5, 5, 5)])
+    assert changes == [[(s(5, 6), s(5, 6), s(5, 6))]]
+
+    # Assigning a new array dirties everything
+    changes[:] = []
+    vol.data = np.ones((10, 10, 10))
+    assert changes == [[(s(0, 10), s(0, 10), s(0, 10))]]
+
+    # Regions accumulate during a batch
+    changes[:] = []
+    with vol.batch():
+        vol.data[1, 1, 1] = 5
+        vol.data[2, 2, 2] = 5
+    assert changes == [[(s(1, 2), s(1, 2), s(1, 2)),
+                        (s(2, 3), s(2, 3), s(2, 3))]]
+
+    # Unchanged assignment does not affect regions
+    changes[:] = []
+    with vol.batch():
+        vol.data[1, 1, 1] = 6
+        vol.data          = vol.data
+    assert changes == [[(s(1, 2), s(1, 2), s(1, 2))]]
+
+    bbox = proptypes.ArrayProxy.boundingBox(
+        [(s(1, 2), s(1, 2), s(1, 2)),
+         (s(0, 0), s(0, 1), s(0, 1)),
+         (s(4, 8), s(0, 2), s(3, 4))])
+    assert bbox == (s(1, 8), s(0, 2), s(1, 4))
+    assert proptypes.ArrayProxy.boundingBox([]) is None
+
+    try:
+        propvals.PropertyValue(vol).addListener(
+            'l', listener, changes=True)
+        assert False
+    except ValueError:
+        pass
+
+
+def test_version():
+
+    class Vol(props.HasProperties):
+        data   = props.Array(dtype=np.float32, shape=(10, 10, 10))
+        shared = props.Array(dtype=np.float32, shape=(10, 10, 10), copy=False)
+
+    vol    = Vol()
+    called = []
+
+    def listener(value, *a):
+        called.append(value.getVersion())
+
+    assert vol.data.getVersion() == 0
+
+    # The first assignment validates the
+    # initial value, which may result in
+    # notification
+    vol.data   = vol.data
+    vol.shared = vol.shared
+    v          = vol.data.getVersion()
+
+    vol.addListener('data', 'listener', listener)
+
+    # Every write or assignment bumps
+    # the version, before listeners
+    # are called
+    vol.data[0, 0, 0] = 1
+    vol.data[0, 0, 0] = 1
+    vol.data.update([(1, 1, 1)])
+    vol.data = np.zeros((10, 10, 10))
+    assert called                == [v + 1, v + 2, v + 3, v + 4]
+    assert vol.data.getVersion() == v + 4
+
+    # Re-assigning the same array,
+    # or re-validating, does not
+    called[:] = []
+    sv        = vol.shared.getVersion()
+    vol.data  = vol.data
+    vol.data.revalidate()
+    vol.setAttribute('data', 'something', 'else')
+    vol.shared = vol.shared.getArray()
+    assert called                  == []
+    assert vol.data  .getVersion() == v + 4
+    assert vol.shared.getVersion() == sv
+
+    # Changing validity does
+    vol.setAttribute('data', 'resizable', False)
+    vol.setAttribute('data', 'shape',     (5, 5, 5))
+    assert not vol.data.isValid()
+    assert called == [v + 5]
+
+    # Proxies are only equal to themselves
+    # (an element-wise comparison is made
+    # with other values)
+    vol2 = Vol()
+    assert vol.data  == vol.data
+    assert vol.data  != vol2.data
+    assert vol2.data == np.zeros((10, 10, 10))
+    assert vol2.data != np.ones( (10, 10, 10))
+
+
+def test_version_bound():
+
+    class Vol(props.HasProperties):
+        data   = props.Array(dtype=np.float32, shape=(10, 10, 10))
+        shared = props.Array(dtype=np.float32, shape=(10, 10, 10), copy=False)
+
+    vol1   = Vol()
+    vol2   = Vol()
+    called = []
+
+    def listener(value, valid, ctx, name):
+        called.append((ctx, name, value.getVersion()))
+
+    vol2.bindProps('data',   vol1)
+    vol2.bindProps('shared', vol1)
+
+    for name in ('data', 'shared'):
+
+        called[:] = []
+
+        vol1.addListener(name, 'listener1', listener)
+        vol2.addListener(name, 'listener2', listener)
+
+        v1 = getattr(vol1, name).getVersion()
+        v2 = getattr(vol2, name).getVersion()
+
+        getattr(vol1, name)[1, 2, 3] = 4
+        assert getattr(vol2, name)[1, 2, 3] == 4
+
+        # Listeners of both proxies are notified,
+        # even if they share the same array
+        assert len(called) == 2
+        assert (vol1, name, v1 + 1) in called
+        assert (vol2, name, v2 + 1) in called
+
+    assert vol1.shared.getArray() is     vol2.shared.getArray()
+    assert vol1.data  .getArray() is not vol2.data  .getArray()
+
+
+def test_mapped(tmpdir):
+
+    class Image(props.HasProperties):
+        data  = props.MappedArray()
+        cow   = props.MappedArray(mode='c')
+        raw   = props.MappedArray(dtype=np.int16, shape=(4, 5), offset=8)
+        fixed = props.MappedArray(dtype=np.float32,
+                                  shape=(3, 4, 5),
+                                  resizable=False)
+
+    data   = np.arange(60, dtype=np.float32).reshape((3, 4, 5))
+    npy    = op.join(str(tmpdir), 'data.npy')
+    raw    = op.join(str(tmpdir), 'data.raw')
+    np.save(npy, data)
+    with open(raw, 'wb') as f:
+        f.write(b'\0' * 8)
+        f.write(np.arange(20, dtype=np.int16).tobytes())
+
+    img = Image()
+
+    # No array until a file is given
+    assert img.data.getPath()  is None
+    assert img.data.getArray() is None
+
+    # The file is not opened until
+    # the array is accessed
+    img.data = npy
+    assert not img.data.isOpen()
+    assert img.data.shape == (3, 4, 5)
+    assert img.data.isOpen()
+    assert isinstance(img.data.getArray(), np.memmap)
+    assert np.all(img.data[1, 2] == data[1, 2])
+
+    # Read-only
+    with pytest.raises(ValueError):
+        img.data[0, 0, 0] = 5
+
+    # Copy-on-write - changes are
+    # not written to the file
+    called = []
+    img.addListener('cow', 'listener', lambda *a: called.append(a),
+                    weak=False)
+    img.cow = npy
+    img.cow[0, 0, 0] = 100
+    assert img.cow[0, 0, 0] == 100
+    assert len(called)      == 2
+    assert np.all(np.load(npy) == data)
+
+    # Raw files
+    img.raw = raw
+    assert np.all(img.raw.getArray() == np.arange(20).reshape((4, 5)))
+
+    # Validation only reads the header
+    img.fixed = npy
+    assert img.fixed.isValid()
+    img.fixed = raw
+    assert not img.fixed.isValid()
+    img.cow = op.join(str(tmpdir), 'nonexistent.npy')
+    assert not img.cow.isValid()
+    with pytest.raises(ValueError):
+        props.MappedArray(mode='w')
+
+    # Serialisation stores the path
+    assert props.serialise(img, 'data') == npy
+    img2 = Image()
+    assert props.serialise(img2, 'data') == ''
+    img2.data = props.deserialise(img2, 'data', npy)
+    assert np.all(img2.data[:] == data)
+
+
+def _shared_worker(handle, value):
+    data = handle.open()
+    data[2:4, 1] = value
+    handle.update([(slice(2, 4), 1)])
+    del data
+    handle.close()
+
+
+def test_shared():
+
+    import multiprocessing as mp
+
+    class Image(props.HasProperties):
+        data = props.SharedArray(dtype=np.float32, shape=(10, 10, 10))
+
+    # Shared memory is not allocated
+    # until an array is assigned
+    nblocks = len(proptypes._sharedMemoryBlocks)
+    img     = Image()
+    changes = []
+
+    assert img.data.getArray() is None
+    assert img.data.getName()  is None
+    assert len(proptypes._sharedMemoryBlocks) == nblocks
+    with pytest.raises(ValueError):
+        img.data.getHandle()
+
+    img.data = np.zeros((10, 10, 10))
+    assert len(proptypes._sharedMemoryBlocks) == nblocks + 1
+
+    def listener(value, valid, ctx, name, regions):
+        changes.append(regions)
+
+    img.addListener('data', 'listener', listener, weak=False, changes=True)
+
+    handle = img.data.getHandle()
+    name   = img.data.getName()
+    assert not img.data.poll()
+
+    # Changes made by another process are
+    # visible, and notified on poll
+    worker = mp.Process(target=_shared_worker, args=(handle, 5))
+    worker.start()
+    worker.join()
+
+    assert np.all(img.data[2:4, 1] == 5)
+    assert changes == []
+    assert img.data.poll(5)
+    assert changes == [[(slice(2, 4), slice(1, 2), slice(0, 10))]]
+    assert not img.data.poll()
+
+    # Changes to an old array are ignored
+    changes[:] = []
+    img.data   = np.ones((10, 10, 10))
+    changes[:] = []
+    assert img.data.getName() != name
+
+    worker = mp.Process(target=_shared_worker, args=(handle, 6))
+    worker.start()
+    worker.join()
+    assert not img.data.poll(5)
+    assert np.all(img.data[:] == 1)
+
+    # Handles can also be used in
+    # the owning process
+    handle = img.data.getHandle()
+    assert handle.name  == img.data.getName()
+    assert handle.shape == (10, 10, 10)
+    data = handle.open()
+    data[0, 0, 0] = 9
+    assert img.data[0, 0, 0] == 9
+    del data
+    handle.close()
+
+
+def test_retain_last():
+
+    import gc
+    import weakref
+
+    class Vol(props.HasProperties):
+        full = props.Array(dtype=np.float32,
+                           shape=(10, 10, 10),
+                           retainLast='full')
+        none = props.Array(dtype=np.float32,
+                           shape=(10, 10, 10),
+                           retainLast='none')
+        weak = props.Array(dtype=np.float32,
+                           shape=(10, 10, 10),
+                           retainLast='weak')
+
+    vol = Vol()
+
+    for name in ('full', 'none', 'weak'):
+        setattr(vol, name, np.ones((10, 10, 10)))
+        old = weakref.ref(getattr(vol, name).getArray())
+        setattr(vol, name, np.zeros((10, 10, 10)))
+        gc.collect()
+
+        if name == 'full':
+            assert old() is not None
+            assert np.all(vol.getLastValue(name) == 1)
+        else:
+            assert old() is None
+            assert vol.getLastValue(name) is None
+
+    # Arrays are weakly referenced by default
+    class Default(props.HasProperties):
+        arr = props.Array(dtype=np.float32, shape=(10, 10, 10))
+
+    obj     = Default()
+    obj.arr = np.ones((10, 10, 10))
+    old     = obj.arr.getArray()
+    obj.arr = np.zeros((10, 10, 10))
+    assert np.all(obj.getLastValue('arr') == 1)
+    del old
+    gc.collect()
+    assert obj.getLastValue('arr') is None
@@ -191,3 +191,71 @@ def test_Percentage():
 
         setattr(obj, prop, val)
         assert getattr(obj, prop) == exp
+
+
+def test_number_list(monkeypatch):
+
+    import numpy as np
+    import fsleyes_props.properties_value as properties_value
+
+    # Force the vectorised cast/validation
+    # path to be used on short lists
+    monkeypatch.setattr(properties_value.PropertyValueList,
+                        '_arrayCastThreshold',
+                        0)
+
+    class MyObj(props.HasProperties):
+        ints    = props.List(props.Int(minval=0, maxval=10, clamped=True))
+        reals   = props.List(props.Real(minval=0, maxval=1,
+                                        allowInvalid=False))
+        custom  = props.List(props.Int(validateFunc=lambda i, a, v: v != 3,
+                                       allowInvalid=False))
+
+    obj = MyObj()
+
+    # Values are cast and clamped
+    # as a whole, but are stored as
+    # python ints/floats
+    obj.ints = [-5, '3', 4.7, 20]
+    assert obj.ints == [0, 3, 4, 10]
+    assert all(type(v) is int for v in obj.ints)
+    assert obj.ints.asarray().dtype == np.int64
+
+    obj.ints[1:3] = [12, -1]
+    assert obj.ints == [0, 10, 0, 10]
+
+    obj.reals = [0.25, 0.5, 1]
+    assert obj.reals == [0.25, 0.5, 1.0]
+    assert all(type(v) is float for v in obj.reals)
+
+    # Invalid values are rejected, and
+    # non-numeric values raise the same
+    # errors as a single Int/Real would
+    with pytest.raises(ValueError):
+        obj.reals = [0.5, 2]
+    with pytest.raises(ValueError):
+        obj.reals.append(-1)
+    with pytest.raises(ValueError):
+        obj.ints = [1, 'abc']
+    with pytest.raises(TypeError):
+        obj.ints = [1, None]
+    with pytest.raises(ValueError):
+        obj.ints = [1, float('nan')]
+    assert obj.reals == [0.25, 0.5, 1.0]
+    assert obj.ints  == [0, 10, 0, 10]
+
+    # Custom item validation functions
+    # are still called on every item
+    obj.custom = [1, 2]
+    with pytest.raises(ValueError):
+        obj.custom = [1, 2, 3]
+    with pytest.raises(ValueError):
+        obj.custom[0] = 3
+    assert obj.custom == [1, 2]
+
+    # Items with their own property value,
+    # and hence their own limits, are
+    # cast and validated individually
+    obj.ints.getPropertyValue(0).setAttribute('maxval', 5)
+    obj.ints[:] = [7, 7, 7, 7]
+    assert obj.ints == [5, 7, 7, 7]
@@ -5,8 +5,13 @@
 # Author: Paul McCarthy <pauldmccarthy@gmail.com>
 #
 
+import gc
+
+import pytest
+
 import fsleyes_props as props
 
+
 def test_syncabe_list_link1():  _test_syncabe_list_link(1)
 def test_syncabe_list_link2():  _test_syncabe_list_link(2)
 def test_syncabe_list_link3():  _test_syncabe_list_link(3)
@@ -66,3 +71,344 @@ def _test_syncabe_list_link(nchildren):
     for i in [parent] + children:
         assert i.crange == [5, 20]
         assert i.drange == [5, 10]
+
+
+def test_sync_state():
+
+    class Thing(props.SyncableHasProperties):
+        a = props.Int()
+        b = props.Int()
+        c = props.Int()
+        d = props.Int()
+
+    parent = Thing()
+    child1 = Thing(parent=parent, nobind=['c'], nounbind=['d'])
+    child2 = Thing(parent=parent, state={'b' : False})
+    called = []
+
+    def listener(value, valid, ctx, name):
+        called.append((value, ctx, name))
+
+    # No hidden properties are added
+    assert Thing.getAllProperties()[0] == ['a', 'b', 'c', 'd']
+    assert Thing._getPropertyRegistry()[0] == ['a', 'b', 'c', 'd']
+
+    assert [child1.isSyncedToParent(p) for p in 'abcd'] == [1, 1, 0, 1]
+    assert [child2.isSyncedToParent(p) for p in 'abcd'] == [1, 0, 1, 1]
+    assert not parent.isSyncedToParent('a')
+
+    child1.addSyncChangeListener('a', 'listener1', listener)
+    child2.addSyncChangeListener('b', 'listener2', listener)
+
+    parent.a = 1
+    parent.b = 2
+    assert child1.a == 1 and child2.a == 1
+    assert child1.b == 2 and child2.b == 0
+
+    # Listeners are not notified of
+    # programmatic sync state changes
+    child1.unsyncFromParent('a')
+    child1.unsyncFromParent('a')
+    child2.syncToParent('b')
+    assert called == []
+    assert not child1.isSyncedToParent('a')
+    assert child2.b == 2
+    parent.a = 3
+    assert child1.a == 1 and child2.a == 3
+
+    with pytest.raises(RuntimeError):
+        child1.syncToParent('c')
+    with pytest.raises(RuntimeError):
+        child1.unsyncFromParent('d')
+
+    # Binding direction
+    child1.setBindingDirection(False, 'a')
+    assert     child1.getBindingDirection('b')
+    assert not child1.getBindingDirection('a')
+    child1.syncToParent('a')
+    assert parent.a == 1 and child2.a == 1
+
+    child1.removeSyncChangeListener('a', 'listener1')
+    child1.unsyncFromParent('a')
+
+    assert child1.anySyncedToParent()
+    assert not child1.allSyncedToParent()
+    assert child2.allSyncedToParent()
+
+    child2.detachFromParent('b')
+    assert not child2.canBeSyncedToParent('b')
+    assert called == []
+
+    child2.detachAllFromParent()
+    assert child2.getParent() is None
+    assert parent.getChildren() == [child1]
+    assert not child2.anySyncedToParent()
+
+
+def test_sync_state_notify():
+
+    class Thing(props.SyncableHasProperties):
+        _notifySyncChanges = True
+        a = props.Int()
+        b = props.Int()
+
+    parent = Thing()
+    child1 = Thing(parent=parent)
+    child2 = Thing(parent=parent, state={'b' : False})
+    called = []
+
+    def listener(value, valid, ctx, name):
+        called.append((value, ctx, name))
+
+    child1.addSyncChangeListener('a', 'listener1', listener)
+    child2.addSyncChangeListener('b', 'listener2', listener)
+
+    # Listeners are notified of
+    # sync state changes
+    child1.unsyncFromParent('a')
+    child1.unsyncFromParent('a')
+    child2.syncToParent('b')
+    assert called == [(False, child1, '_sync_a'),
+                      (True,  child2, '_sync_b')]
+
+    called[:] = []
+    child1.removeSyncChangeListener('a', 'listener1')
+    child1.syncToParent('a')
+    assert called == []
+
+    child2.detachFromParent('b')
+    assert called == [(False, child2, '_sync_b')]
+
+
+def test_sync_property():
+
+    class Thing(props.SyncableHasProperties):
+        a = props.Int()
+        b = props.Int()
+
+    parent = Thing()
+    child1 = Thing(parent=parent)
+    called = []
+
+    def listener(value, valid, ctx, name):
+        called.append((value, ctx, name))
+
+    with pytest.deprecated_call():
+        syncProp = Thing.getSyncProperty('a')
+    with pytest.deprecated_call():
+        assert Thing.getSyncPropertyName('a') == '_sync_a'
+
+    assert isinstance(syncProp, props.Boolean)
+    assert Thing.getAllProperties()[0] == ['a', 'b']
+
+    # Children created before and after
+    # the sync property was added
+    child2 = Thing(parent=parent, state=False)
+
+    assert     child1._sync_a
+    assert not child2._sync_a
+    assert not parent._sync_a
+
+    child1.addListener('_sync_a', 'listener', listener)
+    child2.addSyncChangeListener('a', 'listener', listener)
+
+    # Setting the sync property changes the
+    # sync state, and notifies listeners
+    child1._sync_a = False
+    child2._sync_a = True
+    assert not child1.isSyncedToParent('a')
+    assert     child2.isSyncedToParent('a')
+    assert called == [(False, child1, '_sync_a'),
+                      (True,  child2, '_sync_a')]
+
+    parent.a = 5
+    assert child1.a == 0 and child2.a == 5
+
+    # The sync property reflects, but does
+    # not notify of, programmatic changes
+    called[:] = []
+    child1.syncToParent('a')
+    child2.unsyncFromParent('a')
+    assert     child1._sync_a
+    assert not child2._sync_a
+    assert called == []
+    assert child1.a == 5
+
+    # The property can be bound to
+    # (e.g. by a widget)
+    class Toggle(props.HasProperties):
+        sync = props.Boolean(default=True)
+
+    toggle = Toggle()
+    toggle.bindProps('sync', child1, '_sync_a')
+    toggle.sync = False
+    assert not child1.isSyncedToParent('a')
+    toggle.sync = True
+    assert child1.isSyncedToParent('a')
+
+
+def test_bulk_sync():
+
+    class Thing(props.SyncableHasProperties):
+        _notifySyncChanges = True
+        a = props.Int()
+        b = props.Real(minval=0, maxval=10, clamped=True)
+        c = props.Int()
+
+    parent   = Thing()
+    children = [Thing(parent=parent, state=False, nounbind=['c'])
+                for i in range(5)]
+    called   = []
+    synced   = []
+
+    def listener(value, valid, ctx, name):
+        called.append((ctx, name))
+        synced.append(all([c.allSyncedToParent() for c in children]))
+
+    for i, child in enumerate(children):
+        child.a = i + 1
+        child.b = i + 1
+        child.addListener(    'a', 'listener{}'.format(i), listener)
+        child.addListener(    'b', 'listener{}'.format(i), listener)
+        child.addSyncChangeListener(
+            'a', 'synclistener{}'.format(i), listener)
+
+    parent.a = 10
+    parent.setAttribute('b', 'maxval', 20)
+    parent.b = 15
+
+    parent.syncChildren()
+
+    # One call for each changed property,
+    # and for each sync state change.
+    assert len(called) == 15
+
+    # Listeners are only called after
+    # all properties have been bound
+    assert all(synced)
+    for child in children:
+        assert (child, 'a')       in called
+        assert (child, 'b')       in called
+        assert (child, '_sync_a') in called
+        assert child.a == 10 and child.b == 15
+        assert child.getAttribute('b', 'maxval') == 20
+
+    called[:] = []
+    parent.unsyncChildren(['a'], children[:2])
+    assert [c.isSyncedToParent('a') for c in children] == [0, 0, 1, 1, 1]
+    assert sorted(called, key=lambda c: children.index(c[0])) == \
+        [(children[0], '_sync_a'), (children[1], '_sync_a')]
+
+    # nounbind properties are not unsynced
+    called[:] = []
+    children[0].unsyncAllFromParent()
+    assert not children[0].isSyncedToParent('a')
+    assert not children[0].isSyncedToParent('b')
+    assert     children[0].isSyncedToParent('c')
+    assert called == []
+
+    children[0].syncAllToParent()
+    assert children[0].allSyncedToParent()
+    assert called == [(children[0], '_sync_a')]
+
+    # Children synced with a child -> parent
+    # direction give the same result as if
+    # they were synced one at a time
+    parent.unsyncChildren()
+    for i, child in enumerate(children):
+        child.a = i + 1
+        child.setBindingDirection(i % 2 == 0)
+    parent.a = 10
+    parent.syncChildren(['a'])
+    assert [c.a for c in [parent] + children] == [4] * 6
+
+    with pytest.raises(RuntimeError):
+        children[0].syncChildren()
+    with pytest.raises(ValueError):
+        parent.syncChildren(children=[Thing()])
+
+
+def test_broadcast():
+
+    class Thing(props.SyncableHasProperties):
+        a = props.Int()
+        b = props.List(props.Int())
+
+    parent   = Thing()
+    children = [Thing(parent=parent) for i in range(5)]
+    called   = []
+
+    def listener(value, valid, ctx, name):
+        called.append((ctx, value))
+
+    for i, child in enumerate(children):
+        child.addListener('a', 'listener{}'.format(i), listener)
+
+    # Children are subscribed to the parent
+    for child in children:
+        assert child.getPropVal('a')._getPublisher() is parent.getPropVal('a')
+        assert child.getPropVal('b')._getPublisher() is None
+
+    parent.a = 5
+    parent.b = [1, 2]
+    assert [(c, 5) for c in children] == called
+    assert all([c.a == 5 and c.b == [1, 2] for c in children])
+
+    # Copy on unsync
+    called[:] = []
+    children[0].unsyncFromParent('a')
+    children[0].unsyncFromParent('b')
+    assert called == []
+    parent.a = 6
+    parent.b = [3, 4]
+    assert children[0].a == 5 and children[0].b == [1, 2]
+    assert all([c.a == 6 and c.b == [3, 4] for c in children[1:]])
+    assert (children[0], 6) not in called
+
+    children[1].a = 7
+    assert parent.a == 7
+    assert all([c.a == 7 for c in children[1:]])
+
+    children[0].setBindingDirection(False)
+    children[0].syncAllToParent()
+    assert all([c.a == 5 and c.b == [1, 2] for c in [parent] + children])
+
+
+def test_broadcast_parent_deleted():
+
+    def validate(instance, attributes, value):
+        return value <= instance.lim
+
+    class Thing(props.SyncableHasProperties):
+        a   = props.Int(validateFunc=validate, allowInvalid=False)
+        lim = 0
+
+        def __init__(self, lim, *args, **kwargs):
+            self.lim = lim
+            props.SyncableHasProperties.__init__(self, *args, **kwargs)
+
+    parent = Thing(10)
+    child1 = Thing(5,  parent=parent)
+    child2 = Thing(20, parent=parent)
+
+    # Values are validated by the
+    # child before being passed on
+    with pytest.raises(ValueError):
+        child1.a = 8
+    child2.a = 8
+    assert parent.a == 8 and child1.a == 8
+    assert child1.getPropVal('a')._getPublisher() is parent.getPropVal('a')
+
+    # Children keep the parent value
+    # when the parent is deleted
+    del parent
+    gc.collect()
+
+    assert child1.a == 8 and child2.a == 8
+    assert child1.getPropVal('a')._getPublisher() is None
+
+    child1.a = 3
+    child2.a = 15
+    assert child1.a == 3 and child2.a == 15
+    with pytest.raises(ValueError):
+        child1.a = 6
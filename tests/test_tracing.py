@@ -0,0 +1,53 @@
+#!/usr/bin/env python
+#
+# test_tracing.py -
+#
+# Author: Paul McCarthy <pauldmccarthy@gmail.com>
+#
+
+import logging
+
+import fsleyes_props         as props
+import fsleyes_props.tracing as tracing
+
+
+class Thing(props.HasProperties):
+    myint = props.Int()
+
+
+class Handler(logging.Handler):
+    def __init__(self):
+        logging.Handler.__init__(self)
+        self.records = []
+    def emit(self, record):
+        self.records.append(record)
+
+
+def test_tracing():
+
+    log     = logging.getLogger('fsleyes_props')
+    handler = Handler()
+    level   = log.level
+    state   = tracing.isEnabled()
+
+    log.addHandler(handler)
+    log.setLevel(logging.DEBUG)
+
+    try:
+        t = Thing()
+
+        tracing.disable()
+        assert not tracing.isEnabled()
+        t.myint = 1
+        assert len(handler.records) == 0
+
+        tracing.enable()
+        assert tracing.isEnabled()
+        t.myint = 2
+        assert len(handler.records) > 0
+
+    finally:
+        log.removeHandler(handler)
+        log.setLevel(level)
+        if state: tracing.enable()
+        else:     tracing.disable()